@@ -1,265 +1,212 @@
 """
 Collection of __init__.py files for the LoadTester project structure.
 Create these files in their respective directories.
-"""
-
-# backend/app/domain/__init__.py
-DOMAIN_INIT = """
-\"\"\"
-Domain Layer
-Business logic and entities for LoadTester
-\"\"\"
-"""
-
-# backend/app/domain/entities/__init__.py
-DOMAIN_ENTITIES_INIT = """
-\"\"\"
-Domain Entities
-Business entities and value objects
-\"\"\"
-
-from .test_scenario import (
-    API, AuthConfig, AuthType, DegradationDetectionResult, Endpoint, 
-    ExecutionStatus, Job, JobStatus, LoadTestConfiguration, TestExecution, 
-    TestResult, TestScenario
-)
-
-__all__ = [
-    'API', 'AuthConfig', 'AuthType', 'DegradationDetectionResult', 'Endpoint',
-    'ExecutionStatus', 'Job', 'JobStatus', 'LoadTestConfiguration', 'TestExecution',
-    'TestResult', 'TestScenario'
-]
-"""
-
-# backend/app/domain/interfaces/__init__.py
-DOMAIN_INTERFACES_INIT = """
-\"\"\"
-Domain Interfaces
-Abstract interfaces for services and repositories
-\"\"\"
-"""
-
-# backend/app/domain/services/__init__.py
-DOMAIN_SERVICES_INIT = """
-\"\"\"
-Domain Services
-Business logic services
-\"\"\"
-
-from .load_test_service import LoadTestService
-
-__all__ = ['LoadTestService']
-"""
-
-# backend/app/infrastructure/__init__.py
-INFRASTRUCTURE_INIT = """
-\"\"\"
-Infrastructure Layer
-External dependencies and data access
-\"\"\"
-"""
-
-# backend/app/infrastructure/database/__init__.py
-INFRASTRUCTURE_DATABASE_INIT = """
-\"\"\"
-Database Infrastructure
-Database connection and models
-\"\"\"
-
-from .connection import DatabaseManager, get_db_session, get_database_manager
-from .models import Base
-
-__all__ = ['DatabaseManager', 'get_db_session', 'get_database_manager', 'Base']
-"""
-
-# backend/app/infrastructure/repositories/__init__.py
-INFRASTRUCTURE_REPOSITORIES_INIT = """
-\"\"\"
-Repository Implementations
-SQLAlchemy implementations of repository interfaces
-\"\"\"
-
-from .api_repository import APIRepository
-from .endpoint_repository import EndpointRepository
-from .job_repository import JobRepository
-from .test_execution_repository import TestExecutionRepository
-from .test_result_repository import TestResultRepository
-from .test_scenario_repository import TestScenarioRepository
-
-__all__ = [
-    'APIRepository', 'EndpointRepository', 'JobRepository',
-    'TestExecutionRepository', 'TestResultRepository', 'TestScenarioRepository'
-]
-"""
-
-# backend/app/infrastructure/external/__init__.py
-INFRASTRUCTURE_EXTERNAL_INIT = """
-\"\"\"
-External Services
-AI services, K6 integration, and other external dependencies
-\"\"\"
-
-from .ai_client import MultiProviderAIClient, OpenAPIParserService
-from .k6_runner import K6RunnerService, K6ScriptGeneratorService
-from .pdf_generator import PDFGeneratorService, ReportGeneratorService
-
-__all__ = [
-    'MultiProviderAIClient', 'OpenAPIParserService',
-    'K6RunnerService', 'K6ScriptGeneratorService',
-    'PDFGeneratorService', 'ReportGeneratorService'
-]
-"""
-
-# backend/app/infrastructure/config/__init__.py
-INFRASTRUCTURE_CONFIG_INIT = """
-\"\"\"
-Configuration and Dependency Injection
-Application configuration and DI container
-\"\"\"
-
-from .container import Container
-from .dependencies import (
-    get_load_test_service, get_openapi_parser_service,
-    get_k6_runner_service, get_report_generator_service
-)
-
-__all__ = [
-    'Container', 'get_load_test_service', 'get_openapi_parser_service',
-    'get_k6_runner_service', 'get_report_generator_service'
-]
-"""
-
-# backend/app/presentation/__init__.py
-PRESENTATION_INIT = """
-\"\"\"
-Presentation Layer
-FastAPI endpoints and middleware
-\"\"\"
-"""
-
-# backend/app/presentation/api/__init__.py
-PRESENTATION_API_INIT = """
-\"\"\"
-API Layer
-REST API endpoints
-\"\"\"
-"""
-
-# backend/app/presentation/api/v1/__init__.py
-PRESENTATION_API_V1_INIT = """
-\"\"\"
-API Version 1
-LoadTester REST API v1
-\"\"\"
-
-from .router import api_router
-
-__all__ = ['api_router']
-"""
-
-# backend/app/presentation/api/v1/endpoints/__init__.py
-PRESENTATION_ENDPOINTS_INIT = """
-\"\"\"
-API Endpoints
-Individual endpoint modules
-\"\"\"
-"""
-
-# backend/app/presentation/middleware/__init__.py
-PRESENTATION_MIDDLEWARE_INIT = """
-\"\"\"
-Middleware
-HTTP middleware for logging, error handling, etc.
-\"\"\"
-
-from .error_handler import ErrorHandlerMiddleware
-from .logging import LoggingMiddleware
-
-__all__ = ['ErrorHandlerMiddleware', 'LoggingMiddleware']
-"""
-
-# backend/app/shared/__init__.py
-SHARED_INIT = """
-\"\"\"
-Shared Components
-Utilities, exceptions, and common components
-\"\"\"
-"""
-
-# backend/app/shared/exceptions/__init__.py
-SHARED_EXCEPTIONS_INIT = """
-\"\"\"
-Custom Exceptions
-Application-specific exception classes
-\"\"\"
-
-from .base import LoadTesterException
-from .domain import (
-    InvalidConfigurationError, LoadTestExecutionError, ResourceNotFoundError,
-    BusinessRuleViolationError, DegradationDetectedError, ValidationError
-)
-from .infrastructure import (
-    DatabaseError, NotFoundError, ExternalServiceError, AIServiceError,
-    FileOperationError, K6ExecutionError, ConfigurationError, ResourceLimitError
-)
-
-__all__ = [
-    'LoadTesterException', 'InvalidConfigurationError', 'LoadTestExecutionError',
-    'ResourceNotFoundError', 'BusinessRuleViolationError', 'DegradationDetectedError',
-    'ValidationError', 'DatabaseError', 'NotFoundError', 'ExternalServiceError',
-    'AIServiceError', 'FileOperationError', 'K6ExecutionError', 'ConfigurationError',
-    'ResourceLimitError'
-]
-"""
-
-# backend/app/shared/utils/__init__.py
-SHARED_UTILS_INIT = """
-\"\"\"
-Utility Functions
-Common utilities and helpers
-\"\"\"
-
-from .logger import setup_logging, get_logger
-
-__all__ = ['setup_logging', 'get_logger']
-"""
-
-# backend/app/shared/constants/__init__.py
-SHARED_CONSTANTS_INIT = """
-\"\"\"
-Application Constants
-Enums and constant values
-\"\"\"
-"""
-
-# backend/app/tests/__init__.py
-TESTS_INIT = """
-\"\"\"
-Test Suite
-Unit and integration tests for LoadTester
-\"\"\"
-"""
-
-# frontend/components/__init__.py
-FRONTEND_COMPONENTS_INIT = """
-\"\"\"
-Streamlit Components
-Reusable UI components for the LoadTester frontend
-\"\"\"
-
-from .openapi_parser import OpenAPIParserComponent
-from .endpoint_selector import EndpointSelectorComponent
-from .test_configurator import TestConfiguratorComponent
-from .results_viewer import ResultsViewerComponent
-
-__all__ = [
-    'OpenAPIParserComponent', 'EndpointSelectorComponent',
-    'TestConfiguratorComponent', 'ResultsViewerComponent'
-]
-"""
 
-# Print instructions for creating these files
-print("""
+Each file is described as data (docstring + exports per submodule) and its text
+is built on demand with render(path); importing this module generates nothing.
+"""
+
+import textwrap
+from typing import Dict, List, Tuple
+
+# package path -> (docstring, [(submodule, exported names)])
+INIT_FILES: Dict[str, Tuple[str, List[Tuple[str, List[str]]]]] = {
+    "backend/app/domain": (
+        "Domain Layer\nBusiness logic and entities for LoadTester",
+        [],
+    ),
+    "backend/app/domain/entities": (
+        "Domain Entities\nBusiness entities and value objects",
+        [("test_scenario", [
+            "API", "AuthConfig", "AuthType", "DegradationDetectionResult", "Endpoint",
+            "EndpointSpec", "ExecutionStatus", "Job", "JobStatus", "LoadTestConfiguration",
+            "TestExecution", "TestResult", "TestScenario",
+        ])],
+    ),
+    "backend/app/domain/interfaces": (
+        "Domain Interfaces\nAbstract interfaces for services and repositories",
+        [],
+    ),
+    "backend/app/domain/services": (
+        "Domain Services\nBusiness logic services",
+        [("load_test_service", ["LoadTestService"])],
+    ),
+    "backend/app/infrastructure": (
+        "Infrastructure Layer\nExternal dependencies and data access",
+        [],
+    ),
+    "backend/app/infrastructure/database": (
+        "Database Infrastructure\nDatabase connection and models",
+        [
+            ("connection", ["DatabaseManager", "get_db_session", "get_database_manager"]),
+            ("models", ["Base"]),
+        ],
+    ),
+    "backend/app/infrastructure/repositories": (
+        "Repository Implementations\nSQLAlchemy implementations of repository interfaces",
+        [
+            ("api_repository", ["APIRepository"]),
+            ("endpoint_repository", ["EndpointRepository"]),
+            ("job_repository", ["JobRepository"]),
+            ("test_execution_repository", ["TestExecutionRepository"]),
+            ("test_result_repository", ["TestResultRepository"]),
+            ("test_scenario_repository", ["TestScenarioRepository"]),
+        ],
+    ),
+    "backend/app/infrastructure/external": (
+        "External Services\nAI services, K6 integration, and other external dependencies",
+        [
+            ("ai_client", ["MultiProviderAIClient", "OpenAPIParserService"]),
+            ("k6_runner", ["K6RunnerService", "K6ScriptGeneratorService"]),
+            ("pdf_generator", ["PDFGeneratorService", "ReportGeneratorService"]),
+        ],
+    ),
+    "backend/app/infrastructure/config": (
+        "Configuration and Dependency Injection\nApplication configuration and DI container",
+        [
+            ("container", ["Container"]),
+            ("dependencies", [
+                "get_load_test_service", "get_openapi_parser_service",
+                "get_k6_runner_service", "get_report_generator_service",
+            ]),
+        ],
+    ),
+    "backend/app/presentation": (
+        "Presentation Layer\nFastAPI endpoints and middleware",
+        [],
+    ),
+    "backend/app/presentation/api": (
+        "API Layer\nREST API endpoints",
+        [],
+    ),
+    "backend/app/presentation/api/v1": (
+        "API Version 1\nLoadTester REST API v1",
+        [("router", ["api_router"])],
+    ),
+    "backend/app/presentation/api/v1/endpoints": (
+        "API Endpoints\nIndividual endpoint modules",
+        [],
+    ),
+    "backend/app/presentation/middleware": (
+        "Middleware\nHTTP middleware for logging, error handling, etc.",
+        [
+            ("error_handler", ["ErrorHandlerMiddleware"]),
+            ("logging", ["LoggingMiddleware"]),
+        ],
+    ),
+    "backend/app/shared": (
+        "Shared Components\nUtilities, exceptions, and common components",
+        [],
+    ),
+    "backend/app/shared/exceptions": (
+        "Custom Exceptions\nApplication-specific exception classes",
+        [
+            ("base", ["LoadTesterException"]),
+            ("domain", [
+                "InvalidConfigurationError", "LoadTestExecutionError", "ResourceNotFoundError",
+                "BusinessRuleViolationError", "DegradationDetectedError", "ValidationError",
+            ]),
+            ("infrastructure", [
+                "DatabaseError", "NotFoundError", "ExternalServiceError", "AIServiceError",
+                "FileOperationError", "K6ExecutionError", "ConfigurationError", "ResourceLimitError",
+            ]),
+        ],
+    ),
+    "backend/app/shared/utils": (
+        "Utility Functions\nCommon utilities and helpers",
+        [("logger", ["setup_logging", "get_logger"])],
+    ),
+    "backend/app/shared/constants": (
+        "Application Constants\nEnums and constant values",
+        [],
+    ),
+    "backend/app/tests": (
+        "Test Suite\nUnit and integration tests for LoadTester",
+        [],
+    ),
+    "frontend/components": (
+        "Streamlit Components\nReusable UI components for the LoadTester frontend",
+        [
+            ("openapi_parser", ["OpenAPIParserComponent"]),
+            ("endpoint_selector", ["EndpointSelectorComponent"]),
+            ("test_configurator", ["TestConfiguratorComponent"]),
+            ("results_viewer", ["ResultsViewerComponent"]),
+        ],
+    ),
+}
+
+# Packages whose exports are resolved on first access (PEP 562) instead of at import
+LAZY_INIT_FILES = frozenset({
+    "backend/app/domain/entities",
+    "backend/app/infrastructure/external",
+})
+
+_LAZY_ACCESSORS = '''
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        module_name, attribute = _LAZY[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+        # Cache on the package so later lookups never reach __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+'''
+
+
+def _wrap(names: List[str], quote: bool = False) -> str:
+    """Comma-join names, wrapped and indented for a parenthesized block."""
+    items = ", ".join(f"'{name}'" if quote else name for name in names)
+    return textwrap.fill(items, width=88, initial_indent="    ", subsequent_indent="    ")
+
+
+def _import_line(module: str, names: List[str], indent: str = "") -> str:
+    """Render one relative import, parenthesized when it does not fit on a line."""
+    line = f"{indent}from .{module} import {', '.join(names)}"
+    if len(line) <= 88:
+        return line
+    body = textwrap.indent(_wrap(names), indent)
+    return f"{indent}from .{module} import (\n{body}\n{indent})"
+
+
+def render(path: str) -> str:
+    """Build the __init__.py text for a package path listed in INIT_FILES."""
+    docstring, exports = INIT_FILES[path]
+    lazy = path in LAZY_INIT_FILES and exports
+    if lazy:
+        docstring += "\n\nNames are resolved on first access (PEP 562), so importing the package stays cheap."
+    text = f'"""\n{docstring}\n"""\n'
+
+    if not exports:
+        return text
+
+    names = [name for _, module_names in exports for name in module_names]
+
+    if lazy:
+        imports = "\n".join(_import_line(module, module_names, "    ") for module, module_names in exports)
+        lazy_map = "\n".join(
+            f"    '{name}': ('.{module}', '{name}'),"
+            for module, module_names in exports for name in module_names
+        )
+        return (
+            f"{text}\nfrom typing import TYPE_CHECKING\n\n"
+            f"if TYPE_CHECKING:\n{imports}\n\n"
+            f"# Exported name -> (submodule, attribute)\n_LAZY = {{\n{lazy_map}\n}}\n\n"
+            f"__all__ = list(_LAZY)\n{_LAZY_ACCESSORS}"
+        )
+
+    imports = "\n".join(_import_line(module, module_names) for module, module_names in exports)
+    return f"{text}\n{imports}\n\n__all__ = [\n{_wrap(names, quote=True)}\n]\n"
+
+
+if __name__ == "__main__":
+    # Print instructions for creating these files
+    print("""
 To create the __init__.py files, run these commands in your project root:
 
 # Backend init files
@@ -274,5 +221,5 @@ mkdir -p backend/app/tests/unit backend/app/tests/integration
 mkdir -p frontend/components
 
 # Create all __init__.py files with appropriate content
-# (Use the content from the variables above)
-""")
\ No newline at end of file
+# (Use render(path) from this module for each path in INIT_FILES)
+""")
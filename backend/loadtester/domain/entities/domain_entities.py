@@ -3,14 +3,38 @@ Domain Entities for LoadTester
 Business logic entities independent of infrastructure
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
-from uuid import UUID, uuid4
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Shared default for nested collections: most instances never populate them, so they
+# share one empty tuple and get a real list only when something is added
+_EMPTY: Tuple = ()
+
+# Job state transitions stamp naive UTC datetimes; the clock is bound on first use so
+# importing the entities does not pull in datetime
+_utcnow_impl: Optional[Callable[[], datetime]] = None
 
 
-class JobStatus(Enum):
+def _utcnow() -> datetime:
+    """Current naive UTC time."""
+    global _utcnow_impl
+    if _utcnow_impl is None:
+        from datetime import datetime
+        _utcnow_impl = datetime.utcnow
+    return _utcnow_impl()
+
+
+# Status and auth enums mix in str: members compare and hash as their string value
+# (JobStatus.RUNNING == "RUNNING") through str's C-level __eq__, and .value is still
+# what gets persisted and serialized.
+class JobStatus(str, Enum):
     """Job status enumeration."""
     PENDING = "PENDING"
     RUNNING = "RUNNING" 
@@ -18,7 +42,7 @@ class JobStatus(Enum):
     FAILED = "FAILED"
 
 
-class ExecutionStatus(Enum):
+class ExecutionStatus(str, Enum):
     """Test execution status enumeration."""
     PENDING = "PENDING"
     RUNNING = "RUNNING"
@@ -26,14 +50,14 @@ class ExecutionStatus(Enum):
     FAILED = "FAILED"
 
 
-class AuthType(Enum):
+class AuthType(str, Enum):
     """Authentication type enumeration."""
     BEARER_TOKEN = "bearer_token"
     API_KEY = "api_key"
     NONE = "none"
 
 
-@dataclass
+@dataclass(slots=True)
 class API:
     """API domain entity."""
     api_id: Optional[int] = None
@@ -43,10 +67,10 @@ class API:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     active: bool = True
-    endpoints: List["Endpoint"] = field(default_factory=list)
+    endpoints: Sequence[Endpoint] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthConfig:
     """Authentication configuration."""
     auth_type: AuthType
@@ -56,7 +80,7 @@ class AuthConfig:
     query_param_name: Optional[str] = None  # For API key in query
 
 
-@dataclass
+@dataclass(slots=True)
 class Endpoint:
     """Endpoint domain entity."""
     endpoint_id: Optional[int] = None
@@ -75,11 +99,11 @@ class Endpoint:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     active: bool = True
-    api: Optional["API"] = None  # Optional reference to parent API
-    test_scenarios: List["TestScenario"] = field(default_factory=list)
+    api: Optional[API] = None  # Optional reference to parent API
+    test_scenarios: Sequence[TestScenario] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True)
 class TestScenario:
     """Test scenario domain entity."""
     scenario_id: Optional[int] = None
@@ -96,14 +120,15 @@ class TestScenario:
     created_at: Optional[datetime] = None
     created_by: str = "system"
     active: bool = True
-    test_executions: List["TestExecution"] = field(default_factory=list)
+    test_executions: Sequence[TestExecution] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True)
 class TestExecution:
     """Test execution domain entity."""
     execution_id: Optional[int] = None
     scenario_id: Optional[int] = None
+    job_id: Optional[str] = None
     execution_name: str = ""
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
@@ -112,10 +137,10 @@ class TestExecution:
     k6_script_used: Optional[str] = None
     execution_logs: Optional[str] = None
     executed_by: str = "system"
-    test_result: Optional["TestResult"] = None
+    test_result: Optional[TestResult] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorDetail:
     """Error detail domain entity."""
     error_id: Optional[int] = None
@@ -127,7 +152,7 @@ class ErrorDetail:
     error_percentage: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
     """Performance metric domain entity."""
     metric_id: Optional[int] = None
@@ -139,7 +164,7 @@ class PerformanceMetric:
     timestamp_collected: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Test result domain entity."""
     result_id: Optional[int] = None
@@ -163,28 +188,46 @@ class TestResult:
     timeout_errors: int = 0
     connection_errors: int = 0
     error_summary: Optional[str] = None
-    error_details: List[ErrorDetail] = field(default_factory=list)
-    performance_metrics: List[PerformanceMetric] = field(default_factory=list)
+    error_details: Sequence[ErrorDetail] = _EMPTY
+    performance_metrics: Sequence[PerformanceMetric] = _EMPTY
+    # Memoized error_rate_percent; request totals are fixed once a result is built
+    _error_rate: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
+    def add_error_detail(self, error_detail: ErrorDetail) -> None:
+        """Append an error detail, replacing the shared empty default with a list."""
+        if self.error_details is _EMPTY:
+            self.error_details = []
+        self.error_details.append(error_detail)
+    
+    def add_performance_metric(self, metric: PerformanceMetric) -> None:
+        """Append a performance metric, replacing the shared empty default with a list."""
+        if self.performance_metrics is _EMPTY:
+            self.performance_metrics = []
+        self.performance_metrics.append(metric)
     
     @property
     def has_degradation(self) -> bool:
         """Check if results show degradation based on error rate."""
-        if self.success_rate_percent is None:
-            return True
-        return self.success_rate_percent < 50.0  # 50% success rate threshold
+        success_rate = self.success_rate_percent
+        return success_rate is None or success_rate < 50.0  # 50% success rate threshold
     
     @property
     def error_rate_percent(self) -> float:
         """Calculate error rate percentage."""
-        if self.total_requests and self.total_requests > 0:
-            return (self.failed_requests or 0) / self.total_requests * 100
-        return 0.0
+        error_rate = self._error_rate
+        if error_rate is None:
+            if self.total_requests and self.total_requests > 0:
+                error_rate = (self.failed_requests or 0) / self.total_requests * 100
+            else:
+                error_rate = 0.0
+            self._error_rate = error_rate
+        return error_rate
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Job domain entity for tracking long-running operations."""
-    job_id: str = field(default_factory=lambda: str(uuid4()))
+    job_id: Optional[str] = None  # assigned by Job.new(); loaded jobs carry their stored ID
     job_type: str = ""
     status: JobStatus = JobStatus.PENDING
     progress_percentage: float = 0.0
@@ -197,16 +240,23 @@ class Job:
     finished_at: Optional[datetime] = None
     created_by: str = "system"
     
+    @classmethod
+    def new(cls, **kwargs) -> Job:
+        """Create a new job with a freshly generated ID."""
+        from uuid import uuid4
+        # 32-char hex form: same randomness, no hyphen formatting
+        return cls(job_id=uuid4().hex, **kwargs)
+    
     def start(self) -> None:
         """Mark job as started."""
         self.status = JobStatus.RUNNING
-        self.started_at = datetime.utcnow()
+        self.started_at = _utcnow()
     
     def finish(self, result_data: Optional[Dict] = None) -> None:
         """Mark job as finished."""
         self.status = JobStatus.FINISHED
         self.progress_percentage = 100.0
-        self.finished_at = datetime.utcnow()
+        self.finished_at = _utcnow()
         if result_data:
             self.result_data = result_data
     
@@ -214,18 +264,45 @@ class Job:
         """Mark job as failed."""
         self.status = JobStatus.FAILED
         self.error_message = error_message
-        self.finished_at = datetime.utcnow()
+        self.finished_at = _utcnow()
     
     def update_progress(self, percentage: float) -> None:
         """Update job progress."""
-        self.progress_percentage = max(0.0, min(100.0, percentage))
+        # In-range values (the common case) cost one chained comparison, no min/max calls
+        self.progress_percentage = (
+            percentage if 0.0 <= percentage <= 100.0 else (100.0 if percentage > 100.0 else 0.0)
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class EndpointSpec:
+    """Configuration for one endpoint selected for load testing."""
+    path: str
+    method: str
+    expected_volumetry: int
+    expected_concurrent_users: int
+    timeout_ms: Optional[int] = 30000
+    auth: Optional[AuthConfig] = None
+    use_mock_data: bool = True
+    data_file: Optional[str] = None
+
+
+# EndpointSpec fields validate() requires to be set, fetched in one C-level call
+_REQUIRED_ENDPOINT_FIELDS = ("method", "path", "expected_volumetry", "expected_concurrent_users")
+_get_required_endpoint_fields = attrgetter(*_REQUIRED_ENDPOINT_FIELDS)
+
+# Bound str.format templates for validate() error messages (1-based endpoint number)
+_ERR_METHOD = "Endpoint {}: HTTP method is required".format
+_ERR_PATH = "Endpoint {}: Path is required".format
+_ERR_VOLUMETRY = "Endpoint {}: Expected volumetry is required".format
+_ERR_CONCURRENT_USERS = "Endpoint {}: Expected concurrent users is required".format
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadTestConfiguration:
     """Load test configuration domain entity."""
     api_spec: str  # OpenAPI specification (JSON/YAML string)
-    selected_endpoints: List[Dict]  # Selected endpoints with configurations
+    selected_endpoints: List[EndpointSpec]  # Selected endpoints with configurations
     global_auth: Optional[AuthConfig] = None
     callback_url: Optional[str] = None
     test_name: Optional[str] = None
@@ -241,20 +318,23 @@ class LoadTestConfiguration:
         if not self.selected_endpoints:
             errors.append("At least one endpoint must be selected")
         
-        for i, endpoint in enumerate(self.selected_endpoints):
-            if not endpoint.get("method"):
-                errors.append(f"Endpoint {i+1}: HTTP method is required")
-            if not endpoint.get("path"):
-                errors.append(f"Endpoint {i+1}: Path is required")
-            if not endpoint.get("expected_volumetry"):
-                errors.append(f"Endpoint {i+1}: Expected volumetry is required")
-            if not endpoint.get("expected_concurrent_users"):
-                errors.append(f"Endpoint {i+1}: Expected concurrent users is required")
+        for number, endpoint in enumerate(self.selected_endpoints, 1):
+            # Fast path: every required field set; only failures get per-field messages
+            if all(_get_required_endpoint_fields(endpoint)):
+                continue
+            if not endpoint.method:
+                errors.append(_ERR_METHOD(number))
+            if not endpoint.path:
+                errors.append(_ERR_PATH(number))
+            if not endpoint.expected_volumetry:
+                errors.append(_ERR_VOLUMETRY(number))
+            if not endpoint.expected_concurrent_users:
+                errors.append(_ERR_CONCURRENT_USERS(number))
         
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class DegradationDetectionResult:
     """Result of degradation detection analysis."""
     has_degradation: bool
@@ -263,4 +343,4 @@ class DegradationDetectionResult:
     degraded_metrics: Optional[Dict] = None
     degradation_type: Optional[str] = None  # "response_time", "error_rate", "mixed"
     degradation_severity: Optional[str] = None  # "mild", "moderate", "severe"
-    recommendations: List[str] = field(default_factory=list)
\ No newline at end of file
+    recommendations: Sequence[str] = _EMPTY
\ No newline at end of file
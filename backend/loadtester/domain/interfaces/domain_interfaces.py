@@ -4,7 +4,7 @@ Domain layer interfaces for data access abstraction
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncContextManager, AsyncIterator, Dict, List, Optional
 
 from loadtester.domain.entities.domain_entities import (
     API, Endpoint, Job, TestExecution, TestResult, TestScenario
@@ -34,6 +34,11 @@ class APIRepositoryInterface(ABC):
         """Get all APIs."""
         pass
     
+    @abstractmethod
+    def iter_all(self) -> AsyncIterator[API]:
+        """Stream all APIs without materializing the full list."""
+        pass
+    
     @abstractmethod
     async def update(self, api: API) -> API:
         """Update API."""
@@ -53,11 +58,21 @@ class EndpointRepositoryInterface(ABC):
         """Create a new endpoint."""
         pass
     
+    @abstractmethod
+    async def create_many(self, endpoints: List[Endpoint]) -> List[Endpoint]:
+        """Create several endpoints in one batch."""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, endpoint_id: int) -> Optional[Endpoint]:
         """Get endpoint by ID."""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, endpoint_ids: List[int]) -> Dict[int, Endpoint]:
+        """Get several endpoints by ID, keyed by endpoint ID."""
+        pass
+    
     @abstractmethod
     async def get_by_api_id(self, api_id: int) -> List[Endpoint]:
         """Get all endpoints for an API."""
@@ -87,11 +102,21 @@ class TestScenarioRepositoryInterface(ABC):
         """Create a new test scenario."""
         pass
     
+    @abstractmethod
+    async def create_many(self, scenarios: List[TestScenario]) -> List[TestScenario]:
+        """Create several test scenarios in one batch."""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, scenario_id: int) -> Optional[TestScenario]:
         """Get test scenario by ID."""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, scenario_ids: List[int]) -> Dict[int, TestScenario]:
+        """Get several test scenarios by ID, keyed by scenario ID."""
+        pass
+    
     @abstractmethod
     async def get_by_endpoint_id(self, endpoint_id: int) -> List[TestScenario]:
         """Get all scenarios for an endpoint."""
@@ -126,11 +151,21 @@ class TestExecutionRepositoryInterface(ABC):
         """Get test execution by ID."""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, execution_ids: List[int]) -> Dict[int, TestExecution]:
+        """Get several test executions by ID, keyed by execution ID."""
+        pass
+    
     @abstractmethod
     async def get_by_scenario_id(self, scenario_id: int) -> List[TestExecution]:
         """Get all executions for a scenario."""
         pass
     
+    @abstractmethod
+    def iter_by_scenario_id(self, scenario_id: int) -> AsyncIterator[TestExecution]:
+        """Stream executions for a scenario without materializing the full list."""
+        pass
+    
     @abstractmethod
     async def get_by_job_id(self, job_id: str) -> List[TestExecution]:
         """Get all executions for a job."""
@@ -141,6 +176,11 @@ class TestExecutionRepositoryInterface(ABC):
         """Get all currently running executions."""
         pass
     
+    @abstractmethod
+    def iter_running_executions(self) -> AsyncIterator[TestExecution]:
+        """Stream running executions without materializing the full list."""
+        pass
+    
     @abstractmethod
     async def update(self, execution: TestExecution) -> TestExecution:
         """Update test execution."""
@@ -165,6 +205,11 @@ class TestResultRepositoryInterface(ABC):
         """Get test result by ID."""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, result_ids: List[int]) -> Dict[int, TestResult]:
+        """Get several test results by ID, keyed by result ID."""
+        pass
+    
     @abstractmethod
     async def get_by_execution_id(self, execution_id: int) -> Optional[TestResult]:
         """Get test result by execution ID."""
@@ -175,6 +220,11 @@ class TestResultRepositoryInterface(ABC):
         """Get all results for a job."""
         pass
     
+    @abstractmethod
+    async def count_by_classification(self, result_ids: List[int]) -> Dict[str, int]:
+        """Count results per performance classification."""
+        pass
+    
     @abstractmethod
     async def update(self, result: TestResult) -> TestResult:
         """Update test result."""
@@ -204,16 +254,41 @@ class JobRepositoryInterface(ABC):
         """Get all pending jobs."""
         pass
     
+    @abstractmethod
+    def iter_pending_jobs(self) -> AsyncIterator[Job]:
+        """Stream pending jobs without materializing the full list."""
+        pass
+    
+    @abstractmethod
+    async def count_pending(self) -> int:
+        """Count pending jobs without loading them."""
+        pass
+    
+    @abstractmethod
+    async def next_pending_id(self) -> Optional[str]:
+        """Get the ID of the oldest pending job."""
+        pass
+    
     @abstractmethod
     async def get_running_jobs(self) -> List[Job]:
         """Get all running jobs."""
         pass
     
+    @abstractmethod
+    async def count_running(self) -> int:
+        """Count running jobs without loading them."""
+        pass
+    
     @abstractmethod
     async def get_jobs_by_type(self, job_type: str) -> List[Job]:
         """Get jobs by type."""
         pass
     
+    @abstractmethod
+    def iter_jobs_by_type(self, job_type: str) -> AsyncIterator[Job]:
+        """Stream jobs by type without materializing the full list."""
+        pass
+    
     @abstractmethod
     async def update(self, job: Job) -> Job:
         """Update job."""
@@ -227,4 +302,13 @@ class JobRepositoryInterface(ABC):
     @abstractmethod
     async def cleanup_old_jobs(self, days: int = 7) -> int:
         """Clean up old completed jobs and return count of deleted jobs."""
-        pass
\ No newline at end of file
+        pass
+
+
+class UnitOfWorkInterface(ABC):
+    """Interface for grouping repository writes into one transaction."""
+    
+    @abstractmethod
+    def begin(self) -> AsyncContextManager[None]:
+        """Open a unit of work; writes made inside it are committed together on exit."""
+        pass
@@ -3,16 +3,21 @@ Load Test Service - Core Business Logic
 Main orchestrator for load testing operations
 """
 
-import json
+import asyncio
+import csv
 import logging
+import os
+import time
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Dict, List, Optional
-from uuid import uuid4
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 from loadtester.domain.entities.domain_entities import (
-    API, AuthConfig, DegradationDetectionResult, Endpoint, ExecutionStatus,
-    Job, JobStatus, LoadTestConfiguration, TestExecution, TestResult,
-    TestScenario
+    API, AuthConfig, DegradationDetectionResult, Endpoint, EndpointSpec,
+    ExecutionStatus, Job, JobStatus, LoadTestConfiguration, TestExecution,
+    TestResult, TestScenario
 )
 from loadtester.domain.interfaces.service_interfaces import (
     K6RunnerServiceInterface, K6ScriptGeneratorServiceInterface,
@@ -22,7 +27,8 @@ from loadtester.domain.interfaces.service_interfaces import (
 from loadtester.domain.interfaces.domain_interfaces import (
     APIRepositoryInterface, EndpointRepositoryInterface,
     JobRepositoryInterface, TestExecutionRepositoryInterface,
-    TestResultRepositoryInterface, TestScenarioRepositoryInterface
+    TestResultRepositoryInterface, TestScenarioRepositoryInterface,
+    UnitOfWorkInterface
 )
 from loadtester.shared.exceptions.domain_exceptions import (
     InvalidConfigurationError, LoadTestExecutionError,
@@ -31,6 +37,29 @@ from loadtester.shared.exceptions.domain_exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Endpoint schemas resolved concurrently while parsing a spec (the parser may call an AI service)
+_SCHEMA_FETCH_CONCURRENCY = 8
+
+# Recent non-terminal get_job_status snapshots for polling clients: job_id -> (fetched_at, status).
+# Module level because the service itself is built per request.
+_STATUS_CACHE: Dict[str, Tuple[float, Dict]] = {}
+_STATUS_CACHE_MAX_ENTRIES = 1024
+
+# Custom test data files that _load_test_data_file can read
+_DATA_FILE_EXTENSIONS = (".json", ".csv")
+
+
+def _read_test_data_file(file_path: str) -> List[Dict]:
+    """Read test data records from a JSON or CSV file (runs in a worker thread)."""
+    if file_path.lower().endswith(".json"):
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
+        # A single JSON object is one record
+        return data if isinstance(data, list) else [data]
+    
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        return list(csv.DictReader(f))
+
 
 class LoadTestService:
     """Core service for load testing operations."""
@@ -49,6 +78,7 @@ class LoadTestService:
         k6_runner: K6RunnerServiceInterface,
         report_generator: ReportGeneratorServiceInterface,
         degradation_settings: Dict,
+        unit_of_work: Optional[UnitOfWorkInterface] = None,
     ):
         self.api_repository = api_repository
         self.endpoint_repository = endpoint_repository
@@ -62,48 +92,79 @@ class LoadTestService:
         self.k6_runner = k6_runner
         self.report_generator = report_generator
         self.degradation_settings = degradation_settings
+        # Phases that only write rows commit once through the unit of work (if any)
+        self._unit_of_work = unit_of_work.begin if unit_of_work else nullcontext
+        # Settings read once; the required thresholds fail here rather than mid-run
+        self._stop_error_threshold = float(degradation_settings["stop_error_threshold"])
+        self._degradation_multiplier = float(degradation_settings["degradation_response_time_multiplier"])
+        self._max_concurrent_jobs = int(degradation_settings.get("max_concurrent_jobs", 1))
+        self._max_queued_jobs = int(degradation_settings.get("max_queued_jobs", 0))
+        self._max_scenario_concurrency = int(degradation_settings.get("max_scenario_concurrency", 1))
+        self._default_duration = int(degradation_settings.get("default_test_duration", 60))
+        # Degradation thresholds: the error rate one is fixed, the response time one
+        # is set from the baseline of each run in _execute_test_scenarios
+        self._error_threshold_pct = self._stop_error_threshold * 100.0
+        self._rt_threshold: Optional[float] = None
+        # Repositories share one AsyncSession, which allows a single operation at a
+        # time; concurrent scenario workers take this lock around their DB work
+        self._session_lock = asyncio.Lock()
+        # Progress writes are coalesced: at most one per interval, the latest value wins
+        self._progress_flush_interval = (
+            float(degradation_settings.get("progress_flush_interval_ms", 500)) / 1000.0
+        )
+        self._last_progress_flush = float("-inf")
+        # Parsed data files keyed by (path, mtime), so an edited file is read again
+        self._data_file_cache: Dict[Tuple[str, int], List[Dict]] = {}
         
     async def create_load_test_job(self, config: LoadTestConfiguration) -> Job:
         """Create a new load test job."""
         logger.info("Creating new load test job")
         
         # Validate configuration
-        errors = config.validate()
+        errors = config.validate() + self._validate_data_files(config)
         if errors:
             raise InvalidConfigurationError(f"Configuration errors: {', '.join(errors)}")
         
-        # Check if we can run concurrent jobs
-        running_jobs = await self.job_repository.get_running_jobs()
-        max_concurrent = self.degradation_settings.get("max_concurrent_jobs", 1)
+        # Admit the job only if a worker or a queue slot is free: running jobs are
+        # bounded by the worker pool, so pending ones must count against capacity too
+        running_count = await self.job_repository.count_running()
+        pending_count = await self.job_repository.count_pending()
+        capacity = self._max_concurrent_jobs + self._max_queued_jobs
         
-        if len(running_jobs) >= max_concurrent:
+        if running_count + pending_count >= capacity:
             raise LoadTestExecutionError(
-                f"Maximum concurrent jobs ({max_concurrent}) reached. "
-                f"Currently running: {len(running_jobs)}"
+                f"Maximum active jobs ({capacity}) reached. "
+                f"Currently running: {running_count}, pending: {pending_count}"
             )
         
         # Create job
-        job = Job(
-            job_id=str(uuid4()),
+        job = Job.new(
             job_type="load_test",
             status=JobStatus.PENDING,
             callback_url=config.callback_url,
-            created_at=datetime.utcnow(),
         )
         
-        await self.job_repository.create(job)
-        logger.info(f"Created job {job.job_id}")
+        job = await self.job_repository.create(job)
+        logger.info("Created job %s", job.job_id)
         
         return job
     
-    async def execute_load_test(self, job_id: str, config: LoadTestConfiguration) -> None:
-        """Execute load test asynchronously."""
-        logger.info(f"Starting load test execution for job {job_id}")
+    async def execute_load_test(
+        self, job_id: str, config: LoadTestConfiguration, job: Optional[Job] = None
+    ) -> None:
+        """Execute load test asynchronously.
+
+        Callers that have just read the job (e.g. the job queue, when it takes the job
+        off the queue) pass it in; otherwise it is loaded by ID.
+        """
+        logger.info("Starting load test execution for job %s", job_id)
         
-        job = await self.job_repository.get_by_id(job_id)
+        if job is None:
+            job = await self.job_repository.get_by_id(job_id)
         if not job:
             raise ResourceNotFoundError(f"Job {job_id} not found")
         
+        finalized = False
         try:
             # Mark job as started
             job.start()
@@ -123,37 +184,61 @@ class LoadTestService:
             
             # Phase 3: Execute scenarios (20% - 80% progress)
             await self._update_job_progress(job, 25.0, "Starting test execution")
-            results = await self._execute_test_scenarios(job, scenarios)
+            # Endpoints were just created; scenarios read them from here instead of the DB
+            endpoint_cache: Dict[int, Endpoint] = {ep.endpoint_id: ep for ep in endpoints}
+            results = await self._execute_test_scenarios(job, scenarios, endpoint_cache)
+            endpoint_cache.clear()
+            
+            # Only the count is needed from here on; release the scenarios (and the
+            # test data they hold) and endpoints before the memory-heavy report phase
+            total_scenarios = len(scenarios)
+            del scenarios, endpoints
             
             await self._update_job_progress(job, 80.0, "Test execution completed")
             
             # Phase 4: Generate report (80% - 95% progress)
             await self._update_job_progress(job, 85.0, "Generating report")
             report_path = await self._generate_final_report(job, results)
+            total_results = len(results)
+            del results
             
             await self._update_job_progress(job, 95.0, "Report generated")
             
-            # Phase 5: Finalize (95% - 100% progress)
+            # Phase 5: Finalize (95% - 100% progress); finish() sets progress to 100%
             job.finish({
                 "report_path": report_path,
-                "total_scenarios": len(scenarios),
-                "total_results": len(results),
+                "total_scenarios": total_scenarios,
+                "total_results": total_results,
                 "api_id": api.api_id,
             })
-            
-            await self.job_repository.update(job)
-            await self._update_job_progress(job, 100.0, "Load test completed")
-            
-            logger.info(f"Load test job {job_id} completed successfully")
+            finalized = True
             
         except Exception as e:
-            logger.error(f"Load test job {job_id} failed: {str(e)}")
+            logger.error("Load test job %s failed: %s", job_id, e)
             job.fail(str(e))
-            await self.job_repository.update(job)
+            finalized = True
             raise
+        
+        finally:
+            # Single terminal write for both outcomes; a cancelled task leaves the job as is
+            if finalized:
+                await self.job_repository.update(job)
+                _STATUS_CACHE.pop(job.job_id, None)
+        
+        logger.info("Load test job %s completed successfully", job_id)
     
-    async def get_job_status(self, job_id: str) -> Dict:
-        """Get job status and progress."""
+    async def get_job_status(self, job_id: str, ttl_ms: int = 0) -> Dict:
+        """Get job status and progress.
+
+        With ttl_ms > 0 a snapshot younger than ttl_ms is returned without a query.
+        Finished and failed jobs are never cached, and the writes that finish, fail or
+        cancel a job evict its snapshot, so terminal states show up at once.
+        """
+        if ttl_ms > 0:
+            cached = _STATUS_CACHE.get(job_id)
+            if cached and time.monotonic() - cached[0] < ttl_ms / 1000.0:
+                return dict(cached[1])
+        
         job = await self.job_repository.get_by_id(job_id)
         if not job:
             raise ResourceNotFoundError(f"Job {job_id} not found")
@@ -174,6 +259,14 @@ class LoadTestService:
         if job.status == JobStatus.FAILED:
             status_response["error_message"] = job.error_message
         
+        if job.status in (JobStatus.FINISHED, JobStatus.FAILED):
+            _STATUS_CACHE.pop(job_id, None)
+        elif ttl_ms > 0:
+            if len(_STATUS_CACHE) >= _STATUS_CACHE_MAX_ENTRIES:
+                _STATUS_CACHE.clear()
+            # Stamped after the query so the TTL counts from when the data was read
+            _STATUS_CACHE[job_id] = (time.monotonic(), dict(status_response))
+        
         return status_response
     
     async def _parse_and_create_api(self, config: LoadTestConfiguration) -> tuple[API, List[Endpoint]]:
@@ -188,52 +281,72 @@ class LoadTestService:
         parsed_spec = await self.openapi_parser.parse_openapi_spec(config.api_spec)
         available_endpoints = await self.openapi_parser.extract_endpoints(parsed_spec)
         
+        # Match selected endpoints first, then fetch their schemas concurrently
+        selected_map = self._selected_endpoint_map(config)
+        matched = []
+        for available_ep in available_endpoints:
+            path = available_ep["path"]
+            method = available_ep["method"].upper()
+            selected_config = selected_map.get((path, method))
+            if selected_config is not None:
+                matched.append((available_ep, path, method, selected_config))
+        
+        semaphore = asyncio.Semaphore(_SCHEMA_FETCH_CONCURRENCY)
+        
+        async def fetch_schema(path: str, method: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self.openapi_parser.get_endpoint_schema(parsed_spec, path, method)
+        
+        schemas = await asyncio.gather(
+            *(fetch_schema(path, method) for _, path, method, _ in matched)
+        )
+        
+        # One timestamp for the API and all of its endpoints
+        now = datetime.utcnow()
+        
         # Create API entity
         api = API(
             api_name=parsed_spec.get("info", {}).get("title", "Untitled API"),
             base_url=self._extract_base_url(parsed_spec),
             description=parsed_spec.get("info", {}).get("description"),
-            created_at=datetime.utcnow(),
+            created_at=now,
         )
         
-        api = await self.api_repository.create(api)
-        
-        # Create endpoint entities for selected endpoints
-        endpoints = []
-        selected_map = {(ep["path"], ep["method"]): ep for ep in config.selected_endpoints}
-        
-        for available_ep in available_endpoints:
-            path = available_ep["path"]
-            method = available_ep["method"].upper()
+        # Writes only start once every schema is fetched, so the unit of work's
+        # transaction is not held open across parser/AI calls
+        async with self._unit_of_work():
+            api = await self.api_repository.create(api)
             
-            if (path, method) in selected_map:
-                selected_config = selected_map[(path, method)]
-                
-                # Get endpoint schema
-                schema = await self.openapi_parser.get_endpoint_schema(
-                    parsed_spec, path, method
-                )
-
+            # Create endpoint entities for selected endpoints
+            endpoints = []
+            for (available_ep, path, method, selected_config), schema in zip(matched, schemas):
                 endpoint = Endpoint(
                     api_id=api.api_id,
                     endpoint_name=f"{method} {path}",
                     http_method=method,
                     endpoint_path=path,
                     description=available_ep.get("description"),
-                    expected_volumetry=selected_config.get("expected_volumetry"),
-                    expected_concurrent_users=selected_config.get("expected_concurrent_users"),
+                    expected_volumetry=selected_config.expected_volumetry,
+                    expected_concurrent_users=selected_config.expected_concurrent_users,
                     auth_config=self._create_auth_config(selected_config, config.global_auth),
-                    timeout_ms=selected_config.get("timeout_ms", 30000),
+                    timeout_ms=selected_config.timeout_ms,
                     schema=schema,  # Store the schema for mock data generation
-                    created_at=datetime.utcnow(),
+                    created_at=now,
                 )
                 
-                endpoint = await self.endpoint_repository.create(endpoint)
                 endpoints.append(endpoint)
+            
+            # Persist all selected endpoints in one batch
+            endpoints = await self.endpoint_repository.create_many(endpoints)
         
-        logger.info(f"Created API with {len(endpoints)} endpoints")
+        logger.info("Created API with %s endpoints", len(endpoints))
         return api, endpoints
     
+    @staticmethod
+    def _selected_endpoint_map(config: LoadTestConfiguration) -> Dict[Tuple[str, str], EndpointSpec]:
+        """Index selected endpoints by (path, METHOD); methods are upper-cased like the parsed spec's."""
+        return {(ep.path, ep.method.upper()): ep for ep in config.selected_endpoints}
+    
     async def _generate_test_scenarios(
         self, 
         endpoints: List[Endpoint], 
@@ -243,16 +356,23 @@ class LoadTestService:
         logger.info("Generating test scenarios")
         
         scenarios = []
+        selected_map = self._selected_endpoint_map(config)
         
+        # Generate mock data first (one list, shared by all of the endpoint's scenarios):
+        # it may call the AI client, which must not run inside the unit of work
+        endpoint_data = []
         for endpoint in endpoints:
-            # Generate mock data if needed
-            test_data = await self._generate_or_load_test_data(endpoint, config)
-            
-            # Create scenarios with incremental load
-            endpoint_scenarios = await self._create_incremental_scenarios(endpoint, test_data)
-            scenarios.extend(endpoint_scenarios)
+            selected_config = selected_map.get((endpoint.endpoint_path, endpoint.http_method))
+            test_data = await self._generate_or_load_test_data(endpoint, selected_config)
+            endpoint_data.append((endpoint, test_data))
         
-        logger.info(f"Generated {len(scenarios)} total scenarios")
+        async with self._unit_of_work():
+            for endpoint, test_data in endpoint_data:
+                # Create scenarios with incremental load
+                endpoint_scenarios = await self._create_incremental_scenarios(endpoint, test_data)
+                scenarios.extend(endpoint_scenarios)
+        
+        logger.info("Generated %s total scenarios", len(scenarios))
         return scenarios
     
     async def _create_incremental_scenarios(
@@ -266,6 +386,7 @@ class LoadTestService:
         25% (warm-up), 50%, 75%, 100%, 150%, 200%
         """
         scenarios = []
+        now = datetime.utcnow()  # Shared by the whole batch
 
         # Define load percentages for scenarios (including warm-up)
         # 25% is warm-up to initialize connections, caches, etc.
@@ -288,88 +409,138 @@ class LoadTestService:
                 description=f"{'Warm-up: ' if is_warmup else ''}Load test at {load_percentage}% of expected load: {current_users} users, {current_volumetry} req/min",
                 target_volumetry=current_volumetry,
                 concurrent_users=current_users,
-                duration_seconds=self.degradation_settings.get("default_test_duration", 60),
+                duration_seconds=self._default_duration,
                 ramp_up_seconds=10,
                 ramp_down_seconds=10,
                 test_data=test_data,
-                created_at=datetime.utcnow(),
+                created_at=now,
             )
 
-            scenario = await self.scenario_repository.create(scenario)
             scenarios.append(scenario)
 
-        return scenarios
+        # Persist the whole ramp for this endpoint in one batch
+        return await self.scenario_repository.create_many(scenarios)
     
     async def _execute_test_scenarios(
         self, 
         job: Job, 
-        scenarios: List[TestScenario]
+        scenarios: List[TestScenario],
+        endpoint_cache: Optional[Dict[int, Endpoint]] = None,
     ) -> List[TestResult]:
-        """Execute test scenarios and collect results."""
-        logger.info(f"Executing {len(scenarios)} test scenarios")
+        """Execute test scenarios and collect results.
+
+        Scenarios are drained from a queue by up to ``max_scenario_concurrency``
+        workers (default 1, i.e. strictly in order). Only the k6 runs overlap;
+        database work is serialized on the shared session. Finished results are
+        checked for degradation in scenario order, so the baseline always comes
+        from the lowest-index result and the returned list is in load order. Once
+        a result shows degradation no new scenario starts; runs already in flight
+        finish and results after the degraded scenario are discarded.
+        """
+        logger.info("Executing %s test scenarios", len(scenarios))
         
-        results = []
         total_scenarios = len(scenarios)
-        base_progress = 25.0  # Starting from 25%
-        progress_per_scenario = 55.0 / total_scenarios  # 55% total for execution (25% to 80%)
-        
-        baseline_response_time = None
-        
-        for i, scenario in enumerate(scenarios):
-            current_progress = base_progress + (i * progress_per_scenario)
-            await self._update_job_progress(
-                job, 
-                current_progress, 
-                f"Executing scenario {i+1}/{total_scenarios}"
-            )
-            
-            # Execute scenario
-            result = await self._execute_single_scenario(scenario)
-            
-            if result:
-                results.append(result)
+        if not total_scenarios:
+            return []
+        
+        # Progress at the start of each scenario: 55% total for execution (25% to 80%)
+        base_progress = 25.0
+        progress_per_scenario = 55.0 / total_scenarios
+        progress_values = [base_progress + i * progress_per_scenario for i in range(total_scenarios)]
+        
+        self._rt_threshold = None  # Set from the first result's response time
+        stop_event = asyncio.Event()
+        # Results by scenario index (None for a failed run) and the next index to check
+        results_by_index: Dict[int, Optional[TestResult]] = {}
+        next_to_check = 0
+        
+        queue: "asyncio.Queue[tuple[int, TestScenario]]" = asyncio.Queue()
+        for item in enumerate(scenarios):
+            queue.put_nowait(item)
+        
+        async def worker() -> None:
+            nonlocal next_to_check
+            while not stop_event.is_set():
+                try:
+                    i, scenario = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
                 
-                # Set baseline from first successful result
-                if baseline_response_time is None and result.avg_response_time_ms:
-                    baseline_response_time = result.avg_response_time_ms
+                async with self._session_lock:
+                    await self._update_job_progress(
+                        job, 
+                        progress_values[i], 
+                        f"Executing scenario {i+1}/{total_scenarios}"
+                    )
                 
-                # Check for degradation
-                if await self._should_stop_due_to_degradation(result, baseline_response_time):
-                    logger.info(f"Stopping scenarios due to degradation at scenario {i+1}")
-                    break
-        
-        logger.info(f"Completed execution with {len(results)} results")
+                # Execute scenario
+                result = await self._execute_single_scenario(
+                    scenario, job.job_id, endpoint_cache
+                )
+                
+                results_by_index[i] = result
+                
+                # Check every result whose predecessors have all finished, in scenario order
+                while next_to_check in results_by_index and not stop_event.is_set():
+                    checked_index = next_to_check
+                    checked = results_by_index[checked_index]
+                    next_to_check += 1
+                    if not checked:
+                        continue
+                    
+                    # Set baseline threshold from first successful result
+                    if self._rt_threshold is None and checked.avg_response_time_ms:
+                        self._rt_threshold = checked.avg_response_time_ms * self._degradation_multiplier
+                    
+                    # Check for degradation
+                    if await self._should_stop_due_to_degradation(checked):
+                        logger.info("Stopping scenarios due to degradation at scenario %s", checked_index + 1)
+                        stop_event.set()
+        
+        worker_count = max(1, min(self._max_scenario_concurrency, total_scenarios))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+        
+        # Only checked results count: later ones ran past a degraded scenario
+        results = [results_by_index[i] for i in range(next_to_check) if results_by_index[i]]
+        logger.info("Completed execution with %s results", len(results))
         return results
     
-    async def _execute_single_scenario(self, scenario: TestScenario) -> Optional[TestResult]:
+    async def _execute_single_scenario(
+        self,
+        scenario: TestScenario,
+        job_id: Optional[str] = None,
+        endpoint_cache: Optional[Dict[int, Endpoint]] = None,
+    ) -> Optional[TestResult]:
         """Execute a single test scenario."""
-        logger.info(f"Executing scenario: {scenario.scenario_name}")
+        logger.info("Executing scenario: %s", scenario.scenario_name)
         
-        # Create execution record
+        # Create the execution record already running; further changes are staged on
+        # the entity and written once when the execution finishes or fails
         execution = TestExecution(
             scenario_id=scenario.scenario_id,
+            job_id=job_id,
             execution_name=f"Execution of {scenario.scenario_name}",
-            status=ExecutionStatus.PENDING,
+            status=ExecutionStatus.RUNNING,
+            start_time=datetime.utcnow(),
             executed_by="load_test_service",
         )
         
-        execution = await self.execution_repository.create(execution)
+        async with self._session_lock:
+            execution = await self.execution_repository.create(execution)
         
         try:
-            # Mark as running
-            execution.status = ExecutionStatus.RUNNING
-            execution.start_time = datetime.utcnow()
-            await self.execution_repository.update(execution)
-            
-            # Get endpoint for script generation
-            endpoint = await self.endpoint_repository.get_by_id(scenario.endpoint_id)
-            if not endpoint:
-                raise ResourceNotFoundError(f"Endpoint {scenario.endpoint_id} not found")
-
-            # Get API for base URL
-            api = await self.api_repository.get_by_id(endpoint.api_id)
-            if not api:
-                raise ResourceNotFoundError(f"API {endpoint.api_id} not found")
+            async with self._session_lock:
+                # Get endpoint for script generation
+                endpoint = endpoint_cache.get(scenario.endpoint_id) if endpoint_cache else None
+                if endpoint is None:
+                    endpoint = await self.endpoint_repository.get_by_id(scenario.endpoint_id)
+                if not endpoint:
+                    raise ResourceNotFoundError(f"Endpoint {scenario.endpoint_id} not found")
+
+                # Get API for base URL (already loaded on endpoints from the repository)
+                api = endpoint.api or await self.api_repository.get_by_id(endpoint.api_id)
+                if not api:
+                    raise ResourceNotFoundError(f"API {endpoint.api_id} not found")
 
             # Attach API to endpoint for K6 script generation
             endpoint.api = api
@@ -388,7 +559,6 @@ class LoadTestService:
             )
             
             execution.k6_script_used = k6_script
-            await self.execution_repository.update(execution)
             
             # Execute K6 script
             k6_results = await self.k6_runner.execute_k6_script(
@@ -402,46 +572,47 @@ class LoadTestService:
             execution.actual_duration_seconds = (
                 execution.end_time - execution.start_time
             ).total_seconds()
-            execution.execution_logs = json.dumps(k6_results.get("logs", []))
-            
-            await self.execution_repository.update(execution)
+            # Store where the runner wrote the k6 log rather than the log itself
+            execution.execution_logs = k6_results.get("logs_path") or orjson.dumps(
+                k6_results.get("logs", []), default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
             
             # Create test result
             result = self._parse_k6_results_to_test_result(k6_results, execution.execution_id)
-            result = await self.result_repository.create(result)
+            async with self._session_lock:
+                await self.execution_repository.update(execution)
+                result = await self.result_repository.create(result)
             
-            logger.info(f"Scenario execution completed: {scenario.scenario_name}")
+            logger.info("Scenario execution completed: %s", scenario.scenario_name)
             return result
             
         except Exception as e:
-            logger.error(f"Scenario execution failed: {str(e)}")
+            logger.error("Scenario execution failed: %s", e)
             execution.status = ExecutionStatus.FAILED
             execution.end_time = datetime.utcnow()
             execution.execution_logs = str(e)
-            await self.execution_repository.update(execution)
+            async with self._session_lock:
+                await self.execution_repository.update(execution)
             return None
     
     async def _should_stop_due_to_degradation(
         self, 
-        result: TestResult, 
-        baseline_response_time: Optional[float]
+        result: TestResult
     ) -> bool:
         """Check if we should stop due to degradation."""
         if not result:
             return True
         
         # Check error rate
-        error_threshold = self.degradation_settings["stop_error_threshold"]
-        if result.error_rate_percent > (error_threshold * 100):
-            logger.info(f"Stopping due to high error rate: {result.error_rate_percent}%")
+        if result.error_rate_percent > self._error_threshold_pct:
+            logger.info("Stopping due to high error rate: %s%%", result.error_rate_percent)
             return True
         
         # Check response time degradation
-        if baseline_response_time and result.avg_response_time_ms:
-            multiplier = self.degradation_settings["degradation_response_time_multiplier"]
-            if result.avg_response_time_ms > (baseline_response_time * multiplier):
-                logger.info(f"Stopping due to response time degradation: "
-                           f"{result.avg_response_time_ms}ms vs baseline {baseline_response_time}ms")
+        if self._rt_threshold and result.avg_response_time_ms:
+            if result.avg_response_time_ms > self._rt_threshold:
+                logger.info("Stopping due to response time degradation: %sms vs threshold %sms",
+                            result.avg_response_time_ms, self._rt_threshold)
                 return True
         
         return False
@@ -455,43 +626,76 @@ class LoadTestService:
         if job.started_at:
             duration_delta = datetime.utcnow() - job.started_at
             test_duration = int(duration_delta.total_seconds())
-            logger.info(f"Test duration calculated: {test_duration} seconds (from {job.started_at} to now)")
+            logger.info("Test duration calculated: %s seconds (from %s to now)", test_duration, job.started_at)
         else:
-            logger.warning(f"Cannot calculate test duration - started_at is None")
+            logger.warning("Cannot calculate test duration - started_at is None")
+
+        # Resolve executions, then scenarios, then endpoints (with their API), one
+        # batched query per level. A failed lookup is logged and only drops the
+        # affected results from the endpoint breakdown.
+        try:
+            executions_by_id = await self.execution_repository.get_by_ids(
+                [result.execution_id for result in results if result.execution_id]
+            )
+        except Exception as e:
+            logger.warning("Could not get executions for report: %s", e)
+            executions_by_id = {}
+
+        try:
+            scenarios_by_id = await self.scenario_repository.get_by_ids(
+                [execution.scenario_id for execution in executions_by_id.values() if execution.scenario_id]
+            )
+        except Exception as e:
+            logger.warning("Could not get scenarios for report: %s", e)
+            scenarios_by_id = {}
+
+        resolved = []
+        for result in results:
+            execution = executions_by_id.get(result.execution_id) if result.execution_id else None
+            scenario = scenarios_by_id.get(execution.scenario_id) if execution else None
+            if scenario and scenario.endpoint_id:
+                resolved.append((result, execution, scenario))
+            else:
+                logger.warning("Could not get endpoint for result %s", result.result_id)
+
+        try:
+            endpoints_by_id = await self.endpoint_repository.get_by_ids(
+                [scenario.endpoint_id for _, _, scenario in resolved]
+            )
+        except Exception as e:
+            logger.warning("Could not get endpoints for report: %s", e)
+            endpoints_by_id = {}
 
         # Group results by endpoint and collect endpoint details
         endpoint_details = {}
-        for result in results:
-            if result.execution_id:
-                try:
-                    execution = await self.execution_repository.get_by_id(result.execution_id)
-                    if execution and execution.scenario_id:
-                        scenario = await self.scenario_repository.get_by_id(execution.scenario_id)
-                        if scenario and scenario.endpoint_id:
-                            endpoint = await self.endpoint_repository.get_by_id(scenario.endpoint_id)
-                            if endpoint:
-                                endpoint_key = f"{endpoint.http_method}_{endpoint.endpoint_path}"
-
-                                if endpoint_key not in endpoint_details:
-                                    # Get API info for base URL
-                                    api = None
-                                    if endpoint.api_id:
-                                        api = await self.api_repository.get_by_id(endpoint.api_id)
-
-                                    endpoint_details[endpoint_key] = {
-                                        'endpoint': endpoint,
-                                        'api': api,
-                                        'scenarios': []
-                                    }
-
-                                # Add scenario result
-                                endpoint_details[endpoint_key]['scenarios'].append({
-                                    'scenario': scenario,
-                                    'execution': execution,
-                                    'result': result
-                                })
-                except Exception as e:
-                    logger.warning(f"Could not get endpoint for result {result.result_id}: {e}")
+        result_endpoints = {}
+        for result, execution, scenario in resolved:
+            endpoint = endpoints_by_id.get(scenario.endpoint_id)
+            if not endpoint:
+                logger.warning("Could not get endpoint for result %s", result.result_id)
+                continue
+
+            endpoint_key = f"{endpoint.http_method}_{endpoint.endpoint_path}"
+            result_endpoints[result.result_id] = (endpoint.http_method, endpoint.endpoint_path)
+
+            if endpoint_key not in endpoint_details:
+                # API info for base URL is loaded together with the endpoint
+                api = endpoint.api
+                if api is None and endpoint.api_id:
+                    api = await self.api_repository.get_by_id(endpoint.api_id)
+
+                endpoint_details[endpoint_key] = {
+                    'endpoint': endpoint,
+                    'api': api,
+                    'scenarios': []
+                }
+
+            # Add scenario result
+            endpoint_details[endpoint_key]['scenarios'].append({
+                'scenario': scenario,
+                'execution': execution,
+                'result': result
+            })
 
         job_info = {
             "job_id": job.job_id,
@@ -502,10 +706,11 @@ class LoadTestService:
             "total_endpoints": len(endpoint_details),
             "test_duration": test_duration,
             "endpoint_details": endpoint_details,  # Pass structured endpoint data
+            "result_endpoints": result_endpoints,  # result_id -> (http_method, endpoint_path)
         }
 
         report_path = await self.report_generator.generate_technical_report(results, job_info)
-        logger.info(f"Report generated: {report_path}")
+        logger.info("Report generated: %s", report_path)
 
         return report_path
     
@@ -519,13 +724,13 @@ class LoadTestService:
             if server_url.startswith("/"):
                 # It's a relative URL, need to construct full URL
                 # Try to get host from spec info or use a default
-                logger.warning(f"Server URL is relative: {server_url}. Need to add host.")
+                logger.warning("Server URL is relative: %s. Need to add host.", server_url)
 
                 # Check if there's an 'x-server-url' extension or similar
                 if "x-server-url" in parsed_spec.get("info", {}):
                     base_host = parsed_spec["info"]["x-server-url"]
                     full_url = f"{base_host.rstrip('/')}{server_url}"
-                    logger.info(f"Constructed full URL from x-server-url: {full_url}")
+                    logger.info("Constructed full URL from x-server-url: %s", full_url)
                     return full_url
 
                 # If spec has externalDocs with a URL, check if it's a known API
@@ -543,22 +748,22 @@ class LoadTestService:
                                 full_url = f"https://petstore.swagger.io{server_url}"
                             else:  # v3 or other
                                 full_url = f"https://petstore3.swagger.io{server_url}"
-                            logger.info(f"Detected Petstore API, using correct server: {full_url}")
+                            logger.info("Detected Petstore API, using correct server: %s", full_url)
                             return full_url
 
                         # For other APIs, try to extract host from external docs
                         if parsed.scheme and parsed.netloc:
                             base_host = f"{parsed.scheme}://{parsed.netloc}"
                             full_url = f"{base_host}{server_url}"
-                            logger.info(f"Constructed full URL from externalDocs: {full_url}")
+                            logger.info("Constructed full URL from externalDocs: %s", full_url)
                             return full_url
 
                 # Last resort: return as-is and let it be handled later
-                logger.warning(f"Could not determine full host, returning relative URL: {server_url}")
+                logger.warning("Could not determine full host, returning relative URL: %s", server_url)
                 return server_url
 
             # URL is absolute
-            logger.info(f"Extracted absolute base URL: {server_url}")
+            logger.info("Extracted absolute base URL: %s", server_url)
             return server_url
 
         # Fallback to host + basePath (OpenAPI 2.0)
@@ -568,7 +773,7 @@ class LoadTestService:
 
         if host:
             full_url = f"{schemes[0]}://{host}{base_path}"
-            logger.info(f"Constructed base URL from host: {full_url}")
+            logger.info("Constructed base URL from host: %s", full_url)
             return full_url
 
         logger.warning("Could not extract base URL from spec")
@@ -576,20 +781,13 @@ class LoadTestService:
     
     def _create_auth_config(
         self, 
-        endpoint_config: Dict, 
+        endpoint_config: EndpointSpec, 
         global_auth: Optional[AuthConfig]
     ) -> Optional[AuthConfig]:
         """Create auth config for endpoint."""
         # Endpoint-specific auth takes precedence
-        if "auth" in endpoint_config and endpoint_config["auth"] is not None:
-            auth_data = endpoint_config["auth"]
-            return AuthConfig(
-                auth_type=auth_data.get("type"),
-                token=auth_data.get("token"),
-                api_key=auth_data.get("api_key"),
-                header_name=auth_data.get("header_name"),
-                query_param_name=auth_data.get("query_param_name"),
-            )
+        if endpoint_config.auth is not None:
+            return endpoint_config.auth
         
         # Fallback to global auth
         return global_auth
@@ -597,7 +795,7 @@ class LoadTestService:
     async def _generate_or_load_test_data(
         self,
         endpoint: Endpoint,
-        config: LoadTestConfiguration
+        selected_config: Optional[EndpointSpec] = None
     ) -> List[Dict]:
         """Generate or load test data for endpoint."""
         # Calculate how many unique data records we need
@@ -606,32 +804,42 @@ class LoadTestService:
         # Formula: (volumetry * 2) * (test_duration_seconds / 60) + buffer
         # With 60s test duration: (volumetry * 2) * 1 + 50% buffer
         required_count = max(100, int(endpoint.expected_volumetry * 2 * 1.5))
-        logger.info(f"Calculating mock data count for {endpoint.endpoint_name}: "
-                   f"volumetry={endpoint.expected_volumetry}, required_count={required_count}")
-
-        # Check if endpoint has custom data file
-        for selected_ep in config.selected_endpoints:
-            if (selected_ep.get("path") == endpoint.endpoint_path and
-                selected_ep.get("method") == endpoint.http_method):
-
-                # Only load from file if data_file has a real value (not None, not empty)
-                if selected_ep.get("data_file"):
-                    # Load custom data (implement file loading)
-                    return await self._load_test_data_file(selected_ep["data_file"])
-                elif selected_ep.get("use_mock_data", True):
-                    # Generate mock data with the endpoint's schema
-                    return await self.mock_generator.generate_mock_data(
-                        endpoint, endpoint.schema or {}, count=required_count
-                    )
+        logger.info("Calculating mock data count for %s: volumetry=%s, required_count=%s",
+                    endpoint.endpoint_name, endpoint.expected_volumetry, required_count)
 
-        # Default: generate mock data with the endpoint's schema
+        # Only load from file if data_file has a real value (not None, not empty)
+        if selected_config and selected_config.data_file:
+            return await self._load_test_data_file(selected_config.data_file)
+
+        # Otherwise (use_mock_data or default): generate mock data with the endpoint's schema
         return await self.mock_generator.generate_mock_data(endpoint, endpoint.schema or {}, count=required_count)
     
+    def _validate_data_files(self, config: LoadTestConfiguration) -> List[str]:
+        """Check custom data files up front so a bad path fails the request, not the run."""
+        errors = []
+        for ep in config.selected_endpoints:
+            if not ep.data_file:
+                continue
+            if not ep.data_file.lower().endswith(_DATA_FILE_EXTENSIONS):
+                errors.append(
+                    f"Endpoint {ep.method} {ep.path}: unsupported data file type "
+                    f"(expected {', '.join(_DATA_FILE_EXTENSIONS)})"
+                )
+            elif not os.path.isfile(ep.data_file):
+                errors.append(f"Endpoint {ep.method} {ep.path}: data file not found: {ep.data_file}")
+        return errors
+    
     async def _load_test_data_file(self, file_path: str) -> List[Dict]:
-        """Load test data from file."""
-        # TODO: Implement file loading logic
-        # This would handle CSV, JSON, Excel files
-        return []
+        """Load test data from a JSON or CSV file."""
+        try:
+            key = (file_path, os.stat(file_path).st_mtime_ns)
+            data = self._data_file_cache.get(key)
+            if data is None:
+                data = await asyncio.to_thread(_read_test_data_file, file_path)
+                self._data_file_cache[key] = data
+            return data
+        except (OSError, ValueError, csv.Error) as e:
+            raise InvalidConfigurationError(f"Cannot read data file {file_path}: {str(e)}")
     
     def _parse_k6_results_to_test_result(
         self,
@@ -681,12 +889,20 @@ class LoadTestService:
         percentage: float, 
         message: Optional[str] = None
     ) -> None:
-        """Update job progress."""
+        """Update job progress, writing it at most once per flush interval.
+
+        A skipped write leaves the progress on the job entity; the next job write,
+        including the terminal finish/fail update, persists the latest value.
+        """
         job.update_progress(percentage)
-        await self.job_repository.update(job)
+        
+        now = time.monotonic()
+        if now - self._last_progress_flush >= self._progress_flush_interval:
+            await self.job_repository.update(job)
+            self._last_progress_flush = now
         
         if message:
-            logger.info(f"Job {job.job_id}: {message} ({percentage:.1f}%)")
+            logger.info("Job %s: %s (%.1f%%)", job.job_id, message, percentage)
 
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a specific job."""
@@ -694,25 +910,24 @@ class LoadTestService:
             job = await self.job_repository.get_by_id(job_id)
 
             if not job:
-                logger.warning(f"Job {job_id} not found")
+                logger.warning("Job %s not found", job_id)
                 return False
 
             # Only cancel if job is PENDING or RUNNING
             if job.status not in [JobStatus.PENDING, JobStatus.RUNNING]:
-                logger.warning(f"Job {job_id} is {job.status}, cannot cancel")
+                logger.warning("Job %s is %s, cannot cancel", job_id, job.status.value)
                 return False
 
             # Update job status to FAILED with cancellation message
-            job.status = JobStatus.FAILED
-            job.error_message = "Job cancelled by user"
-            job.end_time = datetime.utcnow()
+            job.fail("Job cancelled by user")
 
             await self.job_repository.update(job)
-            logger.info(f"Job {job_id} cancelled successfully")
+            _STATUS_CACHE.pop(job_id, None)
+            logger.info("Job %s cancelled successfully", job_id)
             return True
 
         except Exception as e:
-            logger.error(f"Error cancelling job {job_id}: {str(e)}")
+            logger.error("Error cancelling job %s: %s", job_id, e)
             return False
 
     async def cancel_all_running_jobs(self) -> int:
@@ -727,15 +942,14 @@ class LoadTestService:
 
             cancelled_count = 0
             for job in active_jobs:
-                job.status = JobStatus.FAILED
-                job.error_message = "Job cancelled by user (bulk cancellation)"
-                job.end_time = datetime.utcnow()
+                job.fail("Job cancelled by user (bulk cancellation)")
                 await self.job_repository.update(job)
+                _STATUS_CACHE.pop(job.job_id, None)
                 cancelled_count += 1
 
-            logger.info(f"Cancelled {cancelled_count} running/pending jobs")
+            logger.info("Cancelled %s running/pending jobs", cancelled_count)
             return cancelled_count
 
         except Exception as e:
-            logger.error(f"Error cancelling all jobs: {str(e)}")
+            logger.error("Error cancelling all jobs: %s", e)
             return 0
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from loadtester.domain.services.load_test_service import LoadTestService
 from loadtester.infrastructure.config.dependency_container import Container
-from loadtester.settings import Settings
+from loadtester.settings import get_settings
 from typing import Union
 from loadtester.infrastructure.external.ai_client import OpenAPIParserService
 from loadtester.infrastructure.external.local_openapi_parser import LocalOpenAPIParser
@@ -19,11 +19,12 @@ from loadtester.infrastructure.external.pdf_generator_service import ReportGener
 
 async def get_database_session() -> AsyncSession:
     """Get database session dependency."""
-    from loadtester.infrastructure.database.database_connection import DatabaseManager
+    from loadtester.infrastructure.database import database_connection
 
-    # Create a database manager with the correct settings
-    settings = Settings()
-    db_manager = DatabaseManager(settings.database_url)
+    # Reuse the process-wide engine so every request draws from one bounded pool
+    if database_connection._db_manager is None:
+        database_connection.init_database(get_settings().database_url)
+    db_manager = database_connection.get_database_manager()
 
     async for session in db_manager.get_session():
         yield session
@@ -40,6 +41,7 @@ async def get_custom_load_test_service(
     from loadtester.infrastructure.repositories.test_execution_repository import TestExecutionRepository
     from loadtester.infrastructure.repositories.test_result_repository import TestResultRepository
     from loadtester.infrastructure.repositories.job_repository import JobRepository
+    from loadtester.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
     from loadtester.infrastructure.external.local_openapi_parser import LocalOpenAPIParser
     from loadtester.infrastructure.external.mock_data_service import MockDataGeneratorService
     from loadtester.infrastructure.external.k6_service import K6ScriptGeneratorService, K6RunnerService
@@ -64,6 +66,7 @@ async def get_custom_load_test_service(
         result_repository = TestResultRepository(session=db_session)
         logger.info("Creating JobRepository...")
         job_repository = JobRepository(session=db_session)
+        unit_of_work = SQLAlchemyUnitOfWork(session=db_session)
         logger.info("All repositories created successfully!")
 
         logger.info("Getting settings...")
@@ -101,6 +104,8 @@ async def get_custom_load_test_service(
             pdf_generator=pdf_generator
         )
 
+        settings = get_settings()
+
         # Create service with repositories that have proper sessions
         service = LoadTestService(
             api_repository=api_repository,
@@ -115,7 +120,10 @@ async def get_custom_load_test_service(
             k6_runner=k6_runner,
             report_generator=report_generator,
             degradation_settings={
-                'max_concurrent_jobs': 3,
+                'max_concurrent_jobs': settings.max_concurrent_jobs,  # Worker pool size (MAX_CONCURRENT_JOBS)
+                'max_queued_jobs': settings.max_queued_jobs,  # Jobs allowed to wait for a worker (MAX_QUEUED_JOBS)
+                'max_scenario_concurrency': settings.max_scenario_concurrency,  # MAX_SCENARIO_CONCURRENCY; 1 runs scenarios in order
+                'progress_flush_interval_ms': settings.progress_flush_interval_ms,  # Minimum gap between job progress writes
                 'degradation_response_time_multiplier': 2.0,
                 'degradation_error_rate_threshold': 0.05,
                 'default_test_duration': 60,  # Reduced from 300 for faster testing (total: 60s + 10s ramp-up + 10s ramp-down = 80s)
@@ -123,7 +131,8 @@ async def get_custom_load_test_service(
                 'user_increment_percentage': 0.2,  # 20% increment per scenario
                 'stop_error_threshold': 0.1,
                 'max_scenarios_per_endpoint': 5,  # Max scenarios to generate per endpoint (set to 5 for faster testing, 20 for production)
-            }
+            },
+            unit_of_work=unit_of_work,
         )
 
         logger.info("LoadTestService created successfully")
@@ -9,6 +9,7 @@ from dependency_injector.wiring import Provide, inject
 
 from loadtester.domain.services.load_test_service import LoadTestService
 from loadtester.infrastructure.database.database_connection import DatabaseManager
+from loadtester.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 from loadtester.infrastructure.external.ai_client import MultiProviderAIClient, OpenAPIParserService
 from loadtester.infrastructure.external.local_openapi_parser import LocalOpenAPIParser
 from loadtester.infrastructure.external.k6_service import K6RunnerService, K6ScriptGeneratorService
@@ -20,7 +21,7 @@ from loadtester.infrastructure.repositories.job_repository import JobRepository
 from loadtester.infrastructure.repositories.test_execution_repository import TestExecutionRepository
 from loadtester.infrastructure.repositories.test_result_repository import TestResultRepository
 from loadtester.infrastructure.repositories.test_scenario_repository import TestScenarioRepository
-from loadtester.settings import Settings
+from loadtester.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +43,7 @@ class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
     
     # Settings
-    settings = providers.Singleton(Settings)
+    settings = providers.Singleton(get_settings)
     
     # Database
     database_manager = providers.Singleton(
@@ -79,6 +80,10 @@ class Container(containers.DeclarativeContainer):
     job_repository = providers.Factory(
         JobRepository,
     )
+
+    unit_of_work = providers.Factory(
+        SQLAlchemyUnitOfWork,
+    )
     
     # External Services
     ai_client = providers.Singleton(
@@ -138,6 +143,9 @@ class Container(containers.DeclarativeContainer):
         report_generator=report_generator_service,
         degradation_settings=providers.Dict(
             max_concurrent_jobs=config.max_concurrent_jobs,
+            max_queued_jobs=config.max_queued_jobs,
+            max_scenario_concurrency=config.max_scenario_concurrency,
+            progress_flush_interval_ms=config.progress_flush_interval_ms,
             degradation_response_time_multiplier=config.degradation_response_time_multiplier,
             degradation_error_rate_threshold=config.degradation_error_rate_threshold,
             default_test_duration=config.default_test_duration,
@@ -145,6 +153,7 @@ class Container(containers.DeclarativeContainer):
             user_increment_percentage=config.user_increment_percentage,
             stop_error_threshold=config.stop_error_threshold,
         ),
+        unit_of_work=unit_of_work,
     )
 
 
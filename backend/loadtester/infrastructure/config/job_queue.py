@@ -0,0 +1,149 @@
+"""
+Job Queue
+Bounded worker pool that runs load test jobs outside the request cycle
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Set, Tuple
+
+from loadtester.domain.entities.domain_entities import JobStatus, LoadTestConfiguration
+
+logger = logging.getLogger(__name__)
+
+_SHUTDOWN_ERROR_MESSAGE = "Server shut down before the job started"
+_INTERRUPTED_ERROR_MESSAGE = "Server shut down while the job was running"
+
+
+class JobQueue:
+    """asyncio.Queue drained by a fixed number of worker tasks.
+
+    Also keeps per-status job counts for the jobs it has seen, updated on each
+    transition so metrics can be read without querying the database. All updates
+    happen on the event loop thread, so plain ints need no locking. Jobs that were
+    no longer pending when a worker picked them up (e.g. cancelled while queued)
+    are counted as skipped.
+    """
+
+    def __init__(self, worker_count: int = 1):
+        self.worker_count = max(1, worker_count)
+        # Only the job ID is queued: the job's state is read again when a worker takes it
+        self._queue: "asyncio.Queue[Tuple[str, LoadTestConfiguration]]" = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._counts: Dict[JobStatus, int] = dict.fromkeys(JobStatus, 0)
+        self._skipped = 0
+        self._running_job_ids: Set[str] = set()
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a free worker."""
+        return self._queue.qsize()
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Snapshot of job counts since startup, keyed by lowercase status name."""
+        counts = {job_status.value.lower(): count for job_status, count in self._counts.items()}
+        counts["skipped"] = self._skipped
+        return counts
+
+    def _transition(self, from_status: JobStatus, to_status: JobStatus) -> None:
+        """Move one job between status counters."""
+        self._counts[from_status] -= 1
+        self._counts[to_status] += 1
+
+    def start(self) -> None:
+        """Start the worker tasks (call from within the running event loop)."""
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"load-test-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info("Started %d load test worker(s)", self.worker_count)
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks and fail the jobs they were running or still had queued."""
+        # Cancelled mid-run, execute_load_test skips its terminal write: record the jobs first
+        interrupted_job_ids = list(self._running_job_ids)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        queued_job_ids = []
+        while not self._queue.empty():
+            job_id, _ = self._queue.get_nowait()
+            self._queue.task_done()
+            queued_job_ids.append(job_id)
+
+        await self._fail_unfinished_jobs(
+            [(job_id, JobStatus.RUNNING, _INTERRUPTED_ERROR_MESSAGE) for job_id in interrupted_job_ids]
+            + [(job_id, JobStatus.PENDING, _SHUTDOWN_ERROR_MESSAGE) for job_id in queued_job_ids]
+        )
+
+    async def _fail_unfinished_jobs(self, jobs: List[Tuple[str, JobStatus, str]]) -> None:
+        """Mark (job_id, expected status, message) jobs as failed so they do not stay active."""
+        if not jobs:
+            return
+
+        from loadtester.infrastructure.config.dependencies import get_database_session
+        from loadtester.infrastructure.repositories.job_repository import JobRepository
+
+        async for session in get_database_session():
+            job_repository = JobRepository(session=session)
+            for job_id, expected_status, error_message in jobs:
+                self._counts[expected_status] -= 1
+                try:
+                    job = await job_repository.get_by_id(job_id)
+                    if job and job.status == expected_status:
+                        job.fail(error_message)
+                        await job_repository.update(job)
+                        self._counts[JobStatus.FAILED] += 1
+                except Exception:
+                    logger.exception("Could not mark job %s as failed", job_id)
+
+    async def submit(self, job_id: str, config: LoadTestConfiguration) -> None:
+        """Queue a created job for execution."""
+        await self._queue.put((job_id, config))
+        self._counts[JobStatus.PENDING] += 1
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time until cancelled."""
+        while True:
+            job_id, config = await self._queue.get()
+            try:
+                await self._run_job(job_id, config)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str, config: LoadTestConfiguration) -> None:
+        """Execute one job with its own session; the submitting request's session is closed."""
+        from loadtester.infrastructure.config.dependencies import (
+            get_custom_load_test_service, get_database_session
+        )
+
+        started = False
+        try:
+            async for session in get_database_session():
+                service = await get_custom_load_test_service(session)
+
+                # The job may have been cancelled while it waited in the queue
+                job = await service.job_repository.get_by_id(job_id)
+                if job is None or job.status != JobStatus.PENDING:
+                    self._counts[JobStatus.PENDING] -= 1
+                    self._skipped += 1
+                    logger.info("Skipping job %s: no longer pending", job_id)
+                    return
+
+                self._transition(JobStatus.PENDING, JobStatus.RUNNING)
+                started = True
+                self._running_job_ids.add(job_id)
+                try:
+                    # Hand over the entity just read so the service does not load it again
+                    await service.execute_load_test(job_id, config, job=job)
+                finally:
+                    self._running_job_ids.discard(job_id)
+                self._transition(JobStatus.RUNNING, JobStatus.FINISHED)
+
+        except Exception:
+            # The service has already marked a started job as failed
+            self._transition(JobStatus.RUNNING if started else JobStatus.PENDING, JobStatus.FAILED)
+            logger.exception("Load test job %s failed in worker", job_id)
@@ -6,19 +6,94 @@ SQLAlchemy async database connection and session management
 import logging
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event, inspect, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
 from sqlalchemy.pool import StaticPool
 
 from .database_models import Base
 
 logger = logging.getLogger(__name__)
 
+# Explicit pool bounds for server databases and file-based SQLite
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT = 30
+
+
+# Columns added to tables that already existed in released databases. create_all only
+# creates missing tables (and their indexes), so create_tables adds these in place.
+_ADDED_COLUMNS = (
+    ("test_executions", "job_id"),
+    ("test_scenarios", "test_data_id"),
+)
+
+
+def _upgrade_existing_tables(connection) -> None:
+    """Bring tables created by an earlier release up to the current models."""
+    _add_missing_columns(connection)
+    # Indexes declared after a table was first created are skipped by create_all
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def _add_missing_columns(connection) -> None:
+    """Add the nullable columns in _ADDED_COLUMNS to tables created before them."""
+    inspector = inspect(connection)
+    for table_name, column_name in _ADDED_COLUMNS:
+        existing_columns = {column["name"] for column in inspector.get_columns(table_name)}
+        if column_name in existing_columns:
+            continue
+        
+        column = Base.metadata.tables[table_name].c[column_name]
+        ddl = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column.type.compile(connection.dialect)}"
+        for foreign_key in column.foreign_keys:
+            target = foreign_key.column
+            ddl += f" REFERENCES {target.table.name}({target.name})"
+            if foreign_key.ondelete:
+                ddl += f" ON DELETE {foreign_key.ondelete}"
+        connection.execute(text(ddl))
+        logger.info(f"Added column {table_name}.{column_name}")
+
+
+def _is_sqlite_memory(database_url: str) -> bool:
+    """An in-memory SQLite database only exists on the connection that created it."""
+    return (
+        database_url.rstrip("/") in ("sqlite:", "sqlite+aiosqlite:")
+        or ":memory:" in database_url
+        or "mode=memory" in database_url
+    )
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """SQLite ignores FOREIGN KEY clauses (incl. ON DELETE CASCADE) unless enabled per connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def make_session_factory(engine: AsyncEngine) -> async_sessionmaker:
+    """Build the session factory repositories expect (instances stay loaded after commit)."""
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
 
 class DatabaseManager:
     """Database connection and session manager."""
     
-    def __init__(self, database_url: str):
-        """Initialize database manager with connection URL."""
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_timeout: int = DEFAULT_POOL_TIMEOUT,
+    ):
+        """Initialize database manager with connection URL and pool bounds."""
         self.database_url = database_url
         
         # Convert sqlite:// to sqlite+aiosqlite:// for async support
@@ -28,27 +103,49 @@ class DatabaseManager:
             self.async_database_url = database_url
         
         # Create async engine
-        self.engine = create_async_engine(
-            self.async_database_url,
-            echo=False,  # Set to True for SQL debugging
-            future=True,
+        if "sqlite" in database_url:
             # SQLite specific settings
-            poolclass=StaticPool if "sqlite" in database_url else None,
-            connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
-        )
+            if _is_sqlite_memory(database_url):
+                # The in-memory database lives on one connection, so every session shares it
+                pool_options = {"poolclass": StaticPool}
+            else:
+                # One connection per session: a commit or pool reset-on-return in one session
+                # must not touch another session's open transaction
+                pool_options = {
+                    "pool_size": pool_size,
+                    "max_overflow": max_overflow,
+                    "pool_timeout": pool_timeout,
+                }
+            self.engine = create_async_engine(
+                self.async_database_url,
+                echo=False,  # Set to True for SQL debugging
+                future=True,
+                connect_args={"check_same_thread": False},
+                **pool_options,
+            )
+            event.listen(self.engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+        else:
+            # Bounded queue pool: concurrent load-test jobs wait for a connection
+            # instead of exhausting the server's connection limit
+            self.engine = create_async_engine(
+                self.async_database_url,
+                echo=False,  # Set to True for SQL debugging
+                future=True,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_pre_ping=True,
+            )
         
         # Create session factory
-        self.async_session_factory = async_sessionmaker(
-            bind=self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
+        self.async_session_factory = make_session_factory(self.engine)
     
     async def create_tables(self) -> None:
         """Create all database tables."""
         try:
             async with self.engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(_upgrade_existing_tables)
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating database tables: {e}")
@@ -89,10 +186,11 @@ class DatabaseManager:
 _db_manager: DatabaseManager = None
 
 
-def init_database(database_url: str) -> None:
+def init_database(database_url: str) -> DatabaseManager:
     """Initialize global database manager."""
     global _db_manager
     _db_manager = DatabaseManager(database_url)
+    return _db_manager
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -7,8 +7,10 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text, func
+    JSON, Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text,
+    func, text
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -19,6 +21,8 @@ class APIModel(Base):
     """API entity model."""
     
     __tablename__ = "apis"
+    # Fetch SQL-generated defaults (created_at/updated_at) via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
     
     api_id = Column(Integer, primary_key=True, autoincrement=True)
     api_name = Column(String(200), nullable=False)
@@ -39,6 +43,8 @@ class EndpointModel(Base):
     """Endpoint entity model."""
 
     __tablename__ = "endpoints"
+    # Fetch SQL-generated defaults (created_at/updated_at) via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     endpoint_id = Column(Integer, primary_key=True, autoincrement=True)
     api_id = Column(Integer, ForeignKey("apis.api_id"), nullable=False)
@@ -70,6 +76,8 @@ class TestScenarioModel(Base):
     """Test scenario entity model."""
     
     __tablename__ = "test_scenarios"
+    # Fetch the SQL-generated created_at via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
     
     scenario_id = Column(Integer, primary_key=True, autoincrement=True)
     endpoint_id = Column(Integer, ForeignKey("endpoints.endpoint_id"), nullable=False)
@@ -82,6 +90,10 @@ class TestScenarioModel(Base):
     ramp_down_seconds = Column(Integer, default=10, nullable=False)
     k6_options = Column(Text, nullable=True)  # JSON string with K6 options
     test_data = Column(Text, nullable=True)  # JSON string with test data
+    # Set instead of test_data when the endpoint's shared data set applies to this scenario
+    test_data_id = Column(
+        Integer, ForeignKey("test_data_sets.test_data_id", ondelete="SET NULL"), nullable=True
+    )
     created_at = Column(DateTime, default=func.now(), nullable=False)
     created_by = Column(String(100), default="system", nullable=False)
     active = Column(Boolean, default=True, nullable=False)
@@ -89,18 +101,44 @@ class TestScenarioModel(Base):
     # Relationships
     endpoint = relationship("EndpointModel", back_populates="test_scenarios")
     test_executions = relationship("TestExecutionModel", back_populates="scenario", cascade="all, delete-orphan")
+    # Test data shared by the endpoint's scenarios (stored once instead of per row)
+    test_data_set = relationship("TestDataSetModel", lazy="selectin")
     
     def __repr__(self) -> str:
         return f"<TestScenario(id={self.scenario_id}, name='{self.scenario_name}')>"
 
 
+class TestDataSetModel(Base):
+    """Test data set shared by the scenarios of one endpoint."""
+    
+    __tablename__ = "test_data_sets"
+    # Fetch the SQL-generated created_at via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+    
+    test_data_id = Column(Integer, primary_key=True, autoincrement=True)
+    endpoint_id = Column(
+        Integer, ForeignKey("endpoints.endpoint_id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    data = Column(Text, nullable=False)  # JSON string with test data records
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<TestDataSet(id={self.test_data_id}, endpoint_id={self.endpoint_id})>"
+
+
 class TestExecutionModel(Base):
     """Test execution entity model."""
     
     __tablename__ = "test_executions"
+
+    # Equality on status + ordered start_time: get_running_executions becomes an index range scan
+    __table_args__ = (
+        Index("ix_exec_status_start", "status", "start_time"),
+    )
     
     execution_id = Column(Integer, primary_key=True, autoincrement=True)
     scenario_id = Column(Integer, ForeignKey("test_scenarios.scenario_id"), nullable=False)
+    job_id = Column(String(36), ForeignKey("jobs.job_id", ondelete="SET NULL"), nullable=True, index=True)
     execution_name = Column(String(200), nullable=False)
     start_time = Column(DateTime, nullable=True)
     end_time = Column(DateTime, nullable=True)
@@ -112,7 +150,7 @@ class TestExecutionModel(Base):
     
     # Relationships
     scenario = relationship("TestScenarioModel", back_populates="test_executions")
-    test_result = relationship("TestResultModel", back_populates="execution", uselist=False, cascade="all, delete-orphan")
+    test_result = relationship("TestResultModel", back_populates="execution", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self) -> str:
         return f"<TestExecution(id={self.execution_id}, name='{self.execution_name}', status='{self.status}')>"
@@ -124,7 +162,7 @@ class TestResultModel(Base):
     __tablename__ = "test_results"
     
     result_id = Column(Integer, primary_key=True, autoincrement=True)
-    execution_id = Column(Integer, ForeignKey("test_executions.execution_id"), nullable=False)
+    execution_id = Column(Integer, ForeignKey("test_executions.execution_id", ondelete="CASCADE"), nullable=False)
     avg_response_time_ms = Column(Float, nullable=True)
     p95_response_time_ms = Column(Float, nullable=True)
     p99_response_time_ms = Column(Float, nullable=True)
@@ -147,8 +185,8 @@ class TestResultModel(Base):
     
     # Relationships
     execution = relationship("TestExecutionModel", back_populates="test_result")
-    error_details = relationship("ErrorDetailModel", back_populates="result", cascade="all, delete-orphan")
-    performance_metrics = relationship("PerformanceMetricModel", back_populates="result", cascade="all, delete-orphan")
+    error_details = relationship("ErrorDetailModel", back_populates="result", cascade="all, delete-orphan", passive_deletes=True)
+    performance_metrics = relationship("PerformanceMetricModel", back_populates="result", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self) -> str:
         return f"<TestResult(id={self.result_id}, success_rate={self.success_rate_percent}%)>"
@@ -160,7 +198,7 @@ class ErrorDetailModel(Base):
     __tablename__ = "error_details"
     
     error_id = Column(Integer, primary_key=True, autoincrement=True)
-    result_id = Column(Integer, ForeignKey("test_results.result_id"), nullable=False)
+    result_id = Column(Integer, ForeignKey("test_results.result_id", ondelete="CASCADE"), nullable=False)
     error_type = Column(String(100), nullable=False)
     error_code = Column(String(20), nullable=True)
     error_message = Column(Text, nullable=True)
@@ -180,7 +218,7 @@ class PerformanceMetricModel(Base):
     __tablename__ = "performance_metrics"
     
     metric_id = Column(Integer, primary_key=True, autoincrement=True)
-    result_id = Column(Integer, ForeignKey("test_results.result_id"), nullable=False)
+    result_id = Column(Integer, ForeignKey("test_results.result_id", ondelete="CASCADE"), nullable=False)
     metric_name = Column(String(100), nullable=False)
     metric_type = Column(String(50), nullable=False)  # response_time, throughput, error_rate, etc.
     metric_value = Column(Float, nullable=False)
@@ -199,12 +237,44 @@ class JobModel(Base):
     """Job tracking model for long-running operations."""
     
     __tablename__ = "jobs"
+
+    # Partial indexes matching the JobRepository hot queries (status filter + sort).
+    # SQLite supports the same partial-index syntax, so both dialects get them.
+    __table_args__ = (
+        Index(
+            "ix_jobs_pending", "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+        Index(
+            "ix_jobs_running", "started_at",
+            postgresql_where=text("status = 'RUNNING'"),
+            sqlite_where=text("status = 'RUNNING'"),
+        ),
+        Index(
+            "ix_jobs_callback", "finished_at",
+            postgresql_where=text(
+                "status = 'FINISHED' AND callback_sent = false AND callback_url IS NOT NULL"
+            ),
+            sqlite_where=text(
+                "status = 'FINISHED' AND callback_sent = false AND callback_url IS NOT NULL"
+            ),
+        ),
+        Index(
+            "ix_jobs_cleanup", "finished_at",
+            postgresql_where=text("status IN ('FINISHED', 'FAILED')"),
+            sqlite_where=text("status IN ('FINISHED', 'FAILED')"),
+        ),
+    )
     
     job_id = Column(String(36), primary_key=True)  # UUID
     job_type = Column(String(50), nullable=False)  # load_test, report_generation
     status = Column(String(20), default="PENDING", nullable=False)  # PENDING, RUNNING, FINISHED, FAILED
     progress_percentage = Column(Float, default=0.0, nullable=False)
-    result_data = Column(Text, nullable=True)  # JSON string with results
+    result_data = Column(
+        JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )  # Native JSON (JSONB on PostgreSQL) with results
     error_message = Column(Text, nullable=True)
     callback_url = Column(String(500), nullable=True)
     callback_sent = Column(Boolean, default=False, nullable=False)
@@ -0,0 +1,50 @@
+"""
+Unit of Work
+Groups repository writes on a shared session into a single transaction
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from loadtester.domain.interfaces.domain_interfaces import UnitOfWorkInterface
+
+logger = logging.getLogger(__name__)
+
+# Session.info key marking a session that is inside an open unit of work
+_UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+async def commit_or_flush(session: AsyncSession) -> None:
+    """Commit the session, or only flush it while a unit of work owns the transaction."""
+    if session.info.get(_UNIT_OF_WORK_KEY):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+class SQLAlchemyUnitOfWork(UnitOfWorkInterface):
+    """SQLAlchemy implementation of the unit of work."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[None]:
+        """Commit every repository write made inside the block once, on exit."""
+        if self.session.info.get(_UNIT_OF_WORK_KEY):
+            # Nested: the outermost unit of work commits
+            yield
+            return
+
+        self.session.info[_UNIT_OF_WORK_KEY] = True
+        try:
+            yield
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
+        finally:
+            self.session.info.pop(_UNIT_OF_WORK_KEY, None)
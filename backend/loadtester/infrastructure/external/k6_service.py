@@ -9,7 +9,9 @@ import logging
 import os
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+import orjson
 
 from loadtester.domain.entities.domain_entities import Endpoint
 from loadtester.domain.interfaces.service_interfaces import (
@@ -19,6 +21,9 @@ from loadtester.shared.exceptions.infrastructure_exceptions import ExternalServi
 
 logger = logging.getLogger(__name__)
 
+# Tail of the k6 log kept as the error message when a run exits non-zero
+_K6_ERROR_TAIL_BYTES = 1000
+
 
 class K6ScriptGeneratorService(K6ScriptGeneratorServiceInterface):
     """K6 script generation service."""
@@ -560,8 +565,9 @@ class K6RunnerService(K6RunnerServiceInterface):
         with open(script_file, 'w') as f:
             f.write(script_content)
         
-        # Prepare output file
+        # Prepare output and log files
         output_file = self.results_path / f"results_{execution_id}.json"
+        log_file = self.log_path(execution_id)
         
         # Build K6 command (local execution with proper user and environment)
         cmd = [
@@ -573,20 +579,21 @@ class K6RunnerService(K6RunnerServiceInterface):
             str(script_file)
         ]
 
-        # Execute K6 as appuser with proper environment
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env={
-                **os.environ,
-                'HOME': '/home/appuser',
-                'USER': 'appuser',
-                'XDG_CONFIG_HOME': '/home/appuser/.config'
-            }
-        )
-
-        stdout, stderr = await process.communicate()
+        # Execute K6 as appuser with proper environment; its console output goes
+        # straight to the log file instead of being buffered in memory
+        with open(log_file, 'wb') as log:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=log,
+                stderr=asyncio.subprocess.STDOUT,
+                env={
+                    **os.environ,
+                    'HOME': '/home/appuser',
+                    'USER': 'appuser',
+                    'XDG_CONFIG_HOME': '/home/appuser/.config'
+                }
+            )
+            await process.wait()
 
         # Parse results FIRST, even if K6 failed (thresholds can fail but still produce results)
         try:
@@ -600,18 +607,18 @@ class K6RunnerService(K6RunnerServiceInterface):
             }
 
         # Add execution info
+        results["logs_path"] = str(log_file)
         results["execution_info"] = {
             "execution_id": execution_id,
             "script_file": str(script_file),
             "output_file": str(output_file),
-            "stdout": stdout.decode(),
-            "stderr": stderr.decode(),
+            "log_file": str(log_file),
             "return_code": process.returncode,
         }
 
         # If K6 failed, log it but don't raise exception (results are still valid)
         if process.returncode != 0:
-            error_msg = stderr.decode() if stderr else "Unknown K6 error"
+            error_msg = self._read_log_tail(log_file) or "Unknown K6 error"
             logger.warning(f"K6 execution completed with non-zero exit code ({process.returncode}): {error_msg}")
             # Add error info to results but don't fail
             results["execution_info"]["k6_error"] = error_msg
@@ -622,33 +629,55 @@ class K6RunnerService(K6RunnerServiceInterface):
         logger.info(f"K6 execution completed for execution {execution_id}")
         return results
     
+    def log_path(self, execution_id: int) -> Path:
+        """Get the console log file of an execution."""
+        return self.results_path / f"logs_{execution_id}.log"
+    
+    def stream_logs(self, execution_id: int) -> Iterator[str]:
+        """Yield the console log lines of an execution without loading the whole file."""
+        log_file = self.log_path(execution_id)
+        if not log_file.exists():
+            return
+        with open(log_file, 'r', errors='replace') as f:
+            for line in f:
+                yield line.rstrip('\n')
+    
+    def _read_log_tail(self, log_file: Path) -> str:
+        """Read the last bytes of a log file."""
+        try:
+            with open(log_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - _K6_ERROR_TAIL_BYTES))
+                return f.read().decode(errors='replace').strip()
+        except OSError:
+            return ""
+    
     async def parse_k6_results(self, results_path: str) -> Dict:
         """Parse K6 execution results."""
         try:
             # Read summary file if available
             summary_file = f"{results_path}.summary"
             if os.path.exists(summary_file):
-                with open(summary_file, 'r') as f:
-                    summary_data = json.load(f)
+                with open(summary_file, 'rb') as f:
+                    summary_data = orjson.loads(f.read())
                 return self._process_k6_summary(summary_data)
             
             # Fallback to parsing JSON output
             if os.path.exists(results_path):
-                with open(results_path, 'r') as f:
-                    lines = f.readlines()
-                
+                # Streamed line by line; each output line is one JSON point
                 metrics = {}
-                for line in lines:
-                    try:
-                        data = json.loads(line)
-                        if data.get("type") == "Point":
-                            metric_name = data.get("metric")
-                            if metric_name:
-                                if metric_name not in metrics:
-                                    metrics[metric_name] = []
-                                metrics[metric_name].append(data.get("data", {}))
-                    except json.JSONDecodeError:
-                        continue
+                with open(results_path, 'rb') as f:
+                    for line in f:
+                        try:
+                            data = orjson.loads(line)
+                            if data.get("type") == "Point":
+                                metric_name = data.get("metric")
+                                if metric_name:
+                                    if metric_name not in metrics:
+                                        metrics[metric_name] = []
+                                    metrics[metric_name].append(data.get("data", {}))
+                        except orjson.JSONDecodeError:
+                            continue
                 
                 return self._process_k6_metrics(metrics)
             
@@ -7,7 +7,7 @@ import json
 import logging
 import re
 import yaml
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,8 @@ class LocalOpenAPIParser:
     def __init__(self):
         """Initialize parser with spec cache."""
         self._parsed_spec_cache = None
+        # (spec text, parsed spec) of the last successful parse_openapi_spec call
+        self._last_parsed: Optional[Tuple[str, Dict]] = None
 
     async def validate_spec(self, spec_content: str) -> bool:
         """Validate OpenAPI specification format locally."""
@@ -49,46 +51,50 @@ class LocalOpenAPIParser:
 
     async def parse_openapi_spec(self, spec_content: str) -> Dict:
         """Parse OpenAPI specification locally."""
+        # validate_spec() and the caller both parse the same text; reuse the first result
+        if self._last_parsed is not None and self._last_parsed[0] == spec_content:
+            self._parsed_spec_cache = self._last_parsed[1]
+            return self._last_parsed[1]
+
         try:
-            # First try to parse as JSON
-            try:
-                parsed = json.loads(spec_content)
-                self._parsed_spec_cache = parsed
-                return parsed
-            except json.JSONDecodeError:
-                pass
-
-            # Then try to parse as YAML
-            try:
-                parsed = yaml.safe_load(spec_content)
-                self._parsed_spec_cache = parsed
-                return parsed
-            except yaml.YAMLError:
-                pass
-
-            # If both fail, try to clean the content
-            cleaned_content = self._clean_spec_content(spec_content)
-
-            try:
-                parsed = json.loads(cleaned_content)
-                self._parsed_spec_cache = parsed
-                return parsed
-            except json.JSONDecodeError:
-                pass
-
-            try:
-                parsed = yaml.safe_load(cleaned_content)
-                self._parsed_spec_cache = parsed
-                return parsed
-            except yaml.YAMLError:
-                pass
-
-            raise ValueError("Unable to parse specification as JSON or YAML")
+            parsed = self._parse_spec_content(spec_content)
+            self._parsed_spec_cache = parsed
+            self._last_parsed = (spec_content, parsed)
+            return parsed
 
         except Exception as e:
             logger.error(f"Error parsing OpenAPI spec locally: {str(e)}")
             raise
 
+    def _parse_spec_content(self, spec_content: str) -> Dict:
+        """Parse spec text as JSON or YAML, retrying once on cleaned content."""
+        # First try to parse as JSON
+        try:
+            return json.loads(spec_content)
+        except json.JSONDecodeError:
+            pass
+
+        # Then try to parse as YAML
+        try:
+            return yaml.safe_load(spec_content)
+        except yaml.YAMLError:
+            pass
+
+        # If both fail, try to clean the content
+        cleaned_content = self._clean_spec_content(spec_content)
+
+        try:
+            return json.loads(cleaned_content)
+        except json.JSONDecodeError:
+            pass
+
+        try:
+            return yaml.safe_load(cleaned_content)
+        except yaml.YAMLError:
+            pass
+
+        raise ValueError("Unable to parse specification as JSON or YAML")
+
     async def extract_endpoints(self, parsed_spec: Dict) -> List[Dict]:
         """Extract endpoints from parsed OpenAPI spec locally."""
         try:
@@ -3,14 +3,22 @@ PDF Generator and Report Services
 Implementation for PDF generation and technical reporting
 """
 
+import asyncio
+import functools
+import inspect
 import io
 import logging
+import multiprocessing
 import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 from matplotlib.backends.backend_pdf import PdfPages
@@ -35,6 +43,178 @@ logger = logging.getLogger(__name__)
 plt.switch_backend('Agg')
 sns.set_style("whitegrid")
 
+# Chart and PDF rendering (matplotlib/reportlab) is CPU-bound and synchronous; it runs in
+# worker processes so a report build neither blocks the event loop nor holds its GIL
+_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Create the rendering process pool on first use."""
+    global _render_pool
+    if _render_pool is None:
+        # spawn: workers must not inherit the server's event loop and threads via fork
+        _render_pool = ProcessPoolExecutor(
+            max_workers=_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Stop the rendering worker processes (application shutdown)."""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=True, cancel_futures=True)
+        _render_pool = None
+
+
+async def _run_in_render_pool(func: Callable, *args):
+    """Run a picklable callable in the rendering process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_render_pool(), func, *args)
+
+
+# Column layout of the matrix built by _build_results_matrix
+AVG_RT, P95_RT, RPS, SUCCESS_RATE, TOTAL_REQUESTS, ERROR_RATE = range(6)
+
+
+def _build_results_matrix(test_results: List[TestResult]) -> np.ndarray:
+    """Lift the numeric TestResult fields into an (N, 6) float matrix (NaN = missing)."""
+    return np.array(
+        [
+            (
+                r.avg_response_time_ms,
+                r.p95_response_time_ms,
+                r.requests_per_second,
+                r.success_rate_percent,
+                r.total_requests,
+                r.error_rate_percent,
+            )
+            for r in test_results
+        ],
+        dtype=float,
+    ).reshape(-1, 6)
+
+
+def _classify_performance(M: np.ndarray) -> np.ndarray:
+    """Classify each row's performance based on response times and error rates."""
+    rt = M[:, AVG_RT]
+    error_rate = M[:, ERROR_RATE]
+    # First matching condition wins, mirroring the original if/elif chain
+    return np.select(
+        [
+            np.isnan(rt) | (rt == 0),
+            error_rate >= 50,
+            error_rate >= 10,
+            rt < 200,
+            rt < 500,
+            rt < 1000,
+        ],
+        ['Desconocido', 'Crítico', 'Degradado', 'Excelente', 'Bueno', 'Degradado'],
+        default='Crítico',
+    )
+
+
+@dataclass(frozen=True)
+class _RecommendationStats:
+    """Aggregate metrics the recommendation rules are evaluated against (NaN = no data)."""
+    max_avg: float
+    min_success: float
+    throughput_decline: float
+    throughput_drop: float
+
+
+def _recommendation_stats(M: np.ndarray) -> _RecommendationStats:
+    """Compute the recommendation aggregates from the results matrix."""
+    rt = M[:, AVG_RT]
+    rt = rt[~np.isnan(rt) & (rt != 0)]
+    success = M[:, SUCCESS_RATE]
+    success = success[~np.isnan(success)]
+    rps = M[:, RPS]
+    rps = rps[~np.isnan(rps) & (rps != 0)]
+
+    throughput_decline = np.nan
+    if rps.size > 1:
+        # A flat series has no trend; skip the division
+        if np.ptp(rps) == 0 or rps[0] <= 0:
+            throughput_decline = 0.0
+        else:
+            throughput_decline = (rps[-1] - rps[0]) / rps[0] * 100
+
+    return _RecommendationStats(
+        max_avg=float(rt.max()) if rt.size else np.nan,
+        min_success=float(success.min()) if success.size else np.nan,
+        throughput_decline=float(throughput_decline),
+        throughput_drop=float(abs(throughput_decline)),
+    )
+
+
+# Report helpers are pure functions of the result metrics, and the same result set
+# is rendered several times (preview, final, on-demand), so their outputs are memoized.
+# Cached values are shared: callers must treat them as read-only.
+_RESULTS_CACHE_SIZE = 32
+_results_cache: "OrderedDict[tuple, object]" = OrderedDict()
+
+
+def _results_cache_key(test_results: List[TestResult]) -> tuple:
+    """Hashable key covering every TestResult field the report helpers read."""
+    return tuple(
+        (
+            r.result_id,
+            r.execution_id,
+            r.avg_response_time_ms,
+            r.p95_response_time_ms,
+            r.requests_per_second,
+            r.success_rate_percent,
+            r.total_requests,
+            r.failed_requests,
+        )
+        for r in test_results
+    )
+
+
+def _results_cache_get(key: tuple):
+    """Return (hit, value) for key, refreshing its LRU position on a hit."""
+    if key in _results_cache:
+        _results_cache.move_to_end(key)
+        return True, _results_cache[key]
+    return False, None
+
+
+def _results_cache_put(key: tuple, value) -> None:
+    """Store value under key, evicting the least recently used entry when full."""
+    _results_cache[key] = value
+    if len(_results_cache) > _RESULTS_CACHE_SIZE:
+        _results_cache.popitem(last=False)
+
+
+def _memoize_by_results(method):
+    """Memoize a ReportGeneratorService helper on the metrics of its test_results.
+
+    Any extra positional arguments must be hashable; they become part of the key.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, test_results: List[TestResult], *args):
+            key = (method.__name__, _results_cache_key(test_results), args)
+            hit, value = _results_cache_get(key)
+            if not hit:
+                value = await method(self, test_results, *args)
+                _results_cache_put(key, value)
+            return value
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, test_results: List[TestResult], *args):
+        key = (method.__name__, _results_cache_key(test_results), args)
+        hit, value = _results_cache_get(key)
+        if not hit:
+            value = method(self, test_results, *args)
+            _results_cache_put(key, value)
+        return value
+    return wrapper
+
 
 class PDFGeneratorService(PDFGeneratorServiceInterface):
     """PDF generation service using ReportLab."""
@@ -50,6 +230,17 @@ class PDFGeneratorService(PDFGeneratorServiceInterface):
         template: str = None
     ) -> str:
         """Create PDF report from content."""
+        return await _run_in_render_pool(
+            self._render_pdf_report, content, output_filename, template
+        )
+    
+    def _render_pdf_report(
+        self, 
+        content: Dict, 
+        output_filename: str,
+        template: str = None
+    ) -> str:
+        """Build the PDF document (runs in a rendering worker process)."""
         try:
             output_file = self.output_path / output_filename
             
@@ -434,43 +625,41 @@ class PDFGeneratorService(PDFGeneratorServiceInterface):
     async def generate_charts(self, data: Dict) -> List[str]:
         """Generate chart images for PDF."""
         try:
-            chart_paths = []
+            renders = []
             
             # Response time chart
             if 'response_times' in data:
-                response_time_chart = await self._create_response_time_chart(
-                    data['response_times']
-                )
-                chart_paths.append(response_time_chart)
+                renders.append(_run_in_render_pool(
+                    self._create_response_time_chart, data['response_times']
+                ))
             
             # Throughput chart
             if 'throughput' in data:
-                throughput_chart = await self._create_throughput_chart(
-                    data['throughput']
-                )
-                chart_paths.append(throughput_chart)
+                renders.append(_run_in_render_pool(
+                    self._create_throughput_chart, data['throughput']
+                ))
             
             # Error rate chart
             if 'error_rates' in data:
-                error_rate_chart = await self._create_error_rate_chart(
-                    data['error_rates']
-                )
-                chart_paths.append(error_rate_chart)
+                renders.append(_run_in_render_pool(
+                    self._create_error_rate_chart, data['error_rates']
+                ))
             
-            return chart_paths
+            # Charts render in parallel worker processes; order is preserved
+            return list(await asyncio.gather(*renders))
             
         except Exception as e:
             logger.error(f"Error generating charts: {str(e)}")
             return []
     
-    async def _create_response_time_chart(self, response_time_data: List[Dict]) -> str:
+    def _create_response_time_chart(self, response_time_data: Dict[str, List]) -> str:
         """Create enhanced response time chart with degradation analysis."""
         fig, ax = plt.subplots(figsize=(12, 7))
 
         # Extract data
-        scenarios = [item['scenario'] for item in response_time_data]
-        avg_times = [item['avg_response_time'] for item in response_time_data]
-        p95_times = [item['p95_response_time'] for item in response_time_data]
+        scenarios = response_time_data['scenario']
+        avg_times = response_time_data['avg_response_time']
+        p95_times = response_time_data['p95_response_time']
 
         x = range(len(scenarios))
 
@@ -538,12 +727,12 @@ class PDFGeneratorService(PDFGeneratorServiceInterface):
 
         return str(chart_path)
     
-    async def _create_throughput_chart(self, throughput_data: List[Dict]) -> str:
+    def _create_throughput_chart(self, throughput_data: Dict[str, List]) -> str:
         """Create throughput chart."""
         fig, ax = plt.subplots(figsize=(10, 6))
 
-        scenarios = [item['scenario'] for item in throughput_data]
-        rps = [item['requests_per_second'] for item in throughput_data]
+        scenarios = throughput_data['scenario']
+        rps = throughput_data['requests_per_second']
 
         # Color bars based on performance (green=high, yellow=medium, red=low)
         max_rps = max(rps) if rps else 1
@@ -595,12 +784,12 @@ class PDFGeneratorService(PDFGeneratorServiceInterface):
         
         return str(chart_path)
     
-    async def _create_error_rate_chart(self, error_rate_data: List[Dict]) -> str:
+    def _create_error_rate_chart(self, error_rate_data: Dict[str, List]) -> str:
         """Create error rate chart."""
         fig, ax = plt.subplots(figsize=(10, 6))
 
-        scenarios = [item['scenario'] for item in error_rate_data]
-        error_rates = [item['error_rate'] for item in error_rate_data]
+        scenarios = error_rate_data['scenario']
+        error_rates = error_rate_data['error_rate']
 
         colors_list = ['green' if rate < 5 else 'orange' if rate < 10 else 'red' for rate in error_rates]
 
@@ -663,6 +852,38 @@ class PDFGeneratorService(PDFGeneratorServiceInterface):
 class ReportGeneratorService(ReportGeneratorServiceInterface):
     """Report generation service using AI and PDF generator."""
     
+    # (predicate, message template) pairs evaluated in order against _RecommendationStats;
+    # comparisons against NaN are False, so rules without data never fire
+    _RECOMMENDATION_RULES: List[Tuple[Callable[[_RecommendationStats], bool], str]] = [
+        (
+            lambda s: s.max_avg > 1000,
+            "Crítico: Los tiempos de respuesta superan los 1000ms (máx: {max_avg:.1f}ms). "
+            "Considere optimizar las consultas a base de datos, añadir caché o escalar la infraestructura.",
+        ),
+        (
+            lambda s: 500 < s.max_avg <= 1000,
+            "Advertencia: Los tiempos de respuesta se acercan al umbral de 500ms (máx: {max_avg:.1f}ms). "
+            "Monitoree el rendimiento y considere optimización preventiva.",
+        ),
+        (
+            lambda s: s.min_success < 95,
+            "Problema de Tasa de Errores: La tasa de éxito cayó al {min_success:.1f}%. "
+            "Investigue los logs de errores e implemente manejo de errores apropiado y mecanismos de reintento.",
+        ),
+        (
+            lambda s: s.throughput_decline < -20,
+            "Caída de Throughput: Reducción del {throughput_drop:.1f}% en peticiones/segundo. "
+            "El sistema puede estar alcanzando sus límites de capacidad. Considere escalado horizontal.",
+        ),
+    ]
+
+    _DEFAULT_RECOMMENDATIONS = (
+        "El sistema está funcionando dentro de parámetros aceptables.",
+        "Continúe monitoreando durante períodos de uso intenso.",
+        "Considere implementar líneas base de rendimiento para comparaciones futuras.",
+        "Configure alertas automáticas para umbrales de tiempo de respuesta y tasa de errores.",
+    )
+    
     def __init__(self, ai_client: AIClientInterface, pdf_generator: PDFGeneratorService):
         self.ai_client = ai_client
         self.pdf_generator = pdf_generator
@@ -687,6 +908,9 @@ class ReportGeneratorService(ReportGeneratorServiceInterface):
             # Generate charts
             chart_paths = await self.pdf_generator.generate_charts(chart_data)
             
+            # (http_method, endpoint_path) per result, batch-resolved by the caller
+            result_endpoints = job_info.get('result_endpoints') or {}
+
             # Prepare endpoint results if endpoint details are available
             endpoint_results = []
             if 'endpoint_details' in job_info and job_info['endpoint_details']:
@@ -708,7 +932,10 @@ class ReportGeneratorService(ReportGeneratorServiceInterface):
                 'endpoint_results': endpoint_results,  # New structured endpoint results
                 'degradation_analysis': degradation_points,
                 'performance_analysis': analysis,
-                'endpoint_summary': self._generate_endpoint_summary(test_results),
+                'endpoint_summary': self._generate_endpoint_summary(
+                    test_results,
+                    tuple(result_endpoints.get(r.result_id) for r in test_results),
+                ),
                 'recommendations': await self._generate_performance_recommendations(test_results),
             }
             
@@ -829,22 +1056,25 @@ class ReportGeneratorService(ReportGeneratorServiceInterface):
         # Check for response time degradation
         response_times = [r.avg_response_time_ms for r in test_results if r.avg_response_time_ms]
         if len(response_times) > 1:
-            baseline = response_times[0]
-            degraded_scenarios = [i for i, rt in enumerate(response_times) if rt > baseline * 3]
+            threshold = response_times[0] * 3
+            # Only the first degraded scenario is reported, so stop at it
+            first_degraded = next((i for i, rt in enumerate(response_times) if rt > threshold), None)
 
-            if degraded_scenarios:
+            if first_degraded is not None:
                 recommendations.append(
-                    f"Degradación en tiempos de respuesta detectada a partir del escenario {degraded_scenarios[0] + 1}. "
+                    f"Degradación en tiempos de respuesta detectada a partir del escenario {first_degraded + 1}. "
                     "Esto indica que el sistema alcanzó sus límites de rendimiento."
                 )
 
-        # Check for throughput issues
+        # Check for throughput issues (a single sample cannot degrade against itself)
         throughputs = [r.requests_per_second for r in test_results if r.requests_per_second]
-        if throughputs and any(t < max(throughputs) * 0.5 for t in throughputs[-3:]):
-            recommendations.append(
-                "Degradación de throughput observada en los escenarios finales. "
-                "Considere implementar balanceo de carga o estrategias de escalado."
-            )
+        if len(throughputs) > 1:
+            throughput_floor = max(throughputs) * 0.5
+            if any(t < throughput_floor for t in throughputs[-3:]):
+                recommendations.append(
+                    "Degradación de throughput observada en los escenarios finales. "
+                    "Considere implementar balanceo de carga o estrategias de escalado."
+                )
 
         if not recommendations:
             recommendations.append(
@@ -854,76 +1084,99 @@ class ReportGeneratorService(ReportGeneratorServiceInterface):
 
         return recommendations
     
+    @_memoize_by_results
     def _prepare_chart_data(self, test_results: List[TestResult]) -> Dict:
-        """Prepare data for chart generation."""
-        chart_data = {
-            'response_times': [],
-            'throughput': [],
-            'error_rates': [],
+        """Prepare data for chart generation (one list per series)."""
+        values = np.nan_to_num(_build_results_matrix(test_results))
+        scenarios = [f'Escenario {i+1}' for i in range(len(test_results))]
+
+        return {
+            'response_times': {
+                'scenario': scenarios,
+                'avg_response_time': values[:, AVG_RT].tolist(),
+                'p95_response_time': values[:, P95_RT].tolist(),
+            },
+            'throughput': {
+                'scenario': scenarios,
+                'requests_per_second': values[:, RPS].tolist(),
+            },
+            'error_rates': {
+                'scenario': scenarios,
+                'error_rate': values[:, ERROR_RATE].tolist(),
+            },
         }
-        
-        for i, result in enumerate(test_results):
-            chart_data['response_times'].append({
-                'scenario': f'Escenario {i+1}',
-                'avg_response_time': result.avg_response_time_ms or 0,
-                'p95_response_time': result.p95_response_time_ms or 0,
-            })
-
-            chart_data['throughput'].append({
-                'scenario': f'Escenario {i+1}',
-                'requests_per_second': result.requests_per_second or 0,
-            })
-
-            chart_data['error_rates'].append({
-                'scenario': f'Escenario {i+1}',
-                'error_rate': result.error_rate_percent,
-            })
-        
-        return chart_data
     
-    def _format_detailed_results(self, test_results: List[TestResult]) -> List[Dict]:
-        """Format detailed results for PDF table."""
-        detailed_results = []
-        
-        for i, result in enumerate(test_results):
-            detailed_results.append({
-                'name': f'Escenario {i+1}',
-                'avg_response_time': f"{result.avg_response_time_ms or 0:.2f}",
-                'p95_response_time': f"{result.p95_response_time_ms or 0:.2f}",
-                'total_requests': result.total_requests or 0,
-                'success_rate': f"{result.success_rate_percent or 0:.2f}",
-                'rps': f"{result.requests_per_second or 0:.2f}",
-            })
-        
-        return detailed_results
+    @_memoize_by_results
+    def _format_detailed_results(self, test_results: List[TestResult]) -> Dict[str, List]:
+        """Format detailed results for PDF table (one list per column)."""
+        values = np.nan_to_num(_build_results_matrix(test_results))
+
+        return {
+            'name': [f'Escenario {i+1}' for i in range(len(test_results))],
+            'avg_response_time': [f"{v:.2f}" for v in values[:, AVG_RT]],
+            'p95_response_time': [f"{v:.2f}" for v in values[:, P95_RT]],
+            'total_requests': values[:, TOTAL_REQUESTS].astype(int).tolist(),
+            'success_rate': [f"{v:.2f}" for v in values[:, SUCCESS_RATE]],
+            'rps': [f"{v:.2f}" for v in values[:, RPS]],
+        }
 
-    def _generate_endpoint_summary(self, test_results: List[TestResult]) -> Dict:
-        """Generate endpoint-specific summary for CU.3 compliance."""
+    @_memoize_by_results
+    def _generate_endpoint_summary(
+        self,
+        test_results: List[TestResult],
+        endpoint_labels: Tuple[Optional[Tuple[str, str]], ...] = (),
+    ) -> Dict:
+        """Generate endpoint-specific summary for CU.3 compliance.
+
+        endpoint_labels holds the (http_method, endpoint_path) of each result, in
+        the same order as test_results; missing entries fall back to placeholders.
+        """
         if not test_results:
             return {'endpoints': [], 'summary': 'No test results available'}
 
+        M = _build_results_matrix(test_results)
+        values = np.nan_to_num(M)
+        rt = M[:, AVG_RT]
+        degraded_mask = rt > 500  # NaN compares False
+        class_labels = _classify_performance(M)
+
         endpoint_summary = {
             'total_endpoints_tested': len(test_results),
             'endpoints': [],
             'summary': ''
         }
 
-        for i, result in enumerate(test_results):
-            endpoint_info = {
-                'endpoint': f'Endpoint {i+1}',  # In real implementation, this would be actual endpoint path
-                'method': 'GET',  # In real implementation, this would be actual HTTP method
-                'total_requests': result.total_requests or 0,
-                'success_rate': result.success_rate_percent or 0,
-                'avg_response_time': result.avg_response_time_ms or 0,
-                'p95_response_time': result.p95_response_time_ms or 0,
-                'performance_classification': self._classify_performance(result),
-                'degradation_detected': result.avg_response_time_ms > 500 if result.avg_response_time_ms else False
+        for i, (avg_rt, p95, total, success, label, degraded) in enumerate(zip(
+            values[:, AVG_RT], values[:, P95_RT], values[:, TOTAL_REQUESTS],
+            values[:, SUCCESS_RATE], class_labels, degraded_mask
+        )):
+            endpoint_label = endpoint_labels[i] if i < len(endpoint_labels) else None
+            method, path = endpoint_label or ('GET', f'Endpoint {i+1}')
+            endpoint_summary['endpoints'].append({
+                'endpoint': path,
+                'method': method,
+                'total_requests': int(total),
+                'success_rate': float(success),
+                'avg_response_time': float(avg_rt),
+                'p95_response_time': float(p95),
+                'performance_classification': str(label),
+                'degradation_detected': bool(degraded),
+            })
+
+        # Aggregate response time statistics in a single vectorized pass
+        if not np.isnan(rt).all():
+            p50, p95, p99 = np.nanpercentile(rt, [50, 95, 99])
+            endpoint_summary['response_time_stats'] = {
+                'p50': float(p50),
+                'p95': float(p95),
+                'p99': float(p99),
+                'max': float(np.nanmax(rt)),
+                'min': float(np.nanmin(rt)),
             }
-            endpoint_summary['endpoints'].append(endpoint_info)
 
         # Generate summary text
-        healthy_endpoints = sum(1 for ep in endpoint_summary['endpoints'] if ep['performance_classification'] == 'Healthy')
-        degraded_endpoints = sum(1 for ep in endpoint_summary['endpoints'] if ep['degradation_detected'])
+        healthy_endpoints = int(np.isin(class_labels, ('Excelente', 'Bueno')).sum())
+        degraded_endpoints = int(degraded_mask.sum())
 
         endpoint_summary['summary'] = (
             f"Tested {endpoint_summary['total_endpoints_tested']} endpoints. "
@@ -933,84 +1186,21 @@ class ReportGeneratorService(ReportGeneratorServiceInterface):
 
         return endpoint_summary
 
-    def _classify_performance(self, result: TestResult) -> str:
-        """Classify endpoint performance based on response times and error rates."""
-        if not result.avg_response_time_ms:
-            return 'Desconocido'
-
-        # Critical if error rate is very high
-        if result.error_rate_percent >= 50:
-            return 'Crítico'
-
-        # Degraded if error rate is moderate
-        if result.error_rate_percent >= 10:
-            return 'Degradado'
-
-        # Otherwise, classify by response time
-        if result.avg_response_time_ms < 200:
-            return 'Excelente'
-        elif result.avg_response_time_ms < 500:
-            return 'Bueno'
-        elif result.avg_response_time_ms < 1000:
-            return 'Degradado'
-        else:
-            return 'Crítico'
-
+    @_memoize_by_results
     async def _generate_performance_recommendations(self, test_results: List[TestResult]) -> List[str]:
         """Generate performance recommendations based on test results."""
-        recommendations = []
-
         if not test_results:
             return ["No hay resultados de prueba disponibles para análisis."]
 
-        # Analyze average response times
-        avg_times = [result.avg_response_time_ms for result in test_results if result.avg_response_time_ms]
-
-        if avg_times:
-            max_avg_time = max(avg_times)
-            if max_avg_time > 1000:
-                recommendations.append(
-                    f"Crítico: Los tiempos de respuesta superan los 1000ms (máx: {max_avg_time:.1f}ms). "
-                    "Considere optimizar las consultas a base de datos, añadir caché o escalar la infraestructura."
-                )
-            elif max_avg_time > 500:
-                recommendations.append(
-                    f"Advertencia: Los tiempos de respuesta se acercan al umbral de 500ms (máx: {max_avg_time:.1f}ms). "
-                    "Monitoree el rendimiento y considere optimización preventiva."
-                )
-
-        # Analyze success rates
-        success_rates = [result.success_rate_percent for result in test_results if result.success_rate_percent is not None]
-
-        if success_rates:
-            min_success_rate = min(success_rates)
-            if min_success_rate < 95:
-                recommendations.append(
-                    f"Problema de Tasa de Errores: La tasa de éxito cayó al {min_success_rate:.1f}%. "
-                    "Investigue los logs de errores e implemente manejo de errores apropiado y mecanismos de reintento."
-                )
-
-        # Analyze throughput trends
-        rps_values = [result.requests_per_second for result in test_results if result.requests_per_second]
-
-        if len(rps_values) > 1:
-            throughput_decline = ((rps_values[-1] - rps_values[0]) / rps_values[0] * 100) if rps_values[0] > 0 else 0
-            if throughput_decline < -20:
-                recommendations.append(
-                    f"Caída de Throughput: Reducción del {abs(throughput_decline):.1f}% en peticiones/segundo. "
-                    "El sistema puede estar alcanzando sus límites de capacidad. Considere escalado horizontal."
-                )
+        stats = _recommendation_stats(_build_results_matrix(test_results))
+        recommendations = [
+            template.format(**stats.__dict__)
+            for predicate, template in self._RECOMMENDATION_RULES
+            if predicate(stats)
+        ]
 
         # Add general recommendations if no issues found
-        if not recommendations:
-            recommendations.extend([
-                "El sistema está funcionando dentro de parámetros aceptables.",
-                "Continúe monitoreando durante períodos de uso intenso.",
-                "Considere implementar líneas base de rendimiento para comparaciones futuras.",
-                "Configure alertas automáticas para umbrales de tiempo de respuesta y tasa de errores."
-            ])
-
-        return recommendations
+        return recommendations or list(self._DEFAULT_RECOMMENDATIONS)
 
     async def _prepare_endpoint_results(self, endpoint_details: Dict) -> List[Dict]:
         """Prepare endpoint results for PDF generation."""
@@ -1067,38 +1257,31 @@ class ReportGeneratorService(ReportGeneratorServiceInterface):
 
     def _prepare_chart_data_for_endpoint(self, test_results: List, scenarios: List) -> Dict:
         """Prepare chart data for a specific endpoint."""
-        chart_data = {
-            'response_times': [],
-            'throughput': [],
-            'error_rates': [],
-        }
-
-        for i, (result, scenario_data) in enumerate(zip(test_results, scenarios)):
-            scenario = scenario_data['scenario']
-
+        labels = []
+        for i, scenario_data in enumerate(scenarios[:len(test_results)]):
             # Detect if it's warm-up scenario
-            if 'WARM-UP' in scenario.scenario_name:
-                label = 'Warm-up'
+            if 'WARM-UP' in scenario_data['scenario'].scenario_name:
+                labels.append('Warm-up')
             else:
-                label = f'Escenario {i}' if i > 0 else 'Escenario 1'
-
-            chart_data['response_times'].append({
-                'scenario': label,
-                'avg_response_time': result.avg_response_time_ms or 0,
-                'p95_response_time': result.p95_response_time_ms or 0,
-            })
-
-            chart_data['throughput'].append({
-                'scenario': label,
-                'requests_per_second': result.requests_per_second or 0,
-            })
-
-            chart_data['error_rates'].append({
-                'scenario': label,
-                'error_rate': result.error_rate_percent or 0,
-            })
-
-        return chart_data
+                labels.append(f'Escenario {i}' if i > 0 else 'Escenario 1')
+
+        values = np.nan_to_num(_build_results_matrix(test_results[:len(labels)]))
+
+        return {
+            'response_times': {
+                'scenario': labels,
+                'avg_response_time': values[:, AVG_RT].tolist(),
+                'p95_response_time': values[:, P95_RT].tolist(),
+            },
+            'throughput': {
+                'scenario': labels,
+                'requests_per_second': values[:, RPS].tolist(),
+            },
+            'error_rates': {
+                'scenario': labels,
+                'error_rate': values[:, ERROR_RATE].tolist(),
+            },
+        }
 
     def _build_curl_example(self, endpoint, api) -> str:
         """Build CURL example for endpoint."""
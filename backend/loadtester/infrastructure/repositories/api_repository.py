@@ -4,19 +4,26 @@ SQLAlchemy implementation of API repository interface
 """
 
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import bindparam, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from loadtester.domain.entities.domain_entities import API
 from loadtester.domain.interfaces.domain_interfaces import APIRepositoryInterface
-from loadtester.infrastructure.database.database_models import APIModel, EndpointModel
+from loadtester.infrastructure.database.database_models import APIModel
+from loadtester.infrastructure.database.unit_of_work import commit_or_flush
 from loadtester.shared.exceptions.infrastructure_exceptions import DatabaseError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming bulk results
+_STREAM_BATCH_SIZE = 500
+
+# Hot statements built once so every call hits the same compiled-SQL cache entry
+_GET_API_BY_ID = select(APIModel).where(APIModel.api_id == bindparam("id"))
+_GET_API_BY_NAME = select(APIModel).where(APIModel.api_name == bindparam("name"))
+
 
 class APIRepository(APIRepositoryInterface):
     """SQLAlchemy implementation of API repository."""
@@ -35,8 +42,7 @@ class APIRepository(APIRepositoryInterface):
             )
             
             self.session.add(api_model)
-            await self.session.commit()
-            await self.session.refresh(api_model)
+            await commit_or_flush(self.session)
             
             logger.info(f"Created API: {api_model.api_name} (ID: {api_model.api_id})")
             
@@ -50,13 +56,7 @@ class APIRepository(APIRepositoryInterface):
     async def get_by_id(self, api_id: int) -> Optional[API]:
         """Get API by ID."""
         try:
-            stmt = (
-                select(APIModel)
-                .options(selectinload(APIModel.endpoints))
-                .where(APIModel.api_id == api_id)
-            )
-            
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_API_BY_ID, {"id": api_id})
             api_model = result.scalar_one_or_none()
             
             if not api_model:
@@ -71,13 +71,7 @@ class APIRepository(APIRepositoryInterface):
     async def get_by_name(self, name: str) -> Optional[API]:
         """Get API by name."""
         try:
-            stmt = (
-                select(APIModel)
-                .options(selectinload(APIModel.endpoints))
-                .where(APIModel.api_name == name)
-            )
-            
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_API_BY_NAME, {"name": name})
             api_model = result.scalar_one_or_none()
             
             if not api_model:
@@ -91,18 +85,21 @@ class APIRepository(APIRepositoryInterface):
     
     async def get_all(self) -> List[API]:
         """Get all APIs."""
+        return [api async for api in self.iter_all()]
+    
+    async def iter_all(self) -> AsyncIterator[API]:
+        """Stream all active APIs in batches instead of materializing every row."""
         try:
             stmt = (
                 select(APIModel)
-                .options(selectinload(APIModel.endpoints))
                 .where(APIModel.active == True)
                 .order_by(APIModel.created_at.desc())
+                .execution_options(yield_per=_STREAM_BATCH_SIZE)
             )
             
-            result = await self.session.execute(stmt)
-            api_models = result.scalars().all()
-            
-            return [self._model_to_entity(model) for model in api_models]
+            api_models = await self.session.stream_scalars(stmt)
+            async for model in api_models:
+                yield self._model_to_entity(model)
             
         except Exception as e:
             logger.error(f"Error getting all APIs: {str(e)}")
@@ -132,7 +129,7 @@ class APIRepository(APIRepositoryInterface):
             if not updated_model:
                 raise NotFoundError(f"API with ID {api.api_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Updated API: {updated_model.api_name} (ID: {updated_model.api_id})")
             
@@ -150,16 +147,15 @@ class APIRepository(APIRepositoryInterface):
                 update(APIModel)
                 .where(APIModel.api_id == api_id)
                 .values(active=False)
-                .returning(APIModel.api_id)
+                .execution_options(synchronize_session=False)
             )
             
             result = await self.session.execute(stmt)
-            deleted_id = result.scalar_one_or_none()
             
-            if not deleted_id:
+            if result.rowcount == 0:
                 raise NotFoundError(f"API with ID {api_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Deleted API: {api_id}")
             return True
@@ -171,8 +167,6 @@ class APIRepository(APIRepositoryInterface):
     
     def _model_to_entity(self, model: APIModel) -> API:
         """Convert database model to domain entity."""
-        from loadtester.infrastructure.repositories.endpoint_repository import EndpointRepository
-        
         api = API(
             api_id=model.api_id,
             api_name=model.api_name,
@@ -183,7 +177,7 @@ class APIRepository(APIRepositoryInterface):
             active=model.active,
         )
         
-        # Don't load endpoints here to avoid lazy loading issues
-        # Endpoints will be loaded separately when needed
+        # Endpoints are not loaded by this repository; use
+        # EndpointRepository.get_by_api_id when they are needed
         
         return api
\ No newline at end of file
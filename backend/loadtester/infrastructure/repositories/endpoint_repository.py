@@ -5,7 +5,7 @@ SQLAlchemy implementation of Endpoint repository interface
 
 import json
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,10 +14,14 @@ from sqlalchemy.orm import selectinload
 from loadtester.domain.entities.domain_entities import Endpoint, AuthConfig, AuthType, API
 from loadtester.domain.interfaces.domain_interfaces import EndpointRepositoryInterface
 from loadtester.infrastructure.database.database_models import EndpointModel, APIModel
+from loadtester.infrastructure.database.unit_of_work import commit_or_flush
 from loadtester.shared.exceptions.infrastructure_exceptions import DatabaseError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Plain dict lookup instead of AuthType(value) for every stored auth config
+_AUTH_TYPE_BY_VALUE = {auth_type.value: auth_type for auth_type in AuthType}
+
 
 class EndpointRepository(EndpointRepositoryInterface):
     """SQLAlchemy implementation of Endpoint repository."""
@@ -28,26 +32,10 @@ class EndpointRepository(EndpointRepositoryInterface):
     async def create(self, endpoint: Endpoint) -> Endpoint:
         """Create a new endpoint."""
         try:
-            endpoint_model = EndpointModel(
-                api_id=endpoint.api_id,
-                endpoint_name=endpoint.endpoint_name,
-                http_method=endpoint.http_method,
-                endpoint_path=endpoint.endpoint_path,
-                description=endpoint.description,
-                expected_volumetry=endpoint.expected_volumetry,
-                expected_concurrent_users=endpoint.expected_concurrent_users,
-                auth_type=endpoint.auth_config.auth_type.value if endpoint.auth_config else None,
-                auth_config=json.dumps(self._auth_config_to_dict(endpoint.auth_config)) if endpoint.auth_config else None,
-                headers_config=json.dumps(endpoint.headers_config) if endpoint.headers_config else None,
-                payload_template=json.dumps(endpoint.payload_template) if endpoint.payload_template else None,
-                schema=json.dumps(endpoint.schema) if endpoint.schema else None,
-                timeout_ms=endpoint.timeout_ms,
-                active=endpoint.active,
-            )
+            endpoint_model = self._entity_to_model(endpoint)
 
             self.session.add(endpoint_model)
-            await self.session.commit()
-            await self.session.refresh(endpoint_model, attribute_names=['endpoint_id', 'created_at', 'updated_at'])
+            await commit_or_flush(self.session)
 
             logger.info(f"Created endpoint: {endpoint_model.http_method} {endpoint_model.endpoint_path}")
 
@@ -67,6 +55,36 @@ class EndpointRepository(EndpointRepositoryInterface):
             logger.error(f"Error creating endpoint: {str(e)}")
             raise DatabaseError(f"Failed to create endpoint: {str(e)}")
     
+    async def create_many(self, endpoints: List[Endpoint]) -> List[Endpoint]:
+        """Create several endpoints in a single flush and commit."""
+        if not endpoints:
+            return []
+
+        try:
+            endpoint_models = [self._entity_to_model(endpoint) for endpoint in endpoints]
+
+            self.session.add_all(endpoint_models)
+            await commit_or_flush(self.session)
+
+            logger.info(f"Created {len(endpoint_models)} endpoints")
+
+            # Reload all of them with the API relationship in one query, keeping input order
+            endpoint_ids = [model.endpoint_id for model in endpoint_models]
+            stmt = (
+                select(EndpointModel)
+                .options(selectinload(EndpointModel.api))
+                .where(EndpointModel.endpoint_id.in_(endpoint_ids))
+            )
+            result = await self.session.execute(stmt)
+            models_by_id = {model.endpoint_id: model for model in result.scalars()}
+
+            return [self._model_to_entity(models_by_id[endpoint_id]) for endpoint_id in endpoint_ids]
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error creating endpoints: {str(e)}")
+            raise DatabaseError(f"Failed to create endpoints: {str(e)}")
+    
     async def get_by_id(self, endpoint_id: int) -> Optional[Endpoint]:
         """Get endpoint by ID."""
         try:
@@ -88,6 +106,26 @@ class EndpointRepository(EndpointRepositoryInterface):
             logger.error(f"Error getting endpoint by ID {endpoint_id}: {str(e)}")
             raise DatabaseError(f"Failed to get endpoint: {str(e)}")
     
+    async def get_by_ids(self, endpoint_ids: List[int]) -> Dict[int, Endpoint]:
+        """Get several endpoints in a single query, keyed by endpoint ID."""
+        if not endpoint_ids:
+            return {}
+
+        try:
+            stmt = (
+                select(EndpointModel)
+                .options(selectinload(EndpointModel.api))
+                .where(EndpointModel.endpoint_id.in_(set(endpoint_ids)))
+            )
+
+            result = await self.session.execute(stmt)
+
+            return {model.endpoint_id: self._model_to_entity(model) for model in result.scalars()}
+
+        except Exception as e:
+            logger.error(f"Error getting endpoints by IDs {endpoint_ids}: {str(e)}")
+            raise DatabaseError(f"Failed to get endpoints: {str(e)}")
+    
     async def get_by_api_id(self, api_id: int) -> List[Endpoint]:
         """Get all endpoints for an API."""
         try:
@@ -165,7 +203,7 @@ class EndpointRepository(EndpointRepositoryInterface):
             if not updated_model:
                 raise NotFoundError(f"Endpoint with ID {endpoint.endpoint_id} not found")
 
-            await self.session.commit()
+            await commit_or_flush(self.session)
 
             logger.info(f"Updated endpoint: {updated_model.http_method} {updated_model.endpoint_path}")
 
@@ -201,7 +239,7 @@ class EndpointRepository(EndpointRepositoryInterface):
             if not deleted_id:
                 raise NotFoundError(f"Endpoint with ID {endpoint_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Deleted endpoint: {endpoint_id}")
             return True
@@ -211,6 +249,25 @@ class EndpointRepository(EndpointRepositoryInterface):
             logger.error(f"Error deleting endpoint {endpoint_id}: {str(e)}")
             raise DatabaseError(f"Failed to delete endpoint: {str(e)}")
     
+    def _entity_to_model(self, endpoint: Endpoint) -> EndpointModel:
+        """Convert domain entity to a new database model."""
+        return EndpointModel(
+            api_id=endpoint.api_id,
+            endpoint_name=endpoint.endpoint_name,
+            http_method=endpoint.http_method,
+            endpoint_path=endpoint.endpoint_path,
+            description=endpoint.description,
+            expected_volumetry=endpoint.expected_volumetry,
+            expected_concurrent_users=endpoint.expected_concurrent_users,
+            auth_type=endpoint.auth_config.auth_type.value if endpoint.auth_config else None,
+            auth_config=json.dumps(self._auth_config_to_dict(endpoint.auth_config)) if endpoint.auth_config else None,
+            headers_config=json.dumps(endpoint.headers_config) if endpoint.headers_config else None,
+            payload_template=json.dumps(endpoint.payload_template) if endpoint.payload_template else None,
+            schema=json.dumps(endpoint.schema) if endpoint.schema else None,
+            timeout_ms=endpoint.timeout_ms,
+            active=endpoint.active,
+        )
+    
     def _model_to_entity(self, model: EndpointModel) -> Endpoint:
         """Convert database model to domain entity."""
         # Parse auth config
@@ -219,13 +276,13 @@ class EndpointRepository(EndpointRepositoryInterface):
             try:
                 auth_data = json.loads(model.auth_config)
                 auth_config = AuthConfig(
-                    auth_type=AuthType(auth_data.get("auth_type", "none")),
+                    auth_type=_AUTH_TYPE_BY_VALUE[auth_data.get("auth_type", "none")],
                     token=auth_data.get("token"),
                     api_key=auth_data.get("api_key"),
                     header_name=auth_data.get("header_name"),
                     query_param_name=auth_data.get("query_param_name"),
                 )
-            except (json.JSONDecodeError, ValueError) as e:
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
                 logger.warning(f"Error parsing auth config: {str(e)}")
 
         # Parse headers config
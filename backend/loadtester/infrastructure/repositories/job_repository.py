@@ -3,21 +3,54 @@ Job Repository Implementation
 SQLAlchemy implementation of Job repository interface
 """
 
-import json
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import bindparam, delete, func, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from loadtester.domain.entities.domain_entities import Job, JobStatus
 from loadtester.domain.interfaces.domain_interfaces import JobRepositoryInterface
 from loadtester.infrastructure.database.database_models import JobModel
+from loadtester.infrastructure.database.unit_of_work import commit_or_flush
 from loadtester.shared.exceptions.infrastructure_exceptions import DatabaseError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming bulk results
+_STREAM_BATCH_SIZE = 500
+_CLEANUP_BATCH_SIZE = 1000
+
+# Plain dict lookup instead of JobStatus(value) for every converted row
+_STATUS_BY_VALUE = {status.value: status for status in JobStatus}
+
+# Hot statements built once so every call hits the same compiled-SQL cache entry
+_GET_JOB_BY_ID = select(JobModel).where(JobModel.job_id == bindparam("id"))
+_GET_PENDING_JOBS = (
+    select(JobModel)
+    .where(JobModel.status == JobStatus.PENDING.value)
+    .order_by(JobModel.created_at.asc())
+    .execution_options(yield_per=_STREAM_BATCH_SIZE)
+)
+_GET_RUNNING_JOBS = (
+    select(JobModel)
+    .where(JobModel.status == JobStatus.RUNNING.value)
+    .order_by(JobModel.started_at.asc())
+)
+_COUNT_JOBS_BY_STATUS = (
+    select(func.count())
+    .select_from(JobModel)
+    .where(JobModel.status == bindparam("status"))
+)
+_NEXT_PENDING_JOB_ID = (
+    select(JobModel.job_id)
+    .where(JobModel.status == JobStatus.PENDING.value)
+    .order_by(JobModel.created_at.asc())
+    .limit(1)
+)
+
 
 class JobRepository(JobRepositoryInterface):
     """SQLAlchemy implementation of Job repository."""
@@ -33,10 +66,12 @@ class JobRepository(JobRepositoryInterface):
                 job_type=job.job_type,
                 status=job.status.value,
                 progress_percentage=job.progress_percentage,
-                result_data=json.dumps(job.result_data) if job.result_data else None,
+                result_data=job.result_data or None,
                 error_message=job.error_message,
                 callback_url=job.callback_url,
                 callback_sent=job.callback_sent,
+                # Stamped here with microsecond precision: next_pending_id orders by it,
+                # and SQLite's CURRENT_TIMESTAMP only has one-second resolution
                 created_at=job.created_at or datetime.utcnow(),
                 started_at=job.started_at,
                 finished_at=job.finished_at,
@@ -44,8 +79,7 @@ class JobRepository(JobRepositoryInterface):
             )
 
             self.session.add(job_model)
-            await self.session.commit()
-            await self.session.refresh(job_model)
+            await commit_or_flush(self.session)
 
             logger.info(f"Created job: {job_model.job_type} (ID: {job_model.job_id})")
 
@@ -59,9 +93,7 @@ class JobRepository(JobRepositoryInterface):
     async def get_by_id(self, job_id: str) -> Optional[Job]:
         """Get job by ID."""
         try:
-            stmt = select(JobModel).where(JobModel.job_id == job_id)
-
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_JOB_BY_ID, {"id": job_id})
             job_model = result.scalar_one_or_none()
 
             if not job_model:
@@ -75,32 +107,45 @@ class JobRepository(JobRepositoryInterface):
     
     async def get_pending_jobs(self) -> List[Job]:
         """Get all pending jobs."""
+        return [job async for job in self.iter_pending_jobs()]
+    
+    async def iter_pending_jobs(self) -> AsyncIterator[Job]:
+        """Stream pending jobs in batches, oldest first."""
         try:
-            stmt = (
-                select(JobModel)
-                .where(JobModel.status == JobStatus.PENDING.value)
-                .order_by(JobModel.created_at.asc())
-            )
-            
-            result = await self.session.execute(stmt)
-            job_models = result.scalars().all()
-            
-            return [self._model_to_entity(model) for model in job_models]
+            job_models = await self.session.stream_scalars(_GET_PENDING_JOBS)
+            async for model in job_models:
+                yield self._model_to_entity(model)
             
         except Exception as e:
             logger.error(f"Error getting pending jobs: {str(e)}")
             raise DatabaseError(f"Failed to get pending jobs: {str(e)}")
     
+    async def count_pending(self) -> int:
+        """Count pending jobs without loading them."""
+        try:
+            result = await self.session.execute(
+                _COUNT_JOBS_BY_STATUS, {"status": JobStatus.PENDING.value}
+            )
+            return result.scalar_one()
+            
+        except Exception as e:
+            logger.error(f"Error counting pending jobs: {str(e)}")
+            raise DatabaseError(f"Failed to count pending jobs: {str(e)}")
+    
+    async def next_pending_id(self) -> Optional[str]:
+        """Get the ID of the oldest pending job."""
+        try:
+            result = await self.session.execute(_NEXT_PENDING_JOB_ID)
+            return result.scalar_one_or_none()
+            
+        except Exception as e:
+            logger.error(f"Error getting next pending job: {str(e)}")
+            raise DatabaseError(f"Failed to get next pending job: {str(e)}")
+    
     async def get_running_jobs(self) -> List[Job]:
         """Get all running jobs."""
         try:
-            stmt = (
-                select(JobModel)
-                .where(JobModel.status == JobStatus.RUNNING.value)
-                .order_by(JobModel.started_at.asc())
-            )
-
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_RUNNING_JOBS)
             job_models = result.scalars().all()
 
             return [self._model_to_entity(model) for model in job_models]
@@ -109,19 +154,35 @@ class JobRepository(JobRepositoryInterface):
             logger.error(f"Error getting running jobs: {str(e)}")
             raise DatabaseError(f"Failed to get running jobs: {str(e)}")
     
+    async def count_running(self) -> int:
+        """Count running jobs without loading them."""
+        try:
+            result = await self.session.execute(
+                _COUNT_JOBS_BY_STATUS, {"status": JobStatus.RUNNING.value}
+            )
+            return result.scalar_one()
+
+        except Exception as e:
+            logger.error(f"Error counting running jobs: {str(e)}")
+            raise DatabaseError(f"Failed to count running jobs: {str(e)}")
+    
     async def get_jobs_by_type(self, job_type: str) -> List[Job]:
         """Get jobs by type."""
+        return [job async for job in self.iter_jobs_by_type(job_type)]
+    
+    async def iter_jobs_by_type(self, job_type: str) -> AsyncIterator[Job]:
+        """Stream jobs of a given type in batches, newest first."""
         try:
             stmt = (
                 select(JobModel)
                 .where(JobModel.job_type == job_type)
                 .order_by(JobModel.created_at.desc())
+                .execution_options(yield_per=_STREAM_BATCH_SIZE)
             )
             
-            result = await self.session.execute(stmt)
-            job_models = result.scalars().all()
-            
-            return [self._model_to_entity(model) for model in job_models]
+            job_models = await self.session.stream_scalars(stmt)
+            async for model in job_models:
+                yield self._model_to_entity(model)
             
         except Exception as e:
             logger.error(f"Error getting jobs by type {job_type}: {str(e)}")
@@ -136,7 +197,7 @@ class JobRepository(JobRepositoryInterface):
                 .values(
                     status=job.status.value,
                     progress_percentage=job.progress_percentage,
-                    result_data=json.dumps(job.result_data) if job.result_data else None,
+                    result_data=job.result_data or None,
                     error_message=job.error_message,
                     callback_sent=job.callback_sent,
                     started_at=job.started_at,
@@ -151,7 +212,7 @@ class JobRepository(JobRepositoryInterface):
             if not updated_model:
                 raise NotFoundError(f"Job with ID {job.job_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.debug(f"Updated job: {updated_model.job_id} - {updated_model.status}")
             
@@ -173,7 +234,7 @@ class JobRepository(JobRepositoryInterface):
             if rows_affected == 0:
                 raise NotFoundError(f"Job with ID {job_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Deleted job: {job_id}")
             return True
@@ -188,18 +249,29 @@ class JobRepository(JobRepositoryInterface):
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days)
             
-            stmt = (
-                delete(JobModel)
+            # Delete in bounded batches (walking ix_jobs_cleanup) and commit each
+            # one, so a large backlog never holds the write lock in one long statement
+            batch_ids = (
+                select(JobModel.job_id)
                 .where(
                     JobModel.status.in_([JobStatus.FINISHED.value, JobStatus.FAILED.value]),
                     JobModel.finished_at < cutoff_date
                 )
+                .limit(_CLEANUP_BATCH_SIZE)
+            )
+            stmt = (
+                delete(JobModel)
+                .where(JobModel.job_id.in_(batch_ids.scalar_subquery()))
+                .execution_options(synchronize_session=False)
             )
             
-            result = await self.session.execute(stmt)
-            deleted_count = result.rowcount
-            
-            await self.session.commit()
+            deleted_count = 0
+            while True:
+                result = await self.session.execute(stmt)
+                await commit_or_flush(self.session)
+                deleted_count += result.rowcount
+                if result.rowcount < _CLEANUP_BATCH_SIZE:
+                    break
             
             logger.info(f"Cleaned up {deleted_count} old jobs older than {days} days")
             return deleted_count
@@ -214,6 +286,7 @@ class JobRepository(JobRepositoryInterface):
         try:
             stmt = (
                 select(JobModel)
+                .options(defer(JobModel.result_data))
                 .where(
                     JobModel.status == JobStatus.FINISHED.value,
                     JobModel.callback_url.isnot(None),
@@ -238,16 +311,15 @@ class JobRepository(JobRepositoryInterface):
                 update(JobModel)
                 .where(JobModel.job_id == job_id)
                 .values(callback_sent=True)
-                .returning(JobModel.job_id)
+                .execution_options(synchronize_session=False)
             )
             
             result = await self.session.execute(stmt)
-            updated_id = result.scalar_one_or_none()
             
-            if not updated_id:
+            if result.rowcount == 0:
                 raise NotFoundError(f"Job with ID {job_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Marked callback as sent for job: {job_id}")
             return True
@@ -256,15 +328,46 @@ class JobRepository(JobRepositoryInterface):
             await self.session.rollback()
             logger.error(f"Error marking callback sent for job {job_id}: {str(e)}")
             raise DatabaseError(f"Failed to mark callback sent: {str(e)}")
-    
+
+    async def mark_callbacks_sent(self, job_ids: List[str]) -> int:
+        """Mark callbacks as sent for several jobs and return count of updated jobs."""
+        if not job_ids:
+            return 0
+
+        try:
+            stmt = (
+                update(JobModel)
+                .where(JobModel.job_id.in_(set(job_ids)))
+                .values(callback_sent=True)
+                .execution_options(synchronize_session=False)
+            )
+
+            result = await self.session.execute(stmt)
+            updated_count = result.rowcount
+
+            await commit_or_flush(self.session)
+
+            logger.info(f"Marked callbacks as sent for {updated_count} jobs")
+            return updated_count
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error marking callbacks sent for {len(job_ids)} jobs: {str(e)}")
+            raise DatabaseError(f"Failed to mark callbacks sent: {str(e)}")
+
     def _model_to_entity(self, model: JobModel) -> Job:
         """Convert database model to domain entity."""
+        # result_data is deferred by metadata-only queries; never lazy-load it here
+        result_data = None
+        if "result_data" not in inspect(model).unloaded:
+            result_data = model.result_data or None
+
         return Job(
             job_id=model.job_id,
             job_type=model.job_type,
-            status=JobStatus(model.status),
+            status=_STATUS_BY_VALUE[model.status],
             progress_percentage=model.progress_percentage,
-            result_data=json.loads(model.result_data) if model.result_data else None,
+            result_data=result_data,
             error_message=model.error_message,
             callback_url=model.callback_url,
             callback_sent=model.callback_sent,
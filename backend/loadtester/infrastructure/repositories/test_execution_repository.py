@@ -4,43 +4,95 @@ SQLAlchemy implementation of TestExecution repository interface
 """
 
 import logging
-from typing import List, Optional
+from dataclasses import fields
+from operator import attrgetter
+from typing import AsyncIterator, Dict, List, Optional
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import bindparam, insert, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from loadtester.domain.entities.domain_entities import TestExecution, ExecutionStatus
 from loadtester.domain.interfaces.domain_interfaces import TestExecutionRepositoryInterface
 from loadtester.infrastructure.database.database_models import TestExecutionModel
+from loadtester.infrastructure.database.unit_of_work import commit_or_flush
 from loadtester.shared.exceptions.infrastructure_exceptions import DatabaseError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming bulk results
+_STREAM_BATCH_SIZE = 500
+
+# Plain dict lookup instead of ExecutionStatus(value) for every converted row
+_STATUS_BY_VALUE = {status.value: status for status in ExecutionStatus}
+
+# Hot statements built once so every call hits the same compiled-SQL cache entry
+_GET_EXECUTION_BY_ID = select(TestExecutionModel).where(
+    TestExecutionModel.execution_id == bindparam("id")
+)
+_GET_EXECUTIONS_BY_SCENARIO = (
+    select(TestExecutionModel)
+    .where(TestExecutionModel.scenario_id == bindparam("scenario_id"))
+    .order_by(TestExecutionModel.start_time.desc())
+    .execution_options(yield_per=_STREAM_BATCH_SIZE)
+)
+_GET_EXECUTIONS_BY_JOB = (
+    select(TestExecutionModel)
+    .options(raiseload("*"))
+    .where(TestExecutionModel.job_id == bindparam("job_id"))
+    .order_by(TestExecutionModel.execution_id.asc())
+)
+_GET_RUNNING_EXECUTIONS = (
+    select(TestExecutionModel)
+    .where(TestExecutionModel.status == ExecutionStatus.RUNNING.value)
+    .order_by(TestExecutionModel.start_time.desc())
+    .execution_options(yield_per=_STREAM_BATCH_SIZE)
+)
+# Core INSERT ... RETURNING: one compiled statement, no unit-of-work flush per create
+_INSERT_EXECUTION = insert(TestExecutionModel).returning(TestExecutionModel)
+_DELETE_EXECUTION = delete(TestExecutionModel).where(
+    TestExecutionModel.execution_id == bindparam("id")
+)
+
+# Plain columns written by update() (status is mapped to its value separately)
+_UPDATABLE_COLUMNS = (
+    "execution_name",
+    "start_time",
+    "end_time",
+    "actual_duration_seconds",
+    "k6_script_used",
+    "execution_logs",
+)
+_get_updatable_values = attrgetter(*_UPDATABLE_COLUMNS)
+# create() additionally sets the owning scenario/job and the executor
+_INSERT_COLUMNS = ("scenario_id", "job_id", "executed_by") + _UPDATABLE_COLUMNS
+_get_insert_values = attrgetter(*_INSERT_COLUMNS)
+
+# Entity fields copied straight from the model (status is mapped, test_result is not stored)
+_ENTITY_FIELDS = tuple(
+    f.name for f in fields(TestExecution) if f.name not in ("status", "test_result")
+)
+_get_entity_fields = attrgetter(*_ENTITY_FIELDS)
+_ENTITY_SLOT_SETTERS = tuple(getattr(TestExecution, name).__set__ for name in _ENTITY_FIELDS)
+
 
 class TestExecutionRepository(TestExecutionRepositoryInterface):
     """SQLAlchemy implementation of TestExecution repository."""
     
     def __init__(self, session: AsyncSession):
         self.session = session
+        # get_by_id memo for the lifetime of this (request-scoped) repository
+        self._get_cache: Dict[int, TestExecution] = {}
     
     async def create(self, execution: TestExecution) -> TestExecution:
         """Create a new test execution."""
         try:
-            execution_model = TestExecutionModel(
-                scenario_id=execution.scenario_id,
-                execution_name=execution.execution_name,
-                start_time=execution.start_time,
-                end_time=execution.end_time,
-                status=execution.status.value,
-                actual_duration_seconds=execution.actual_duration_seconds,
-                k6_script_used=execution.k6_script_used,
-                execution_logs=execution.execution_logs,
-                executed_by=execution.executed_by,
-            )
-            
-            self.session.add(execution_model)
-            await self.session.commit()
-            await self.session.refresh(execution_model)
+            values = dict(zip(_INSERT_COLUMNS, _get_insert_values(execution)))
+            values["status"] = execution.status.value
+            execution_model = (
+                await self.session.scalars(_INSERT_EXECUTION, [values])
+            ).one()
+            await commit_or_flush(self.session)
             
             logger.info(f"Created test execution: {execution_model.execution_name}")
             
@@ -53,34 +105,65 @@ class TestExecutionRepository(TestExecutionRepositoryInterface):
     
     async def get_by_id(self, execution_id: int) -> Optional[TestExecution]:
         """Get test execution by ID."""
+        if execution_id in self._get_cache:
+            return self._get_cache[execution_id]
+        
         try:
-            stmt = select(TestExecutionModel).where(TestExecutionModel.execution_id == execution_id)
-            
-            result = await self.session.execute(stmt)
-            execution_model = result.scalar_one_or_none()
+            execution_model = (
+                await self.session.scalars(_GET_EXECUTION_BY_ID, {"id": execution_id})
+            ).one_or_none()
             
             if not execution_model:
                 return None
             
-            return self._model_to_entity(execution_model)
+            execution = self._model_to_entity(execution_model)
+            self._get_cache[execution_id] = execution
+            return execution
             
         except Exception as e:
             logger.error(f"Error getting test execution by ID {execution_id}: {str(e)}")
             raise DatabaseError(f"Failed to get test execution: {str(e)}")
     
-    async def get_by_scenario_id(self, scenario_id: int) -> List[TestExecution]:
-        """Get all executions for a scenario."""
+    async def get_by_ids(self, execution_ids: List[int]) -> Dict[int, TestExecution]:
+        """Get several test executions in a single query, keyed by execution ID."""
+        if not execution_ids:
+            return {}
+        
         try:
-            stmt = (
-                select(TestExecutionModel)
-                .where(TestExecutionModel.scenario_id == scenario_id)
-                .order_by(TestExecutionModel.start_time.desc())
+            stmt = select(TestExecutionModel).where(
+                TestExecutionModel.execution_id.in_(set(execution_ids))
             )
             
-            result = await self.session.execute(stmt)
-            execution_models = result.scalars().all()
+            execution_models = await self.session.scalars(stmt)
             
-            return [self._model_to_entity(model) for model in execution_models]
+            return {model.execution_id: self._model_to_entity(model) for model in execution_models}
+            
+        except Exception as e:
+            logger.error(f"Error getting test executions by IDs {execution_ids}: {str(e)}")
+            raise DatabaseError(f"Failed to get test executions: {str(e)}")
+    
+    async def get_by_scenario_id(self, scenario_id: int) -> List[TestExecution]:
+        """Get all executions for a scenario."""
+        try:
+            executions = []
+            async for batch in self._stream_batches(
+                _GET_EXECUTIONS_BY_SCENARIO, {"scenario_id": scenario_id}
+            ):
+                executions.extend(batch)
+            return executions
+            
+        except Exception as e:
+            logger.error(f"Error getting executions for scenario {scenario_id}: {str(e)}")
+            raise DatabaseError(f"Failed to get executions: {str(e)}")
+    
+    async def iter_by_scenario_id(self, scenario_id: int) -> AsyncIterator[TestExecution]:
+        """Stream executions for a scenario in batches, newest first."""
+        try:
+            async for batch in self._stream_batches(
+                _GET_EXECUTIONS_BY_SCENARIO, {"scenario_id": scenario_id}
+            ):
+                for execution in batch:
+                    yield execution
             
         except Exception as e:
             logger.error(f"Error getting executions for scenario {scenario_id}: {str(e)}")
@@ -89,9 +172,11 @@ class TestExecutionRepository(TestExecutionRepositoryInterface):
     async def get_by_job_id(self, job_id: str) -> List[TestExecution]:
         """Get all executions for a job."""
         try:
-            # This would require a job-execution relationship in the database
-            # For now, return empty list - would need to implement this relationship
-            return []
+            execution_models = await self.session.scalars(
+                _GET_EXECUTIONS_BY_JOB, {"job_id": job_id}
+            )
+            
+            return [self._model_to_entity(model) for model in execution_models]
             
         except Exception as e:
             logger.error(f"Error getting executions for job {job_id}: {str(e)}")
@@ -100,16 +185,21 @@ class TestExecutionRepository(TestExecutionRepositoryInterface):
     async def get_running_executions(self) -> List[TestExecution]:
         """Get all currently running executions."""
         try:
-            stmt = (
-                select(TestExecutionModel)
-                .where(TestExecutionModel.status == ExecutionStatus.RUNNING.value)
-                .order_by(TestExecutionModel.start_time.desc())
-            )
+            executions = []
+            async for batch in self._stream_batches(_GET_RUNNING_EXECUTIONS):
+                executions.extend(batch)
+            return executions
             
-            result = await self.session.execute(stmt)
-            execution_models = result.scalars().all()
-            
-            return [self._model_to_entity(model) for model in execution_models]
+        except Exception as e:
+            logger.error(f"Error getting running executions: {str(e)}")
+            raise DatabaseError(f"Failed to get running executions: {str(e)}")
+    
+    async def iter_running_executions(self) -> AsyncIterator[TestExecution]:
+        """Stream currently running executions in batches, newest first."""
+        try:
+            async for batch in self._stream_batches(_GET_RUNNING_EXECUTIONS):
+                for execution in batch:
+                    yield execution
             
         except Exception as e:
             logger.error(f"Error getting running executions: {str(e)}")
@@ -117,6 +207,7 @@ class TestExecutionRepository(TestExecutionRepositoryInterface):
     
     async def update(self, execution: TestExecution) -> TestExecution:
         """Update test execution."""
+        self._get_cache.pop(execution.execution_id, None)
         try:
             if not execution.execution_id:
                 raise ValueError("Execution ID is required for update")
@@ -125,24 +216,21 @@ class TestExecutionRepository(TestExecutionRepositoryInterface):
                 update(TestExecutionModel)
                 .where(TestExecutionModel.execution_id == execution.execution_id)
                 .values(
-                    execution_name=execution.execution_name,
-                    start_time=execution.start_time,
-                    end_time=execution.end_time,
+                    **dict(zip(_UPDATABLE_COLUMNS, _get_updatable_values(execution))),
                     status=execution.status.value,
-                    actual_duration_seconds=execution.actual_duration_seconds,
-                    k6_script_used=execution.k6_script_used,
-                    execution_logs=execution.execution_logs,
                 )
                 .returning(TestExecutionModel)
+                # RETURNING already carries the new row; skip session sync and
+                # overwrite any stale instance in the identity map with it instead
+                .execution_options(synchronize_session=False, populate_existing=True)
             )
             
-            result = await self.session.execute(stmt)
-            updated_model = result.scalar_one_or_none()
+            updated_model = (await self.session.scalars(stmt)).one_or_none()
             
             if not updated_model:
                 raise NotFoundError(f"Test execution with ID {execution.execution_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Updated test execution: {updated_model.execution_name}")
             
@@ -155,16 +243,15 @@ class TestExecutionRepository(TestExecutionRepositoryInterface):
     
     async def delete(self, execution_id: int) -> bool:
         """Delete test execution."""
+        self._get_cache.pop(execution_id, None)
         try:
-            stmt = delete(TestExecutionModel).where(TestExecutionModel.execution_id == execution_id)
-            
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_DELETE_EXECUTION, {"id": execution_id})
             rows_affected = result.rowcount
             
             if rows_affected == 0:
                 raise NotFoundError(f"Test execution with ID {execution_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Deleted test execution: {execution_id}")
             return True
@@ -174,17 +261,20 @@ class TestExecutionRepository(TestExecutionRepositoryInterface):
             logger.error(f"Error deleting test execution {execution_id}: {str(e)}")
             raise DatabaseError(f"Failed to delete test execution: {str(e)}")
     
+    async def _stream_batches(
+        self, stmt, params: Optional[Dict] = None
+    ) -> AsyncIterator[List[TestExecution]]:
+        """Stream a query as lists of entities, one list per yield_per partition."""
+        execution_models = await self.session.stream_scalars(stmt, params)
+        async for partition in execution_models.partitions():
+            yield [self._model_to_entity(model) for model in partition]
+    
     def _model_to_entity(self, model: TestExecutionModel) -> TestExecution:
         """Convert database model to domain entity."""
-        return TestExecution(
-            execution_id=model.execution_id,
-            scenario_id=model.scenario_id,
-            execution_name=model.execution_name,
-            start_time=model.start_time,
-            end_time=model.end_time,
-            status=ExecutionStatus(model.status),
-            actual_duration_seconds=model.actual_duration_seconds,
-            k6_script_used=model.k6_script_used,
-            execution_logs=model.execution_logs,
-            executed_by=model.executed_by,
-        )
\ No newline at end of file
+        # Fill a bare instance directly, skipping the generated dataclass __init__
+        entity = object.__new__(TestExecution)
+        for set_slot, value in zip(_ENTITY_SLOT_SETTERS, _get_entity_fields(model)):
+            set_slot(entity, value)
+        entity.status = _STATUS_BY_VALUE[model.status]
+        entity.test_result = None
+        return entity
\ No newline at end of file
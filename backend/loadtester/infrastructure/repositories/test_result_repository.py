@@ -4,87 +4,172 @@ SQLAlchemy implementation of TestResult repository interface
 """
 
 import logging
-from typing import List, Optional
+from dataclasses import fields
+from operator import attrgetter
+from typing import Dict, List, Optional
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import bindparam, case, func, insert, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from loadtester.domain.entities.domain_entities import TestResult, ErrorDetail, PerformanceMetric
 from loadtester.domain.interfaces.domain_interfaces import TestResultRepositoryInterface
-from loadtester.infrastructure.database.database_models import TestResultModel, ErrorDetailModel, PerformanceMetricModel
+from loadtester.infrastructure.database.database_models import (
+    TestResultModel, ErrorDetailModel, PerformanceMetricModel, TestExecutionModel
+)
+from loadtester.infrastructure.database.unit_of_work import commit_or_flush
 from loadtester.shared.exceptions.infrastructure_exceptions import DatabaseError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Hot statements built once so every call hits the same compiled-SQL cache entry
+# Children are eager-loaded; any other relationship access raises instead of lazy-loading
+_SELECT_RESULT_WITH_CHILDREN = select(TestResultModel).options(
+    selectinload(TestResultModel.error_details),
+    selectinload(TestResultModel.performance_metrics),
+    raiseload("*"),
+)
+_GET_RESULT_BY_ID = _SELECT_RESULT_WITH_CHILDREN.where(
+    TestResultModel.result_id == bindparam("id")
+)
+_GET_RESULT_BY_EXECUTION = _SELECT_RESULT_WITH_CHILDREN.where(
+    TestResultModel.execution_id == bindparam("execution_id")
+)
+# Results reach their job through the execution; children still come via selectinload
+_GET_RESULTS_BY_JOB = (
+    _SELECT_RESULT_WITH_CHILDREN
+    .join(TestResultModel.execution)
+    .where(TestExecutionModel.job_id == bindparam("job_id"))
+    .order_by(TestResultModel.result_id.asc())
+)
+# Core INSERT ... RETURNING for the parent row: no unit-of-work flush per create
+_INSERT_RESULT = insert(TestResultModel).returning(TestResultModel)
+_INSERT_ERROR_DETAILS = insert(ErrorDetailModel).returning(
+    ErrorDetailModel, sort_by_parameter_order=True
+)
+_INSERT_METRICS = insert(PerformanceMetricModel).returning(
+    PerformanceMetricModel, sort_by_parameter_order=True
+)
+_DELETE_RESULT = delete(TestResultModel).where(TestResultModel.result_id == bindparam("id"))
+
+# Columns written by update(), read off the entity in one C-level attrgetter call
+_UPDATABLE_COLUMNS = (
+    "avg_response_time_ms",
+    "p95_response_time_ms",
+    "p99_response_time_ms",
+    "min_response_time_ms",
+    "max_response_time_ms",
+    "total_requests",
+    "successful_requests",
+    "failed_requests",
+    "success_rate_percent",
+    "requests_per_second",
+    "actual_concurrent_users",
+    "actual_volumetry_used",
+    "data_sent_kb",
+    "data_received_kb",
+    "http_errors_4xx",
+    "http_errors_5xx",
+    "timeout_errors",
+    "connection_errors",
+    "error_summary",
+)
+_get_updatable_values = attrgetter(*_UPDATABLE_COLUMNS)
+# create() additionally sets the owning execution
+_INSERT_COLUMNS = ("execution_id",) + _UPDATABLE_COLUMNS
+_get_insert_values = attrgetter(*_INSERT_COLUMNS)
+
+# Entity fields that map 1:1 onto model columns. _model_to_entity writes them straight
+# through the entity's slot descriptors, skipping the generated dataclass __init__.
+_RESULT_FIELDS = tuple(
+    f.name for f in fields(TestResult)
+    if f.init and f.name not in ("error_details", "performance_metrics")
+)
+_get_result_fields = attrgetter(*_RESULT_FIELDS)
+_RESULT_SLOT_SETTERS = tuple(getattr(TestResult, name).__set__ for name in _RESULT_FIELDS)
+_ERROR_FIELDS = tuple(f.name for f in fields(ErrorDetail))
+_get_error_fields = attrgetter(*_ERROR_FIELDS)
+_ERROR_SLOT_SETTERS = tuple(getattr(ErrorDetail, name).__set__ for name in _ERROR_FIELDS)
+_METRIC_FIELDS = tuple(f.name for f in fields(PerformanceMetric))
+_get_metric_fields = attrgetter(*_METRIC_FIELDS)
+_METRIC_SLOT_SETTERS = tuple(getattr(PerformanceMetric, name).__set__ for name in _METRIC_FIELDS)
+
+# SQL mirror of the report's performance classification (first matching branch wins)
+_ERROR_RATE = case(
+    (TestResultModel.total_requests > 0,
+     func.coalesce(TestResultModel.failed_requests, 0) * 100.0 / TestResultModel.total_requests),
+    else_=0.0,
+)
+_PERFORMANCE_CLASSIFICATION = case(
+    (func.coalesce(TestResultModel.avg_response_time_ms, 0) == 0, 'Desconocido'),
+    (_ERROR_RATE >= 50, 'Crítico'),
+    (_ERROR_RATE >= 10, 'Degradado'),
+    (TestResultModel.avg_response_time_ms < 200, 'Excelente'),
+    (TestResultModel.avg_response_time_ms < 500, 'Bueno'),
+    (TestResultModel.avg_response_time_ms < 1000, 'Degradado'),
+    else_='Crítico',
+).label("classification")
+
 
 class TestResultRepository(TestResultRepositoryInterface):
     """SQLAlchemy implementation of TestResult repository."""
     
     def __init__(self, session: AsyncSession):
         self.session = session
+        # get_by_id memo for the lifetime of this (request-scoped) repository
+        self._get_cache: Dict[int, TestResult] = {}
     
     async def create(self, result: TestResult) -> TestResult:
         """Create a new test result."""
         try:
-            result_model = TestResultModel(
-                execution_id=result.execution_id,
-                avg_response_time_ms=result.avg_response_time_ms,
-                p95_response_time_ms=result.p95_response_time_ms,
-                p99_response_time_ms=result.p99_response_time_ms,
-                min_response_time_ms=result.min_response_time_ms,
-                max_response_time_ms=result.max_response_time_ms,
-                total_requests=result.total_requests,
-                successful_requests=result.successful_requests,
-                failed_requests=result.failed_requests,
-                success_rate_percent=result.success_rate_percent,
-                requests_per_second=result.requests_per_second,
-                actual_concurrent_users=result.actual_concurrent_users,
-                actual_volumetry_used=result.actual_volumetry_used,
-                data_sent_kb=result.data_sent_kb,
-                data_received_kb=result.data_received_kb,
-                http_errors_4xx=result.http_errors_4xx,
-                http_errors_5xx=result.http_errors_5xx,
-                timeout_errors=result.timeout_errors,
-                connection_errors=result.connection_errors,
-                error_summary=result.error_summary,
-            )
-            
-            self.session.add(result_model)
-            await self.session.commit()
-            await self.session.refresh(result_model)
-            
-            # Create error details if any
-            if result.error_details:
-                for error_detail in result.error_details:
-                    error_model = ErrorDetailModel(
-                        result_id=result_model.result_id,
-                        error_type=error_detail.error_type,
-                        error_code=error_detail.error_code,
-                        error_message=error_detail.error_message,
-                        error_count=error_detail.error_count,
-                        error_percentage=error_detail.error_percentage,
-                    )
-                    self.session.add(error_model)
+            # Parent row first to get result_id; children go in the same transaction
+            result_model = (
+                await self.session.scalars(
+                    _INSERT_RESULT, [dict(zip(_INSERT_COLUMNS, _get_insert_values(result)))]
+                )
+            ).one()
             
-            # Create performance metrics if any
-            if result.performance_metrics:
-                for metric in result.performance_metrics:
-                    metric_model = PerformanceMetricModel(
-                        result_id=result_model.result_id,
-                        metric_name=metric.metric_name,
-                        metric_type=metric.metric_type,
-                        metric_value=metric.metric_value,
-                        unit_of_measure=metric.unit_of_measure,
-                        timestamp_collected=metric.timestamp_collected,
-                    )
-                    self.session.add(metric_model)
+            # Children go in as one multi-row INSERT ... RETURNING per table
+            # (insertmanyvalues) instead of per-object unit-of-work inserts
+            error_rows = [
+                {
+                    "result_id": result_model.result_id,
+                    "error_type": error_detail.error_type,
+                    "error_code": error_detail.error_code,
+                    "error_message": error_detail.error_message,
+                    "error_count": error_detail.error_count,
+                    "error_percentage": error_detail.error_percentage,
+                }
+                for error_detail in result.error_details or []
+            ]
+            metric_rows = [
+                {
+                    "result_id": result_model.result_id,
+                    "metric_name": metric.metric_name,
+                    "metric_type": metric.metric_type,
+                    "metric_value": metric.metric_value,
+                    "unit_of_measure": metric.unit_of_measure,
+                    "timestamp_collected": metric.timestamp_collected,
+                }
+                for metric in result.performance_metrics or []
+            ]
+            error_models = []
+            if error_rows:
+                error_models = (await self.session.scalars(_INSERT_ERROR_DETAILS, error_rows)).all()
+            metric_models = []
+            if metric_rows:
+                metric_models = (await self.session.scalars(_INSERT_METRICS, metric_rows)).all()
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Created test result for execution: {result.execution_id}")
             
-            return await self.get_by_id(result_model.result_id)
+            # The rows just written are authoritative; no need to read them back
+            return self._model_to_entity(
+                result_model,
+                error_details=[self._error_model_to_entity(m) for m in error_models],
+                performance_metrics=[self._metric_model_to_entity(m) for m in metric_models],
+            )
             
         except Exception as e:
             await self.session.rollback()
@@ -93,42 +178,49 @@ class TestResultRepository(TestResultRepositoryInterface):
     
     async def get_by_id(self, result_id: int) -> Optional[TestResult]:
         """Get test result by ID."""
+        if result_id in self._get_cache:
+            return self._get_cache[result_id]
+        
         try:
-            stmt = (
-                select(TestResultModel)
-                .options(
-                    selectinload(TestResultModel.error_details),
-                    selectinload(TestResultModel.performance_metrics)
-                )
-                .where(TestResultModel.result_id == result_id)
-            )
-            
-            result = await self.session.execute(stmt)
-            result_model = result.scalar_one_or_none()
+            result_model = (
+                await self.session.scalars(_GET_RESULT_BY_ID, {"id": result_id})
+            ).one_or_none()
             
             if not result_model:
                 return None
             
-            return self._model_to_entity(result_model)
+            test_result = self._model_to_entity(result_model)
+            self._get_cache[result_id] = test_result
+            return test_result
             
         except Exception as e:
             logger.error(f"Error getting test result by ID {result_id}: {str(e)}")
             raise DatabaseError(f"Failed to get test result: {str(e)}")
     
-    async def get_by_execution_id(self, execution_id: int) -> Optional[TestResult]:
-        """Get test result by execution ID."""
+    async def get_by_ids(self, result_ids: List[int]) -> Dict[int, TestResult]:
+        """Get several test results in a single query, keyed by result ID."""
+        if not result_ids:
+            return {}
+        
         try:
-            stmt = (
-                select(TestResultModel)
-                .options(
-                    selectinload(TestResultModel.error_details),
-                    selectinload(TestResultModel.performance_metrics)
-                )
-                .where(TestResultModel.execution_id == execution_id)
+            stmt = _SELECT_RESULT_WITH_CHILDREN.where(
+                TestResultModel.result_id.in_(set(result_ids))
             )
             
-            result = await self.session.execute(stmt)
-            result_model = result.scalar_one_or_none()
+            result_models = await self.session.scalars(stmt)
+            
+            return {model.result_id: self._model_to_entity(model) for model in result_models}
+            
+        except Exception as e:
+            logger.error(f"Error getting test results by IDs {result_ids}: {str(e)}")
+            raise DatabaseError(f"Failed to get test results: {str(e)}")
+    
+    async def get_by_execution_id(self, execution_id: int) -> Optional[TestResult]:
+        """Get test result by execution ID."""
+        try:
+            result_model = (
+                await self.session.scalars(_GET_RESULT_BY_EXECUTION, {"execution_id": execution_id})
+            ).one_or_none()
             
             if not result_model:
                 return None
@@ -142,16 +234,36 @@ class TestResultRepository(TestResultRepositoryInterface):
     async def get_by_job_id(self, job_id: str) -> List[TestResult]:
         """Get all results for a job."""
         try:
-            # This would require a complex join through executions and scenarios
-            # For now, return empty list - would need to implement this relationship
-            return []
+            result_models = await self.session.scalars(_GET_RESULTS_BY_JOB, {"job_id": job_id})
+            
+            return [self._model_to_entity(model) for model in result_models]
             
         except Exception as e:
             logger.error(f"Error getting results for job {job_id}: {str(e)}")
             raise DatabaseError(f"Failed to get results: {str(e)}")
     
+    async def count_by_classification(self, result_ids: List[int]) -> Dict[str, int]:
+        """Count results per performance classification."""
+        if not result_ids:
+            return {}
+        
+        try:
+            stmt = (
+                select(_PERFORMANCE_CLASSIFICATION, func.count())
+                .where(TestResultModel.result_id.in_(set(result_ids)))
+                .group_by(_PERFORMANCE_CLASSIFICATION)
+            )
+            
+            result = await self.session.execute(stmt)
+            return {classification: count for classification, count in result.all()}
+            
+        except Exception as e:
+            logger.error(f"Error counting test results by classification: {str(e)}")
+            raise DatabaseError(f"Failed to count test results: {str(e)}")
+    
     async def update(self, result: TestResult) -> TestResult:
         """Update test result."""
+        self._get_cache.pop(result.result_id, None)
         try:
             if not result.result_id:
                 raise ValueError("Result ID is required for update")
@@ -159,41 +271,28 @@ class TestResultRepository(TestResultRepositoryInterface):
             stmt = (
                 update(TestResultModel)
                 .where(TestResultModel.result_id == result.result_id)
-                .values(
-                    avg_response_time_ms=result.avg_response_time_ms,
-                    p95_response_time_ms=result.p95_response_time_ms,
-                    p99_response_time_ms=result.p99_response_time_ms,
-                    min_response_time_ms=result.min_response_time_ms,
-                    max_response_time_ms=result.max_response_time_ms,
-                    total_requests=result.total_requests,
-                    successful_requests=result.successful_requests,
-                    failed_requests=result.failed_requests,
-                    success_rate_percent=result.success_rate_percent,
-                    requests_per_second=result.requests_per_second,
-                    actual_concurrent_users=result.actual_concurrent_users,
-                    actual_volumetry_used=result.actual_volumetry_used,
-                    data_sent_kb=result.data_sent_kb,
-                    data_received_kb=result.data_received_kb,
-                    http_errors_4xx=result.http_errors_4xx,
-                    http_errors_5xx=result.http_errors_5xx,
-                    timeout_errors=result.timeout_errors,
-                    connection_errors=result.connection_errors,
-                    error_summary=result.error_summary,
-                )
+                .values(dict(zip(_UPDATABLE_COLUMNS, _get_updatable_values(result))))
                 .returning(TestResultModel)
+                # RETURNING already carries the new row; skip session sync and
+                # overwrite any stale instance in the identity map with it instead
+                .execution_options(synchronize_session=False, populate_existing=True)
             )
             
-            db_result = await self.session.execute(stmt)
-            updated_model = db_result.scalar_one_or_none()
+            updated_model = (await self.session.scalars(stmt)).one_or_none()
             
             if not updated_model:
                 raise NotFoundError(f"Test result with ID {result.result_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Updated test result: {result.result_id}")
             
-            return await self.get_by_id(result.result_id)
+            # Children are not modified by update; keep the caller's lists
+            return self._model_to_entity(
+                updated_model,
+                error_details=list(result.error_details or []),
+                performance_metrics=list(result.performance_metrics or []),
+            )
             
         except Exception as e:
             await self.session.rollback()
@@ -202,25 +301,16 @@ class TestResultRepository(TestResultRepositoryInterface):
     
     async def delete(self, result_id: int) -> bool:
         """Delete test result."""
+        self._get_cache.pop(result_id, None)
         try:
-            # Delete related records first
-            await self.session.execute(
-                delete(ErrorDetailModel).where(ErrorDetailModel.result_id == result_id)
-            )
-            await self.session.execute(
-                delete(PerformanceMetricModel).where(PerformanceMetricModel.result_id == result_id)
-            )
-            
-            # Delete main result
-            stmt = delete(TestResultModel).where(TestResultModel.result_id == result_id)
-            
-            result = await self.session.execute(stmt)
+            # Error details and performance metrics go with it via ON DELETE CASCADE
+            result = await self.session.execute(_DELETE_RESULT, {"id": result_id})
             rows_affected = result.rowcount
             
             if rows_affected == 0:
                 raise NotFoundError(f"Test result with ID {result_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Deleted test result: {result_id}")
             return True
@@ -230,58 +320,47 @@ class TestResultRepository(TestResultRepositoryInterface):
             logger.error(f"Error deleting test result {result_id}: {str(e)}")
             raise DatabaseError(f"Failed to delete test result: {str(e)}")
     
-    def _model_to_entity(self, model: TestResultModel) -> TestResult:
-        """Convert database model to domain entity."""
-        # Convert error details
-        error_details = []
-        if hasattr(model, 'error_details') and model.error_details:
-            for error_model in model.error_details:
-                error_details.append(ErrorDetail(
-                    error_id=error_model.error_id,
-                    result_id=error_model.result_id,
-                    error_type=error_model.error_type,
-                    error_code=error_model.error_code,
-                    error_message=error_model.error_message,
-                    error_count=error_model.error_count,
-                    error_percentage=error_model.error_percentage,
-                ))
+    def _model_to_entity(
+        self,
+        model: TestResultModel,
+        error_details: Optional[List[ErrorDetail]] = None,
+        performance_metrics: Optional[List[PerformanceMetric]] = None,
+    ) -> TestResult:
+        """Convert database model to domain entity.
+
+        Children passed in explicitly are used as-is, so the model's relationships
+        are not touched (and not lazy-loaded) for freshly written rows.
+        """
+        if error_details is None:
+            error_details = [
+                self._error_model_to_entity(error_model)
+                for error_model in model.error_details or []
+            ]
         
-        # Convert performance metrics
-        performance_metrics = []
-        if hasattr(model, 'performance_metrics') and model.performance_metrics:
-            for metric_model in model.performance_metrics:
-                performance_metrics.append(PerformanceMetric(
-                    metric_id=metric_model.metric_id,
-                    result_id=metric_model.result_id,
-                    metric_name=metric_model.metric_name,
-                    metric_type=metric_model.metric_type,
-                    metric_value=metric_model.metric_value,
-                    unit_of_measure=metric_model.unit_of_measure,
-                    timestamp_collected=metric_model.timestamp_collected,
-                ))
+        if performance_metrics is None:
+            performance_metrics = [
+                self._metric_model_to_entity(metric_model)
+                for metric_model in model.performance_metrics or []
+            ]
         
-        return TestResult(
-            result_id=model.result_id,
-            execution_id=model.execution_id,
-            avg_response_time_ms=model.avg_response_time_ms,
-            p95_response_time_ms=model.p95_response_time_ms,
-            p99_response_time_ms=model.p99_response_time_ms,
-            min_response_time_ms=model.min_response_time_ms,
-            max_response_time_ms=model.max_response_time_ms,
-            total_requests=model.total_requests,
-            successful_requests=model.successful_requests,
-            failed_requests=model.failed_requests,
-            success_rate_percent=model.success_rate_percent,
-            requests_per_second=model.requests_per_second,
-            actual_concurrent_users=model.actual_concurrent_users,
-            actual_volumetry_used=model.actual_volumetry_used,
-            data_sent_kb=model.data_sent_kb,
-            data_received_kb=model.data_received_kb,
-            http_errors_4xx=model.http_errors_4xx,
-            http_errors_5xx=model.http_errors_5xx,
-            timeout_errors=model.timeout_errors,
-            connection_errors=model.connection_errors,
-            error_summary=model.error_summary,
-            error_details=error_details,
-            performance_metrics=performance_metrics,
-        )
\ No newline at end of file
+        entity = object.__new__(TestResult)
+        for set_slot, value in zip(_RESULT_SLOT_SETTERS, _get_result_fields(model)):
+            set_slot(entity, value)
+        entity.error_details = error_details
+        entity.performance_metrics = performance_metrics
+        entity._error_rate = None
+        return entity
+    
+    def _error_model_to_entity(self, model: ErrorDetailModel) -> ErrorDetail:
+        """Convert error detail model to domain entity."""
+        entity = object.__new__(ErrorDetail)
+        for set_slot, value in zip(_ERROR_SLOT_SETTERS, _get_error_fields(model)):
+            set_slot(entity, value)
+        return entity
+    
+    def _metric_model_to_entity(self, model: PerformanceMetricModel) -> PerformanceMetric:
+        """Convert performance metric model to domain entity."""
+        entity = object.__new__(PerformanceMetric)
+        for set_slot, value in zip(_METRIC_SLOT_SETTERS, _get_metric_fields(model)):
+            set_slot(entity, value)
+        return entity
@@ -5,14 +5,15 @@ SQLAlchemy implementation of TestScenario repository interface
 
 import json
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import and_, case, inspect, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from loadtester.domain.entities.domain_entities import TestScenario
 from loadtester.domain.interfaces.domain_interfaces import TestScenarioRepositoryInterface
-from loadtester.infrastructure.database.database_models import TestScenarioModel
+from loadtester.infrastructure.database.database_models import TestDataSetModel, TestScenarioModel
+from loadtester.infrastructure.database.unit_of_work import commit_or_flush
 from loadtester.shared.exceptions.infrastructure_exceptions import DatabaseError, NotFoundError
 
 logger = logging.getLogger(__name__)
@@ -27,24 +28,10 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
     async def create(self, scenario: TestScenario) -> TestScenario:
         """Create a new test scenario."""
         try:
-            scenario_model = TestScenarioModel(
-                endpoint_id=scenario.endpoint_id,
-                scenario_name=scenario.scenario_name,
-                description=scenario.description,
-                target_volumetry=scenario.target_volumetry,
-                concurrent_users=scenario.concurrent_users,
-                duration_seconds=scenario.duration_seconds,
-                ramp_up_seconds=scenario.ramp_up_seconds,
-                ramp_down_seconds=scenario.ramp_down_seconds,
-                k6_options=json.dumps(scenario.k6_options) if scenario.k6_options else None,
-                test_data=json.dumps(scenario.test_data) if scenario.test_data else None,
-                created_by=scenario.created_by,
-                active=scenario.active,
-            )
+            scenario_model = self._entity_to_model(scenario)
             
             self.session.add(scenario_model)
-            await self.session.commit()
-            await self.session.refresh(scenario_model)
+            await commit_or_flush(self.session)
             
             logger.info(f"Created test scenario: {scenario_model.scenario_name}")
             
@@ -55,6 +42,54 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
             logger.error(f"Error creating test scenario: {str(e)}")
             raise DatabaseError(f"Failed to create test scenario: {str(e)}")
     
+    async def create_many(self, scenarios: List[TestScenario]) -> List[TestScenario]:
+        """Create several test scenarios in a single flush and commit.
+
+        Scenarios of one endpoint that share the same test data list store it once
+        in test_data_sets and reference it through test_data_id instead of repeating
+        it on every scenario row.
+        """
+        if not scenarios:
+            return []
+        
+        try:
+            shared_test_data: Dict[int, List[Dict]] = {}
+            data_sets: Dict[int, TestDataSetModel] = {}
+            scenario_models = []
+            for scenario in scenarios:
+                test_data = scenario.test_data
+                shared = bool(test_data) and (
+                    shared_test_data.setdefault(scenario.endpoint_id, test_data) is test_data
+                )
+                scenario_model = self._entity_to_model(scenario, inline_test_data=not shared)
+                if shared:
+                    data_set = data_sets.get(scenario.endpoint_id)
+                    if data_set is None:
+                        data_set = data_sets[scenario.endpoint_id] = TestDataSetModel(
+                            endpoint_id=scenario.endpoint_id, data=json.dumps(test_data)
+                        )
+                    # Saved with the scenario; the flush fills in test_data_id
+                    scenario_model.test_data_set = data_set
+                scenario_models.append(scenario_model)
+            
+            self.session.add_all(scenario_models)
+            await commit_or_flush(self.session)
+            
+            logger.info(f"Created {len(scenario_models)} test scenarios")
+            
+            entities = []
+            for scenario, model in zip(scenarios, scenario_models):
+                entity = self._model_to_entity(model)
+                # Hand back the caller's list so scenarios keep sharing one copy in memory
+                entity.test_data = scenario.test_data
+                entities.append(entity)
+            return entities
+            
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error creating test scenarios: {str(e)}")
+            raise DatabaseError(f"Failed to create test scenarios: {str(e)}")
+    
     async def get_by_id(self, scenario_id: int) -> Optional[TestScenario]:
         """Get test scenario by ID."""
         try:
@@ -72,6 +107,22 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
             logger.error(f"Error getting test scenario by ID {scenario_id}: {str(e)}")
             raise DatabaseError(f"Failed to get test scenario: {str(e)}")
     
+    async def get_by_ids(self, scenario_ids: List[int]) -> Dict[int, TestScenario]:
+        """Get several test scenarios in a single query, keyed by scenario ID."""
+        if not scenario_ids:
+            return {}
+        
+        try:
+            stmt = select(TestScenarioModel).where(TestScenarioModel.scenario_id.in_(set(scenario_ids)))
+            
+            result = await self.session.execute(stmt)
+            
+            return {model.scenario_id: self._model_to_entity(model) for model in result.scalars()}
+            
+        except Exception as e:
+            logger.error(f"Error getting test scenarios by IDs {scenario_ids}: {str(e)}")
+            raise DatabaseError(f"Failed to get test scenarios: {str(e)}")
+    
     async def get_by_endpoint_id(self, endpoint_id: int) -> List[TestScenario]:
         """Get all scenarios for an endpoint."""
         try:
@@ -107,6 +158,18 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
             if not scenario.scenario_id:
                 raise ValueError("Scenario ID is required for update")
             
+            # Unchanged shared data keeps its reference; anything else (including
+            # cleared data) is stored inline and drops the reference
+            test_data = json.dumps(scenario.test_data) if scenario.test_data else None
+            shared_data = (
+                select(TestDataSetModel.data)
+                .where(TestDataSetModel.test_data_id == TestScenarioModel.test_data_id)
+                .scalar_subquery()
+            )
+            keeps_shared_data = and_(
+                TestScenarioModel.test_data_id.is_not(None), shared_data == test_data
+            )
+            
             stmt = (
                 update(TestScenarioModel)
                 .where(TestScenarioModel.scenario_id == scenario.scenario_id)
@@ -119,7 +182,8 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
                     ramp_up_seconds=scenario.ramp_up_seconds,
                     ramp_down_seconds=scenario.ramp_down_seconds,
                     k6_options=json.dumps(scenario.k6_options) if scenario.k6_options else None,
-                    test_data=json.dumps(scenario.test_data) if scenario.test_data else None,
+                    test_data=case((keeps_shared_data, None), else_=test_data),
+                    test_data_id=case((keeps_shared_data, TestScenarioModel.test_data_id), else_=None),
                     active=scenario.active,
                 )
                 .returning(TestScenarioModel)
@@ -131,11 +195,14 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
             if not updated_model:
                 raise NotFoundError(f"Test scenario with ID {scenario.scenario_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Updated test scenario: {updated_model.scenario_name}")
             
-            return self._model_to_entity(updated_model)
+            entity = self._model_to_entity(updated_model)
+            # The row holds exactly the caller's data, inline or through the shared set
+            entity.test_data = scenario.test_data
+            return entity
             
         except Exception as e:
             await self.session.rollback()
@@ -158,7 +225,7 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
             if not deleted_id:
                 raise NotFoundError(f"Test scenario with ID {scenario_id} not found")
             
-            await self.session.commit()
+            await commit_or_flush(self.session)
             
             logger.info(f"Deleted test scenario: {scenario_id}")
             return True
@@ -168,6 +235,25 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
             logger.error(f"Error deleting test scenario {scenario_id}: {str(e)}")
             raise DatabaseError(f"Failed to delete test scenario: {str(e)}")
     
+    def _entity_to_model(
+        self, scenario: TestScenario, inline_test_data: bool = True
+    ) -> TestScenarioModel:
+        """Convert domain entity to a new database model."""
+        return TestScenarioModel(
+            endpoint_id=scenario.endpoint_id,
+            scenario_name=scenario.scenario_name,
+            description=scenario.description,
+            target_volumetry=scenario.target_volumetry,
+            concurrent_users=scenario.concurrent_users,
+            duration_seconds=scenario.duration_seconds,
+            ramp_up_seconds=scenario.ramp_up_seconds,
+            ramp_down_seconds=scenario.ramp_down_seconds,
+            k6_options=json.dumps(scenario.k6_options) if scenario.k6_options else None,
+            test_data=json.dumps(scenario.test_data) if inline_test_data and scenario.test_data else None,
+            created_by=scenario.created_by,
+            active=scenario.active,
+        )
+    
     def _model_to_entity(self, model: TestScenarioModel) -> TestScenario:
         """Convert database model to domain entity."""
         # Parse k6 options
@@ -178,11 +264,17 @@ class TestScenarioRepository(TestScenarioRepositoryInterface):
             except json.JSONDecodeError as e:
                 logger.warning(f"Error parsing k6 options: {str(e)}")
         
-        # Parse test data
+        # Parse test data, stored on the row or shared through the endpoint's data set
+        raw_test_data = model.test_data
+        if raw_test_data is None and model.test_data_id is not None:
+            data_set = inspect(model).attrs.test_data_set.loaded_value
+            if isinstance(data_set, TestDataSetModel):
+                raw_test_data = data_set.data
+        
         test_data = None
-        if model.test_data:
+        if raw_test_data:
             try:
-                test_data = json.loads(model.test_data)
+                test_data = json.loads(raw_test_data)
             except json.JSONDecodeError as e:
                 logger.warning(f"Error parsing test data: {str(e)}")
         
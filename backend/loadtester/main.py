@@ -5,18 +5,24 @@ FastAPI application with dependency injection and 3-layer architecture
 
 import logging
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from loadtester.infrastructure.config.dependency_container import Container
-from loadtester.infrastructure.database.database_connection import DatabaseManager
+from loadtester.infrastructure.config.job_queue import JobQueue
+from loadtester.infrastructure.database.database_connection import init_database
+from loadtester.infrastructure.external.pdf_generator_service import shutdown_render_pool
+from loadtester.presentation.api.v1 import status_endpoints
 from loadtester.presentation.api.v1.api_router import api_router
+from loadtester.presentation.middleware.fast_path_middleware import FastPathMiddleware
 from loadtester.presentation.middleware.middleware_files import ErrorHandlerMiddleware
 from loadtester.presentation.middleware.logging_middleware import LoggingMiddleware
-from loadtester.settings import Settings
+from loadtester.settings import get_settings
 from loadtester.shared.exceptions.custom_exceptions import LoadTesterException
 from loadtester.shared.utils.logger_utility import setup_logging
 
@@ -26,35 +32,43 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan events."""
     # Startup
     settings = app.state.settings
-    setup_logging(settings.log_level)
+    setup_logging(settings.log_level, json_logs=not settings.debug)
     
     logger = logging.getLogger(__name__)
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     
     # Initialize database
-    db_manager = DatabaseManager(settings.database_url)
+    db_manager = init_database(settings.database_url)
     await db_manager.create_tables()
     
     # Initialize container
     container = Container()
-    container.config.from_pydantic(settings)
+    container.config.from_dict(asdict(settings))
     container.init_resources()
     container.wire(modules=container.wiring_config.modules)
     app.state.container = container
     
+    # Load test jobs run on a fixed pool of workers, bounded by max_concurrent_jobs
+    job_queue = JobQueue(settings.max_concurrent_jobs)
+    job_queue.start()
+    app.state.job_queue = job_queue
+    
     logger.info("Application startup completed")
     
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    await job_queue.stop()
     container.unwire()
     container.shutdown_resources()
+    shutdown_render_pool()
+    await db_manager.close()
 
 
 def create_app() -> FastAPI:
     """Create FastAPI application with all configurations."""
-    settings = Settings()
+    settings = get_settings()
     
     app = FastAPI(
         title=settings.app_name,
@@ -64,20 +78,13 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        # orjson (C encoder) for every JSON response instead of stdlib json
+        default_response_class=ORJSONResponse,
     )
     
     # Store settings in app state
     app.state.settings = settings
     
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    
     # Add custom middleware
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(ErrorHandlerMiddleware)
@@ -93,9 +100,9 @@ def create_app() -> FastAPI:
     async def loadtester_exception_handler(
         request: Request, 
         exc: LoadTesterException
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle custom LoadTester exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": {
@@ -110,12 +117,12 @@ def create_app() -> FastAPI:
     async def general_exception_handler(
         request: Request, 
         exc: Exception
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle unexpected exceptions."""
         logger = logging.getLogger(__name__)
         logger.exception("Unexpected error occurred")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
@@ -126,14 +133,17 @@ def create_app() -> FastAPI:
             },
         )
     
+    # Liveness payload never changes for the life of the app; serialize it once
+    health_body = orjson.dumps({
+        "status": "healthy",
+        "service": settings.app_name,
+        "version": settings.app_version,
+    })
+    
     @app.get("/health")
-    async def health_check() -> dict:
+    async def health_check() -> Response:
         """Health check endpoint."""
-        return {
-            "status": "healthy",
-            "service": settings.app_name,
-            "version": settings.app_version,
-        }
+        return Response(content=health_body, media_type="application/json")
     
     @app.get("/")
     async def root() -> dict:
@@ -144,6 +154,24 @@ def create_app() -> FastAPI:
             "docs": "/docs",
         }
     
+    # Health probes are answered before routing and the custom middleware
+    app.add_middleware(
+        FastPathMiddleware,
+        routes={
+            ("GET", "/health"): health_check,
+            ("GET", "/api/v1/health"): status_endpoints.health_check,
+        },
+    )
+    
+    # Add CORS middleware last so it is outermost and also covers fast-path responses
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Configure appropriately for production
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
     return app
 
 
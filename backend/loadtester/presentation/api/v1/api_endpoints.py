@@ -4,63 +4,79 @@ FastAPI endpoints for load testing operations
 """
 
 import logging
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Annotated, Dict, Literal, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from pydantic import BaseModel, Field, validator
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
-from loadtester.domain.entities.domain_entities import AuthConfig, AuthType, LoadTestConfiguration
+from loadtester.domain.entities.domain_entities import (
+    AuthConfig, AuthType, EndpointSpec, LoadTestConfiguration
+)
 from loadtester.domain.services.load_test_service import LoadTestService
 from loadtester.infrastructure.config.dependencies import get_custom_load_test_service
+from loadtester.settings import get_settings
 from loadtester.shared.exceptions.domain_exceptions import InvalidConfigurationError, LoadTestExecutionError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Request constraints expressed as core-validated types: pydantic-core checks them
+# natively instead of calling back into Python validators on every request
+HttpMethod = Annotated[
+    str,
+    StringConstraints(to_upper=True, pattern=r"(?i)^(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)$"),
+]
+NonEmptyStrippedStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+# Request models are read-only once parsed; unknown keys are dropped rather than checked
+_REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+# Request auth_type -> domain AuthType, built once at import
+_AUTH_TYPE_MAP = MappingProxyType({
+    "bearer_token": AuthType.BEARER_TOKEN,
+    "api_key": AuthType.API_KEY,
+    "none": AuthType.NONE,
+})
+
 
 # Request/Response Models
 class AuthConfigRequest(BaseModel):
     """Authentication configuration request model."""
-    auth_type: str = Field(..., description="Authentication type (bearer_token, api_key)")
+    model_config = _REQUEST_MODEL_CONFIG
+    
+    auth_type: Literal["bearer_token", "api_key", "none"] = Field(
+        ..., description="Authentication type (bearer_token, api_key)"
+    )
     token: Optional[str] = Field(None, description="Bearer token")
     api_key: Optional[str] = Field(None, description="API key")
     header_name: Optional[str] = Field(None, description="Header name for API key")
     query_param_name: Optional[str] = Field(None, description="Query parameter name for API key")
-    
-    @validator("auth_type")
-    def validate_auth_type(cls, v):
-        valid_types = ["bearer_token", "api_key", "none"]
-        if v not in valid_types:
-            raise ValueError(f"auth_type must be one of: {valid_types}")
-        return v
 
 
 class EndpointConfigRequest(BaseModel):
     """Endpoint configuration request model."""
+    model_config = _REQUEST_MODEL_CONFIG
+    
     path: str = Field(..., description="Endpoint path")
-    method: str = Field(..., description="HTTP method")
+    method: HttpMethod = Field(..., description="HTTP method")
     expected_volumetry: int = Field(..., gt=0, description="Expected requests per minute")
     expected_concurrent_users: int = Field(..., gt=0, description="Expected concurrent users")
     timeout_ms: Optional[int] = Field(30000, gt=0, description="Request timeout in milliseconds")
     auth: Optional[AuthConfigRequest] = Field(None, description="Endpoint-specific authentication")
     use_mock_data: bool = Field(True, description="Use auto-generated mock data")
     data_file: Optional[str] = Field(None, description="Path to custom data file")
-    
-    @validator("method")
-    def validate_method(cls, v):
-        valid_methods = ["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
-        if v.upper() not in valid_methods:
-            raise ValueError(f"method must be one of: {valid_methods}")
-        return v.upper()
 
 
 class LoadTestRequest(BaseModel):
     """Load test creation request model."""
-    api_spec: str = Field(..., description="OpenAPI specification (JSON/YAML string or URL)")
+    model_config = _REQUEST_MODEL_CONFIG
+    
+    api_spec: NonEmptyStrippedStr = Field(..., description="OpenAPI specification (JSON/YAML string or URL)")
     selected_endpoints: list[EndpointConfigRequest] = Field(
         ..., 
-        min_items=1, 
+        min_length=1, 
         description="List of endpoints to test"
     )
     global_auth: Optional[AuthConfigRequest] = Field(
@@ -72,12 +88,6 @@ class LoadTestRequest(BaseModel):
         description="URL to notify when test completes"
     )
     test_name: Optional[str] = Field(None, description="Custom test name")
-    
-    @validator("api_spec")
-    def validate_api_spec(cls, v):
-        if not v.strip():
-            raise ValueError("api_spec cannot be empty")
-        return v.strip()
 
 
 class LoadTestResponse(BaseModel):
@@ -100,6 +110,10 @@ class JobStatusResponse(BaseModel):
     error_message: Optional[str] = Field(None, description="Error message (when failed)")
 
 
+# Fields get_job_status may omit; filled with null so the wire shape matches JobStatusResponse
+_OPTIONAL_STATUS_FIELDS = ("report_url", "error_message")
+
+
 # API Endpoints
 @router.post(
     "/load-test",
@@ -110,27 +124,27 @@ class JobStatusResponse(BaseModel):
 )
 async def create_load_test(
     request: LoadTestRequest,
-    background_tasks: BackgroundTasks,
+    http_request: Request,
     load_test_service: LoadTestService = Depends(get_custom_load_test_service)
 ) -> LoadTestResponse:
     """Create a new load test job."""
     try:
-        logger.info(f"Creating load test for {len(request.selected_endpoints)} endpoints")
+        logger.info("Creating load test for %d endpoints", len(request.selected_endpoints))
         
         # Convert request to domain configuration
         config = LoadTestConfiguration(
             api_spec=request.api_spec,
             selected_endpoints=[
-                {
-                    "path": ep.path,
-                    "method": ep.method,
-                    "expected_volumetry": ep.expected_volumetry,
-                    "expected_concurrent_users": ep.expected_concurrent_users,
-                    "timeout_ms": ep.timeout_ms,
-                    "auth": _convert_auth_config(ep.auth) if ep.auth else None,
-                    "use_mock_data": ep.use_mock_data,
-                    "data_file": ep.data_file,
-                }
+                EndpointSpec(
+                    path=ep.path,
+                    method=ep.method,
+                    expected_volumetry=ep.expected_volumetry,
+                    expected_concurrent_users=ep.expected_concurrent_users,
+                    timeout_ms=ep.timeout_ms,
+                    auth=_convert_auth_config(ep.auth) if ep.auth else None,
+                    use_mock_data=ep.use_mock_data,
+                    data_file=ep.data_file,
+                )
                 for ep in request.selected_endpoints
             ],
             global_auth=_convert_auth_config(request.global_auth) if request.global_auth else None,
@@ -141,16 +155,13 @@ async def create_load_test(
         # Create job
         job = await load_test_service.create_load_test_job(config)
         
-        # Start execution in background
-        background_tasks.add_task(
-            load_test_service.execute_load_test,
-            job.job_id,
-            config
-        )
+        # Hand off to the bounded worker pool; the response returns immediately
+        await http_request.app.state.job_queue.submit(job.job_id, config)
         
-        logger.info(f"Load test job created: {job.job_id}")
+        logger.info("Load test job created: %s", job.job_id)
         
-        return LoadTestResponse(
+        # Built from trusted internal values: skip re-validation
+        return LoadTestResponse.model_construct(
             job_id=job.job_id,
             status=job.status.value,
             status_url=f"/api/v1/status/{job.job_id}",
@@ -158,21 +169,21 @@ async def create_load_test(
         )
         
     except InvalidConfigurationError as e:
-        logger.warning(f"Invalid configuration: {str(e)}")
+        logger.warning("Invalid configuration: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid configuration: {str(e)}"
         )
     
     except LoadTestExecutionError as e:
-        logger.warning(f"Load test execution error: {str(e)}")
+        logger.warning("Load test execution error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.error(f"Unexpected error creating load test: {str(e)}")
+        logger.error("Unexpected error creating load test: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -181,24 +192,31 @@ async def create_load_test(
 
 @router.get(
     "/status/{job_id}",
-    response_model=JobStatusResponse,
+    responses={200: {"model": JobStatusResponse}},
     summary="Get Job Status",
     description="Get the current status and progress of a load test job"
 )
 async def get_job_status(
     job_id: str,
     load_test_service: LoadTestService = Depends(get_custom_load_test_service)
-) -> JobStatusResponse:
+) -> Dict:
     """Get job status and progress."""
     try:
-        logger.debug(f"Getting status for job: {job_id}")
+        logger.debug("Getting status for job: %s", job_id)
         
-        status_data = await load_test_service.get_job_status(job_id)
+        # Polling clients may get a snapshot up to status_cache_ttl_ms old
+        status_data = await load_test_service.get_job_status(
+            job_id, ttl_ms=get_settings().status_cache_ttl_ms
+        )
+        # Keep the documented shape: optional fields are always present, null when unset
+        for field in _OPTIONAL_STATUS_FIELDS:
+            status_data.setdefault(field, None)
         
-        return JobStatusResponse(**status_data)
+        # The dict goes straight to the default ORJSONResponse, no model round-trip
+        return status_data
         
     except Exception as e:
-        logger.error(f"Error getting job status {job_id}: {str(e)}")
+        logger.error("Error getting job status %s: %s", job_id, e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found"
@@ -226,7 +244,7 @@ async def validate_openapi_spec(
         }
         
     except Exception as e:
-        logger.error(f"Error validating spec: {str(e)}")
+        logger.error("Error validating spec: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid OpenAPI specification"
@@ -248,7 +266,7 @@ async def cancel_job(
         success = await load_test_service.cancel_job(job_id)
 
         if success:
-            logger.info(f"Job {job_id} cancelled successfully")
+            logger.info("Job %s cancelled successfully", job_id)
             return {
                 "status": "success",
                 "message": f"Job {job_id} has been cancelled",
@@ -261,7 +279,7 @@ async def cancel_job(
             )
 
     except Exception as e:
-        logger.error(f"Error cancelling job {job_id}: {str(e)}")
+        logger.error("Error cancelling job %s: %s", job_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error cancelling job: {str(e)}"
@@ -280,7 +298,7 @@ async def cancel_all_jobs(
     try:
         cancelled_count = await load_test_service.cancel_all_running_jobs()
 
-        logger.info(f"Cancelled {cancelled_count} running jobs")
+        logger.info("Cancelled %d running jobs", cancelled_count)
         return {
             "status": "success",
             "message": f"Cancelled {cancelled_count} running job(s)",
@@ -288,7 +306,7 @@ async def cancel_all_jobs(
         }
 
     except Exception as e:
-        logger.error(f"Error cancelling all jobs: {str(e)}")
+        logger.error("Error cancelling all jobs: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error cancelling jobs: {str(e)}"
@@ -318,7 +336,7 @@ async def list_jobs(
         }
         
     except Exception as e:
-        logger.error(f"Error listing jobs: {str(e)}")
+        logger.error("Error listing jobs: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error retrieving jobs"
@@ -330,14 +348,8 @@ def _convert_auth_config(auth_request: Optional[AuthConfigRequest]) -> Optional[
     if not auth_request:
         return None
     
-    auth_type_map = {
-        "bearer_token": AuthType.BEARER_TOKEN,
-        "api_key": AuthType.API_KEY,
-        "none": AuthType.NONE,
-    }
-    
     return AuthConfig(
-        auth_type=auth_type_map[auth_request.auth_type],
+        auth_type=_AUTH_TYPE_MAP[auth_request.auth_type],
         token=auth_request.token,
         api_key=auth_request.api_key,
         header_name=auth_request.header_name,
@@ -3,9 +3,11 @@ Report API Endpoints
 FastAPI endpoints for report download and management
 """
 
+import asyncio
 import logging
 import os
 from pathlib import Path
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import FileResponse
@@ -97,26 +99,11 @@ async def list_reports(
         settings = get_settings()
         reports_dir = Path(settings.reports_path)
         
-        if not reports_dir.exists():
+        # Directory scan + per-file stat are blocking syscalls; keep them off the event loop
+        reports = await asyncio.to_thread(_scan_reports, reports_dir)
+        if reports is None:
             return {"reports": []}
         
-        reports = []
-        for pdf_file in reports_dir.glob("*.pdf"):
-            # Extract job_id from filename
-            if pdf_file.name.startswith("loadtest_report_"):
-                job_id = pdf_file.name.replace("loadtest_report_", "").replace(".pdf", "")
-                
-                reports.append({
-                    "job_id": job_id,
-                    "filename": pdf_file.name,
-                    "size": pdf_file.stat().st_size,
-                    "created_at": pdf_file.stat().st_mtime,
-                    "download_url": f"/api/v1/report/{job_id}"
-                })
-        
-        # Sort by creation time (newest first)
-        reports.sort(key=lambda x: x["created_at"], reverse=True)
-        
         return {
             "reports": reports,
             "total": len(reports)
@@ -224,4 +211,29 @@ async def get_report_info(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error retrieving report information"
-        )
\ No newline at end of file
+        )
+
+
+def _scan_reports(reports_dir: Path) -> Optional[List[dict]]:
+    """List report files in reports_dir, newest first (None if the directory is missing)."""
+    if not reports_dir.exists():
+        return None
+    
+    reports = []
+    for pdf_file in reports_dir.glob("*.pdf"):
+        # Extract job_id from filename
+        if pdf_file.name.startswith("loadtest_report_"):
+            job_id = pdf_file.name.replace("loadtest_report_", "").replace(".pdf", "")
+            file_stats = pdf_file.stat()
+            
+            reports.append({
+                "job_id": job_id,
+                "filename": pdf_file.name,
+                "size": file_stats.st_size,
+                "created_at": file_stats.st_mtime,
+                "download_url": f"/api/v1/report/{job_id}"
+            })
+    
+    # Sort by creation time (newest first)
+    reports.sort(key=lambda x: x["created_at"], reverse=True)
+    return reports
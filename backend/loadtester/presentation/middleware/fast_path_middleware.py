@@ -0,0 +1,37 @@
+"""
+Fast Path Middleware
+Serves frequently polled, dependency-free endpoints without Starlette routing
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+FastPathHandler = Callable[[], Awaitable[Any]]
+
+
+class FastPathMiddleware:
+    """Dispatch exact (method, path) matches straight to their handler coroutine.
+
+    Meant for liveness probes and similar endpoints that take no parameters or
+    dependencies: one dict lookup replaces the router's linear regex scan and the
+    rest of the middleware stack. Everything else falls through to the app.
+    """
+
+    def __init__(self, app: ASGIApp, routes: Dict[Tuple[str, str], FastPathHandler]) -> None:
+        self.app = app
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer fast-path routes directly; pass everything else to the app."""
+        if scope["type"] == "http":
+            handler = self.routes.get((scope["method"], scope["path"]))
+            if handler is not None:
+                result = await handler()
+                response = result if isinstance(result, Response) else ORJSONResponse(result)
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
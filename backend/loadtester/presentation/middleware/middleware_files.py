@@ -4,30 +4,55 @@ Global error handling middleware for FastAPI
 """
 
 import logging
-import traceback
-from typing import Callable
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from loadtester.shared.exceptions.custom_exceptions import LoadTesterException
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle exceptions globally."""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+class ErrorHandlerMiddleware:
+    """Middleware to handle exceptions globally.
+
+    Plain ASGI middleware: unlike BaseHTTPMiddleware it adds no extra task or
+    stream wrapping per request; the app is simply awaited inside a try block.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and handle exceptions."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
-            
-        except LoadTesterException as e:
-            logger.warning(f"LoadTester exception: {e.error_type} - {e.message}")
-            return JSONResponse(
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # Headers already went out; an error body can no longer be sent
+            if response_started:
+                raise
+            response = self._error_response(e)
+            await response(scope, receive, send)
+
+    @staticmethod
+    def _error_response(e: Exception) -> Response:
+        """Build the JSON error response for an exception (call from an except block)."""
+        if isinstance(e, LoadTesterException):
+            logger.warning("LoadTester exception: %s - %s", e.error_type, e.message)
+            return ORJSONResponse(
                 status_code=e.status_code,
                 content={
                     "error": {
@@ -37,10 +62,10 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                     }
                 }
             )
-            
-        except ValueError as e:
-            logger.warning(f"Value error: {str(e)}")
-            return JSONResponse(
+
+        if isinstance(e, ValueError):
+            logger.warning("Value error: %s", e)
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "error": {
@@ -50,20 +75,18 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                     }
                 }
             )
-            
-        except Exception as e:
-            # Log the full traceback for debugging
-            logger.error(f"Unexpected error: {str(e)}")
-            logger.error(traceback.format_exc())
-            
-            # Return generic error response
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": {
-                        "type": "internal_server_error",
-                        "message": "An unexpected error occurred",
-                        "details": {}
-                    }
+
+        # Traceback comes from the active exception and is only rendered if emitted
+        logger.exception("Unexpected error: %s", e)
+
+        # Return generic error response
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": {
+                    "type": "internal_server_error",
+                    "message": "An unexpected error occurred",
+                    "details": {}
                 }
-            )
\ No newline at end of file
+            }
+        )
@@ -1,203 +1,170 @@
 """
 LoadTester Application Settings
-Configuration management using Pydantic Settings
+Configuration read once from the environment (and an optional .env file) at startup
 """
 
-from functools import lru_cache
-from pathlib import Path
-from typing import Optional
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from dotenv import dotenv_values
 
+# Process environment overrides .env; names are matched case-insensitively
+_ENV: Dict[str, str] = {
+    key.upper(): value
+    for source in (dotenv_values(".env", encoding="utf-8"), os.environ)
+    for key, value in source.items()
+    if value is not None
+}
 
-class Settings(BaseSettings):
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+
+
+def _env_str(name: str, default: str) -> str:
+    """Read a string setting."""
+    return _ENV.get(name, default)
+
+
+def _env_optional(name: str) -> Optional[str]:
+    """Read an optional string setting."""
+    return _ENV.get(name)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting."""
+    value = _ENV.get(name)
+    return default if value is None else int(value)
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting."""
+    value = _ENV.get(name)
+    return default if value is None else float(value)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting."""
+    value = _ENV.get(name)
+    return default if value is None else value.strip().lower() in _TRUE_VALUES
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings with environment variable support."""
-    
+
     # Application
-    app_name: str = Field(default="LoadTester", env="APP_NAME")
-    app_version: str = Field(default="0.0.1", env="APP_VERSION")
-    debug: bool = Field(default=False, env="DEBUG")
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    
+    app_name: str = _env_str("APP_NAME", "LoadTester")
+    app_version: str = _env_str("APP_VERSION", "0.0.1")
+    debug: bool = _env_bool("DEBUG", False)
+    log_level: str = _env_str("LOG_LEVEL", "INFO")
+
     # Database
-    database_url: str = Field(
-        default="sqlite:///data/loadtester.db", 
-        env="DATABASE_URL"
-    )
-    
+    database_url: str = _env_str("DATABASE_URL", "sqlite:///data/loadtester.db")
+
     # Load Testing Configuration
-    degradation_response_time_multiplier: float = Field(
-        default=5.0, 
-        env="DEGRADATION_RESPONSE_TIME_MULTIPLIER"
-    )
-    degradation_error_rate_threshold: float = Field(
-        default=0.5, 
-        env="DEGRADATION_ERROR_RATE_THRESHOLD"
-    )
-    default_test_duration: int = Field(
-        default=60, 
-        env="DEFAULT_TEST_DURATION"
-    )
-    max_concurrent_jobs: int = Field(
-        default=1, 
-        env="MAX_CONCURRENT_JOBS"
-    )
-    initial_user_percentage: float = Field(
-        default=0.1, 
-        env="INITIAL_USER_PERCENTAGE"
-    )
-    user_increment_percentage: float = Field(
-        default=0.5, 
-        env="USER_INCREMENT_PERCENTAGE"
-    )
-    stop_error_threshold: float = Field(
-        default=0.6, 
-        env="STOP_ERROR_THRESHOLD"
-    )
-    
+    degradation_response_time_multiplier: float = _env_float("DEGRADATION_RESPONSE_TIME_MULTIPLIER", 5.0)
+    degradation_error_rate_threshold: float = _env_float("DEGRADATION_ERROR_RATE_THRESHOLD", 0.5)
+    default_test_duration: int = _env_int("DEFAULT_TEST_DURATION", 60)
+    max_concurrent_jobs: int = _env_int("MAX_CONCURRENT_JOBS", 1)
+    max_queued_jobs: int = _env_int("MAX_QUEUED_JOBS", 10)
+    max_scenario_concurrency: int = _env_int("MAX_SCENARIO_CONCURRENCY", 1)
+    progress_flush_interval_ms: int = _env_int("PROGRESS_FLUSH_INTERVAL_MS", 500)
+    status_cache_ttl_ms: int = _env_int("STATUS_CACHE_TTL_MS", 1000)
+    initial_user_percentage: float = _env_float("INITIAL_USER_PERCENTAGE", 0.1)
+    user_increment_percentage: float = _env_float("USER_INCREMENT_PERCENTAGE", 0.5)
+    stop_error_threshold: float = _env_float("STOP_ERROR_THRESHOLD", 0.6)
+
     # File Configuration
-    max_file_size: int = Field(
-        default=10 * 1024 * 1024,  # 10MB
-        env="MAX_FILE_SIZE"
-    )
-    allowed_file_extensions: str = Field(
-        default=".csv,.json,.xlsx", 
-        env="ALLOWED_FILE_EXTENSIONS"
-    )
-    
+    max_file_size: int = _env_int("MAX_FILE_SIZE", 10 * 1024 * 1024)  # 10MB
+    allowed_file_extensions: str = _env_str("ALLOWED_FILE_EXTENSIONS", ".csv,.json,.xlsx")
+
     # Paths
-    k6_scripts_path: str = Field(
-        default="/app/k6_scripts", 
-        env="K6_SCRIPTS_PATH"
-    )
-    k6_results_path: str = Field(
-        default="/app/k6_results", 
-        env="K6_RESULTS_PATH"
-    )
-    upload_path: str = Field(
-        default="/app/shared/data/uploads", 
-        env="UPLOAD_PATH"
-    )
-    reports_path: str = Field(
-        default="/app/shared/reports/generated", 
-        env="REPORTS_PATH"
-    )
-    mocked_data_path: str = Field(
-        default="/app/shared/data/mocked", 
-        env="MOCKED_DATA_PATH"
-    )
-    
+    k6_scripts_path: str = _env_str("K6_SCRIPTS_PATH", "/app/k6_scripts")
+    k6_results_path: str = _env_str("K6_RESULTS_PATH", "/app/k6_results")
+    upload_path: str = _env_str("UPLOAD_PATH", "/app/shared/data/uploads")
+    reports_path: str = _env_str("REPORTS_PATH", "/app/shared/reports/generated")
+    mocked_data_path: str = _env_str("MOCKED_DATA_PATH", "/app/shared/data/mocked")
+
     # AI Services API Keys
-    google_api_key: Optional[str] = Field(default=None, env="GOOGLE_API_KEY")
-    anthropic_api_key: Optional[str] = Field(default=None, env="ANTHROPIC_API_KEY")
-    openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
+    google_api_key: Optional[str] = _env_optional("GOOGLE_API_KEY")
+    anthropic_api_key: Optional[str] = _env_optional("ANTHROPIC_API_KEY")
+    openai_api_key: Optional[str] = _env_optional("OPENAI_API_KEY")
 
     # OpenAPI Parsing Configuration
-    use_local_openapi_parsing: bool = Field(
-        default=False,
-        env="USE_LOCAL_OPENAPI_PARSING"
-    )
-    
+    use_local_openapi_parsing: bool = _env_bool("USE_LOCAL_OPENAPI_PARSING", False)
+
     # Security
-    secret_key: str = Field(
-        default="your-secret-key-change-this-in-production", 
-        env="SECRET_KEY"
-    )
-    algorithm: str = Field(default="HS256", env="ALGORITHM")
-    access_token_expire_minutes: int = Field(
-        default=30, 
-        env="ACCESS_TOKEN_EXPIRE_MINUTES"
-    )
-    
+    secret_key: str = _env_str("SECRET_KEY", "your-secret-key-change-this-in-production")
+    algorithm: str = _env_str("ALGORITHM", "HS256")
+    access_token_expire_minutes: int = _env_int("ACCESS_TOKEN_EXPIRE_MINUTES", 30)
+
     # External Services
-    callback_timeout: int = Field(default=30, env="CALLBACK_TIMEOUT")
-    callback_retry_attempts: int = Field(
-        default=3, 
-        env="CALLBACK_RETRY_ATTEMPTS"
-    )
-    
+    callback_timeout: int = _env_int("CALLBACK_TIMEOUT", 30)
+    callback_retry_attempts: int = _env_int("CALLBACK_RETRY_ATTEMPTS", 3)
+
     # Performance
-    worker_processes: int = Field(default=1, env="WORKER_PROCESSES")
-    worker_connections: int = Field(default=1000, env="WORKER_CONNECTIONS")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-    
-    @validator("log_level")
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level."""
+    worker_processes: int = _env_int("WORKER_PROCESSES", 1)
+    worker_connections: int = _env_int("WORKER_CONNECTIONS", 1000)
+
+    # Derived values, computed once in __post_init__
+    allowed_file_extensions_list: List[str] = field(init=False, repr=False, compare=False)
+    has_ai_service: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate settings and compute derived values."""
         allowed_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in allowed_levels:
+        if self.log_level.upper() not in allowed_levels:
             raise ValueError(f"Log level must be one of: {allowed_levels}")
-        return v.upper()
-    
-    @validator("degradation_response_time_multiplier")
-    def validate_response_time_multiplier(cls, v: float) -> float:
-        """Validate response time multiplier."""
-        if v <= 1.0:
+        if self.degradation_response_time_multiplier <= 1.0:
             raise ValueError("Response time multiplier must be greater than 1.0")
-        return v
-    
-    @validator("degradation_error_rate_threshold")
-    def validate_error_rate_threshold(cls, v: float) -> float:
-        """Validate error rate threshold."""
-        if not 0.0 <= v <= 1.0:
+        if not 0.0 <= self.degradation_error_rate_threshold <= 1.0:
             raise ValueError("Error rate threshold must be between 0.0 and 1.0")
-        return v
-    
-    @validator("initial_user_percentage")
-    def validate_initial_user_percentage(cls, v: float) -> float:
-        """Validate initial user percentage."""
-        if not 0.0 < v <= 1.0:
+        if not 0.0 < self.initial_user_percentage <= 1.0:
             raise ValueError("Initial user percentage must be between 0.0 and 1.0")
-        return v
-    
-    @validator("user_increment_percentage")
-    def validate_user_increment_percentage(cls, v: float) -> float:
-        """Validate user increment percentage."""
-        if v <= 0.0:
+        if self.user_increment_percentage <= 0.0:
             raise ValueError("User increment percentage must be greater than 0.0")
-        return v
-    
-    @validator("stop_error_threshold")
-    def validate_stop_error_threshold(cls, v: float) -> float:
-        """Validate stop error threshold."""
-        if not 0.0 <= v <= 1.0:
+        if not 0.0 <= self.stop_error_threshold <= 1.0:
             raise ValueError("Stop error threshold must be between 0.0 and 1.0")
-        return v
-    
-    @property
-    def allowed_file_extensions_list(self) -> list[str]:
-        """Get allowed file extensions as a list."""
-        return [ext.strip() for ext in self.allowed_file_extensions.split(",")]
-    
-    @property
-    def has_ai_service(self) -> bool:
-        """Check if at least one AI service is configured."""
-        return any([
-            self.google_api_key,
-            self.anthropic_api_key,
-            self.openai_api_key,
-        ])
-    
+
+        # Frozen dataclass: normalized and derived fields are set through object.__setattr__
+        object.__setattr__(self, "log_level", self.log_level.upper())
+        object.__setattr__(
+            self,
+            "allowed_file_extensions_list",
+            [ext.strip() for ext in self.allowed_file_extensions.split(",")],
+        )
+        object.__setattr__(
+            self,
+            "has_ai_service",
+            any([self.google_api_key, self.anthropic_api_key, self.openai_api_key]),
+        )
+
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
-        directories = [
-            self.k6_scripts_path,
-            self.k6_results_path,
-            self.upload_path,
-            self.reports_path,
-            self.mocked_data_path,
-        ]
-        
+        # Deduplicated up front; a single mkdir covers the common case of an existing parent
+        directories = {
+            os.path.abspath(directory)
+            for directory in (
+                self.k6_scripts_path,
+                self.k6_results_path,
+                self.upload_path,
+                self.reports_path,
+                self.mocked_data_path,
+            )
+        }
+
         for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                os.makedirs(directory, exist_ok=True)
+
+
+settings = Settings()
 
 
-@lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
\ No newline at end of file
+    """Get the settings instance loaded at startup."""
+    return settings
@@ -49,17 +49,15 @@ class ResourceNotFoundError(LoadTesterException):
         resource_type: Optional[str] = None,
         resource_id: Optional[str] = None
     ):
-        details = {}
-        if resource_type:
-            details["resource_type"] = resource_type
-        if resource_id:
-            details["resource_id"] = resource_id
-        
         super().__init__(
             message=message,
             error_type="resource_not_found",
             status_code=404,
-            details=details
+            details={
+                key: value
+                for key, value in (("resource_type", resource_type), ("resource_id", resource_id))
+                if value
+            }
         )
 
 
@@ -72,15 +70,11 @@ class BusinessRuleViolationError(LoadTesterException):
         rule_name: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        error_details = details or {}
-        if rule_name:
-            error_details["rule_name"] = rule_name
-        
         super().__init__(
             message=message,
             error_type="business_rule_violation",
             status_code=422,
-            details=error_details
+            details={**(details or {}), "rule_name": rule_name} if rule_name else details
         )
 
 
@@ -94,19 +88,19 @@ class DegradationDetectedError(LoadTesterException):
         threshold_value: Optional[float] = None,
         actual_value: Optional[float] = None
     ):
-        details = {}
-        if degradation_type:
-            details["degradation_type"] = degradation_type
-        if threshold_value is not None:
-            details["threshold_value"] = threshold_value
-        if actual_value is not None:
-            details["actual_value"] = actual_value
-        
         super().__init__(
             message=message,
             error_type="degradation_detected",
             status_code=422,
-            details=details
+            details={
+                key: value
+                for key, value in (
+                    ("degradation_type", degradation_type or None),
+                    ("threshold_value", threshold_value),
+                    ("actual_value", actual_value),
+                )
+                if value is not None
+            }
         )
 
 
@@ -120,17 +114,17 @@ class ValidationError(LoadTesterException):
         field_value: Optional[Any] = None,
         validation_rule: Optional[str] = None
     ):
-        details = {}
-        if field_name:
-            details["field_name"] = field_name
-        if field_value is not None:
-            details["field_value"] = str(field_value)
-        if validation_rule:
-            details["validation_rule"] = validation_rule
-        
         super().__init__(
             message=message,
             error_type="validation_error",
             status_code=400,
-            details=details
+            details={
+                key: value
+                for key, value in (
+                    ("field_name", field_name or None),
+                    ("field_value", None if field_value is None else str(field_value)),
+                    ("validation_rule", validation_rule or None),
+                )
+                if value is not None
+            }
         )
\ No newline at end of file
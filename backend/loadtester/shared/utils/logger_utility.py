@@ -7,37 +7,64 @@ import logging
 import sys
 from typing import Optional
 
+import orjson
 import structlog
 
 
-def setup_logging(log_level: str = "INFO") -> None:
-    """Setup structured logging configuration."""
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSONRenderer serializer: orjson encoding, str output for PrintLogger."""
+    return orjson.dumps(obj, default=str).decode()
+
+
+def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
+    """Setup structured logging: JSON lines when json_logs, colored console otherwise."""
+    level = getattr(logging, log_level.upper())
+    
+    # Enrichment shared by structlog events and records from stdlib loggers
+    shared_processors = [
+        structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="ISO"),
+    ]
+    # Call-site lookup walks frames on every event; only worth it when debugging
+    if level <= logging.DEBUG:
+        shared_processors.append(structlog.processors.CallsiteParameterAdder())
     
-    # Configure structlog
+    if json_logs:
+        renderers = [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ]
+    else:
+        renderers = [structlog.dev.ConsoleRenderer(colors=True)]
+    
+    # Configure structlog: events are handed to stdlib and rendered once by the formatter
     structlog.configure(
         processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
+            *shared_processors,
             structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="ISO"),
-            structlog.dev.ConsoleRenderer(colors=True)
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper())
-        ),
-        logger_factory=structlog.PrintLoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=False,
     )
     
-    # Configure standard logging
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+    # Configure standard logging: a single root handler formats every record exactly once
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=shared_processors,
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                *renderers,
+            ],
+        )
     )
+    root_logger = logging.getLogger()
+    root_logger.handlers = [handler]
+    root_logger.setLevel(level)
     
     # Set specific loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -0,0 +1,119 @@
+"""
+Database Upgrade Tests
+create_tables must bring a database created by the baseline models up to date in place
+"""
+
+import asyncio
+import sqlite3
+
+from sqlalchemy import inspect
+
+# Test* classes are imported under other names so pytest does not try to collect them
+from loadtester.domain.entities.domain_entities import API, Endpoint, ExecutionStatus, Job, JobStatus
+from loadtester.domain.entities.domain_entities import TestExecution as Execution
+from loadtester.domain.entities.domain_entities import TestScenario as Scenario
+from loadtester.infrastructure.database.database_connection import DatabaseManager
+from loadtester.infrastructure.repositories.api_repository import APIRepository
+from loadtester.infrastructure.repositories.endpoint_repository import EndpointRepository
+from loadtester.infrastructure.repositories.job_repository import JobRepository
+from loadtester.infrastructure.repositories.test_execution_repository import (
+    TestExecutionRepository as ExecutionRepository
+)
+from loadtester.infrastructure.repositories.test_scenario_repository import (
+    TestScenarioRepository as ScenarioRepository
+)
+
+# Tables as the baseline models created them, before job_id/test_data_id and the new indexes
+_BASELINE_DDL = (
+    """CREATE TABLE apis (
+        api_id INTEGER NOT NULL, api_name VARCHAR(200) NOT NULL, base_url VARCHAR(500) NOT NULL,
+        description TEXT, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+        active BOOLEAN NOT NULL, PRIMARY KEY (api_id)
+    )""",
+    """CREATE TABLE jobs (
+        job_id VARCHAR(36) NOT NULL, job_type VARCHAR(50) NOT NULL, status VARCHAR(20) NOT NULL,
+        progress_percentage FLOAT NOT NULL, result_data TEXT, error_message TEXT,
+        callback_url VARCHAR(500), callback_sent BOOLEAN NOT NULL, created_at DATETIME NOT NULL,
+        started_at DATETIME, finished_at DATETIME, created_by VARCHAR(100) NOT NULL,
+        PRIMARY KEY (job_id)
+    )""",
+    """CREATE TABLE endpoints (
+        endpoint_id INTEGER NOT NULL, api_id INTEGER NOT NULL, endpoint_name VARCHAR(200) NOT NULL,
+        http_method VARCHAR(10) NOT NULL, endpoint_path VARCHAR(500) NOT NULL, description TEXT,
+        expected_volumetry INTEGER, expected_concurrent_users INTEGER, auth_type VARCHAR(50),
+        auth_config TEXT, headers_config TEXT, payload_template TEXT, schema TEXT,
+        timeout_ms INTEGER NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+        active BOOLEAN NOT NULL, PRIMARY KEY (endpoint_id),
+        FOREIGN KEY(api_id) REFERENCES apis (api_id)
+    )""",
+    """CREATE TABLE test_scenarios (
+        scenario_id INTEGER NOT NULL, endpoint_id INTEGER NOT NULL, scenario_name VARCHAR(200) NOT NULL,
+        description TEXT, target_volumetry INTEGER NOT NULL, concurrent_users INTEGER NOT NULL,
+        duration_seconds INTEGER NOT NULL, ramp_up_seconds INTEGER NOT NULL,
+        ramp_down_seconds INTEGER NOT NULL, k6_options TEXT, test_data TEXT,
+        created_at DATETIME NOT NULL, created_by VARCHAR(100) NOT NULL, active BOOLEAN NOT NULL,
+        PRIMARY KEY (scenario_id), FOREIGN KEY(endpoint_id) REFERENCES endpoints (endpoint_id)
+    )""",
+    """CREATE TABLE test_executions (
+        execution_id INTEGER NOT NULL, scenario_id INTEGER NOT NULL, execution_name VARCHAR(200) NOT NULL,
+        start_time DATETIME, end_time DATETIME, status VARCHAR(20) NOT NULL,
+        actual_duration_seconds INTEGER, k6_script_used TEXT, execution_logs TEXT,
+        executed_by VARCHAR(100) NOT NULL, PRIMARY KEY (execution_id),
+        FOREIGN KEY(scenario_id) REFERENCES test_scenarios (scenario_id)
+    )""",
+)
+
+
+def _create_baseline_database(path: str) -> None:
+    """Create the baseline tables with the sqlite3 driver, as an old install would have them."""
+    connection = sqlite3.connect(path)
+    try:
+        for ddl in _BASELINE_DDL:
+            connection.execute(ddl)
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def test_create_tables_upgrades_baseline_schema(tmp_path):
+    """After create_tables on a baseline database, an execution can be written with its job."""
+    database_path = str(tmp_path / "loadtester.db")
+    _create_baseline_database(database_path)
+
+    async def scenario():
+        db_manager = DatabaseManager(f"sqlite:///{database_path}")
+        try:
+            await db_manager.create_tables()
+            # Running it again on an up-to-date database is a no-op
+            await db_manager.create_tables()
+
+            async with db_manager.async_session_factory() as session:
+                api = await APIRepository(session).create(API(api_name="Demo", base_url="http://demo"))
+                endpoint = (await EndpointRepository(session).create_many([
+                    Endpoint(api_id=api.api_id, endpoint_name="GET /a", http_method="GET", endpoint_path="/a")
+                ]))[0]
+                scenario = await ScenarioRepository(session).create(Scenario(
+                    endpoint_id=endpoint.endpoint_id, scenario_name="warm-up",
+                    target_volumetry=1, concurrent_users=1, duration_seconds=1,
+                ))
+                job = await JobRepository(session).create(Job.new(job_type="load_test", status=JobStatus.RUNNING))
+                execution = await ExecutionRepository(session).create(Execution(
+                    scenario_id=scenario.scenario_id, job_id=job.job_id,
+                    execution_name="warm-up", status=ExecutionStatus.RUNNING,
+                ))
+                executions = await ExecutionRepository(session).get_by_job_id(job.job_id)
+
+            async with db_manager.engine.connect() as connection:
+                indexes = await connection.run_sync(lambda sync_connection: {
+                    table: {index["name"] for index in inspect(sync_connection).get_indexes(table)}
+                    for table in ("jobs", "test_executions")
+                })
+            return execution, executions, indexes
+        finally:
+            await db_manager.close()
+
+    execution, executions, indexes = asyncio.run(scenario())
+
+    assert [e.execution_id for e in executions] == [execution.execution_id]
+    assert {"ix_exec_status_start", "ix_test_executions_job_id"} <= indexes["test_executions"]
+    assert {"ix_jobs_pending", "ix_jobs_running", "ix_jobs_callback", "ix_jobs_cleanup"} <= indexes["jobs"]
@@ -0,0 +1,66 @@
+"""
+Unit of Work Tests
+Transactions opened by a unit of work must survive other sessions on the same database
+"""
+
+import asyncio
+
+from sqlalchemy import func, select
+
+from loadtester.domain.entities.domain_entities import API
+from loadtester.infrastructure.database.database_connection import DatabaseManager
+from loadtester.infrastructure.database.database_models import APIModel
+from loadtester.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from loadtester.infrastructure.repositories.api_repository import APIRepository
+from loadtester.infrastructure.repositories.job_repository import JobRepository
+
+
+async def _count_apis(db_manager: DatabaseManager) -> int:
+    """Count API rows from a fresh session."""
+    async with db_manager.async_session_factory() as session:
+        return (await session.execute(select(func.count()).select_from(APIModel))).scalar_one()
+
+
+async def _create_api_with_interleaved_session(db_manager: DatabaseManager) -> None:
+    """Create an API inside a unit of work while another session reads and closes."""
+    async with db_manager.async_session_factory() as session:
+        async with SQLAlchemyUnitOfWork(session).begin():
+            await APIRepository(session).create(API(api_name="Demo", base_url="http://demo"))
+
+            # e.g. a status poll served while the job is still parsing
+            async with db_manager.async_session_factory() as other_session:
+                await JobRepository(other_session).get_by_id("missing")
+
+
+def test_unit_of_work_survives_interleaved_session_close(tmp_path):
+    """Closing another session must not roll back the unit of work's flushed rows."""
+    async def scenario() -> int:
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'loadtester.db'}")
+        try:
+            await db_manager.create_tables()
+            await _create_api_with_interleaved_session(db_manager)
+            return await _count_apis(db_manager)
+        finally:
+            await db_manager.close()
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_unit_of_work_rolls_back_on_error(tmp_path):
+    """An exception inside the block discards every write made in it."""
+    async def scenario() -> int:
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'loadtester.db'}")
+        try:
+            await db_manager.create_tables()
+            async with db_manager.async_session_factory() as session:
+                try:
+                    async with SQLAlchemyUnitOfWork(session).begin():
+                        await APIRepository(session).create(API(api_name="Demo", base_url="http://demo"))
+                        raise RuntimeError("boom")
+                except RuntimeError:
+                    pass
+            return await _count_apis(db_manager)
+        finally:
+            await db_manager.close()
+
+    assert asyncio.run(scenario()) == 0